@@ -0,0 +1,35 @@
+"""
+Database helpers shared by the apps.
+"""
+
+from django.db import connections
+
+
+def delete_rows(queryset):
+    """
+    Delete the rows matched by ``queryset`` with a single
+    ``DELETE ... WHERE pk IN (SELECT ...)`` statement and return how many
+    were deleted.
+
+    Unlike ``QuerySet.delete()`` this neither loads the rows nor runs the
+    deletion collector: no ``pre_delete``/``post_delete`` signals are sent
+    and ``on_delete`` rules of related models are not applied. Callers must
+    take care of related rows and of the work those signals would do.
+    """
+    model = queryset.model
+    using = queryset.db
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    pk_column = quote(model._meta.pk.column)
+    if not queryset.query.is_sliced:
+        # Ordering only matters for which rows a slice selects.
+        queryset = queryset.order_by()
+    subquery = queryset.values("pk").query
+    select_sql, params = subquery.get_compiler(using).as_sql()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {quote(model._meta.db_table)} "
+            f"WHERE {pk_column} IN ({select_sql})",
+            params,
+        )
+        return cursor.rowcount
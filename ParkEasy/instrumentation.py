@@ -0,0 +1,210 @@
+"""
+Per-request SQL and latency instrumentation.
+
+InstrumentationMiddleware records, for every request, the number of SQL
+queries, the total database time, the template render time and the time
+spent in context processors, tagged with the URL name of the view. Each
+request is logged as one structured (JSON) line on the
+"parkeasy.instrumentation" logger and added to an in-process rolling window
+that the staff-only debug panel summarises as percentiles.
+
+Template and context processor timings are collected by the
+InstrumentedDjangoTemplates backend configured in settings.TEMPLATES.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connection
+from django.template.backends.django import DjangoTemplates, Template, reraise
+from django.template.exceptions import TemplateDoesNotExist
+
+logger = logging.getLogger("parkeasy.instrumentation")
+
+_current_metrics = ContextVar("parkeasy_request_metrics", default=None)
+
+METRIC_NAMES = ("queries", "db_ms", "template_ms", "context_processor_ms", "total_ms")
+
+
+class RequestMetrics:
+    """Counters for a single request."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_ms = 0.0
+        self.template_ms = 0.0
+        self.context_processor_ms = 0.0
+        self.total_ms = 0.0
+
+    def record_query(self, execute, sql, params, many, context):
+        """connection.execute_wrapper hook timing every executed statement."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_ms += (time.perf_counter() - start) * 1000
+
+    def as_dict(self):
+        return {
+            "queries": self.queries,
+            "db_ms": round(self.db_ms, 2),
+            "template_ms": round(self.template_ms, 2),
+            "context_processor_ms": round(self.context_processor_ms, 2),
+            "total_ms": round(self.total_ms, 2),
+        }
+
+
+def _percentile(sorted_values, fraction):
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class RollingSummary:
+    """Keeps the last ``window`` requests per URL name for percentile reports."""
+
+    def __init__(self, window):
+        self.window = window
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+        self._lock = threading.Lock()
+
+    def add(self, url_name, metrics):
+        with self._lock:
+            self._samples[url_name].append(metrics.as_dict())
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+    def snapshot(self):
+        """Return {url_name: {"count": n, metric: {"p50", "p95", "max"}}}."""
+        with self._lock:
+            samples = {name: list(values) for name, values in self._samples.items()}
+
+        summary = {}
+        for url_name, values in samples.items():
+            entry = {"count": len(values)}
+            for metric in METRIC_NAMES:
+                ordered = sorted(value[metric] for value in values)
+                entry[metric] = {
+                    "p50": _percentile(ordered, 0.5),
+                    "p95": _percentile(ordered, 0.95),
+                    "max": ordered[-1],
+                }
+            summary[url_name] = entry
+        return summary
+
+
+request_summary = RollingSummary(getattr(settings, "INSTRUMENTATION_WINDOW", 500))
+
+
+def current_metrics():
+    """The metrics of the request being processed, or None outside a request."""
+    return _current_metrics.get()
+
+
+class InstrumentationMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        token = _current_metrics.set(metrics)
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(metrics.record_query):
+                response = self.get_response(request)
+        finally:
+            metrics.total_ms = (time.perf_counter() - start) * 1000
+            _current_metrics.reset(token)
+
+        # A streaming body runs its queries while the server iterates it, so
+        # the request is recorded once the body is exhausted or closed. File
+        # downloads keep their file wrapper (sendfile) and are recorded now:
+        # reading a file runs no queries.
+        if response.streaming and not getattr(response, "file_to_stream", None):
+            response.streaming_content = self._stream(
+                response.streaming_content, request, response, metrics, start
+            )
+        else:
+            self._record(request, response, metrics)
+        return response
+
+    def _stream(self, content, request, response, metrics, start):
+        try:
+            with connection.execute_wrapper(metrics.record_query):
+                yield from content
+        finally:
+            metrics.total_ms = (time.perf_counter() - start) * 1000
+            self._record(request, response, metrics)
+
+    def _record(self, request, response, metrics):
+        resolver_match = getattr(request, "resolver_match", None)
+        url_name = (resolver_match and resolver_match.url_name) or "unresolved"
+        request_summary.add(url_name, metrics)
+
+        record = {
+            "url_name": url_name,
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            **metrics.as_dict(),
+        }
+        level = logging.INFO
+        if metrics.queries > getattr(settings, "INSTRUMENTATION_QUERY_WARNING", 100):
+            level = logging.WARNING
+        logger.log(level, json.dumps(record))
+
+
+def _timed_context_processor(processor):
+    def wrapper(request):
+        metrics = current_metrics()
+        if metrics is None:
+            return processor(request)
+        start = time.perf_counter()
+        try:
+            return processor(request)
+        finally:
+            metrics.context_processor_ms += (time.perf_counter() - start) * 1000
+
+    wrapper.__name__ = getattr(processor, "__name__", "context_processor")
+    wrapper.__wrapped__ = processor
+    return wrapper
+
+
+class InstrumentedTemplate(Template):
+    def render(self, context=None, request=None):
+        metrics = current_metrics()
+        if metrics is None:
+            return super().render(context, request)
+        start = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            # Includes the context processors, which run during rendering.
+            metrics.template_ms += (time.perf_counter() - start) * 1000
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """DjangoTemplates backend that reports render times to the middleware."""
+
+    def __init__(self, params):
+        super().__init__(params)
+        self.engine.template_context_processors = tuple(
+            _timed_context_processor(processor)
+            for processor in self.engine.template_context_processors
+        )
+
+    def from_string(self, template_code):
+        return InstrumentedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return InstrumentedTemplate(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
@@ -0,0 +1,90 @@
+"""
+Keyset ("seek") pagination.
+
+Instead of OFFSET, each page is fetched with a WHERE clause that starts just
+after the last row of the previous page, so the cost of a page stays the same
+however deep the user scrolls. The position is handed to the client as a
+signed cursor holding the ordering values of that last row.
+
+The ordering must be total (end it with the primary key) and made of
+non-nullable fields.
+"""
+
+import datetime as dt
+
+from django.core import signing
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+CURSOR_SALT = "parkeasy.keyset_cursor"
+
+
+def _field_names(ordering):
+    return [field.lstrip("-") for field in ordering]
+
+
+def encode_cursor(obj, ordering, salt=CURSOR_SALT):
+    """Signed token pointing just past ``obj`` in ``ordering``."""
+    values = []
+    for name in _field_names(ordering):
+        value = getattr(obj, name)
+        if isinstance(value, (dt.datetime, dt.date, dt.time)):
+            value = value.isoformat()
+        values.append(value)
+    return signing.dumps(values, salt=salt)
+
+
+def decode_cursor(token, model, ordering, salt=CURSOR_SALT):
+    """
+    Ordering values stored in ``token``, converted back to Python values, or
+    None if there is no valid cursor.
+    """
+    if not token:
+        return None
+    try:
+        values = signing.loads(token, salt=salt)
+    except signing.BadSignature:
+        return None
+    names = _field_names(ordering)
+    if not isinstance(values, list) or len(values) != len(names):
+        return None
+    try:
+        return [
+            model._meta.get_field(name).to_python(value)
+            for name, value in zip(names, values)
+        ]
+    except ValidationError:
+        return None
+
+
+def after_position(ordering, values):
+    """
+    Q matching the rows that come after ``values`` in ``ordering``, i.e.
+    ``(a, b, c) > (x, y, z)`` expanded so each field keeps its direction.
+    """
+    condition = Q()
+    equal = Q()
+    for field, value in zip(ordering, values):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        condition |= equal & Q(**{f"{name}__{lookup}": value})
+        equal &= Q(**{name: value})
+    return condition
+
+
+def keyset_page(queryset, ordering, token, per_page, salt=CURSOR_SALT):
+    """
+    Return ``(items, next_cursor)`` for the page of ``queryset`` that starts
+    after ``token`` (the first page if the token is missing or invalid).
+    ``next_cursor`` is None on the last page.
+    """
+    queryset = queryset.order_by(*ordering)
+    values = decode_cursor(token, queryset.model, ordering, salt)
+    if values is not None:
+        queryset = queryset.filter(after_position(ordering, values))
+    # Fetch one extra row to know whether there is a next page.
+    items = list(queryset[: per_page + 1])
+    if len(items) <= per_page:
+        return items, None
+    items = items[:per_page]
+    return items, encode_cursor(items[-1], ordering, salt)
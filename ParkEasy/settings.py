@@ -55,6 +55,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so queries made by the other middleware (session and user
+    # loading, ...) are counted too.
+    "ParkEasy.instrumentation.InstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -70,7 +73,9 @@ ROOT_URLCONF = "ParkEasy.urls"
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        # DjangoTemplates plus render/context processor timings for the
+        # instrumentation middleware.
+        "BACKEND": "ParkEasy.instrumentation.InstrumentedDjangoTemplates",
         "DIRS": [BASE_DIR / "templates"],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -118,6 +123,59 @@ else:
     }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+# Listing search results, cursors and the invalidation version are shared by
+# every worker process through the listing_search_cache database table
+# (create it with `manage.py createcachetable`). Entries expire after
+# LISTING_SEARCH_CACHE_TIMEOUT seconds, and a share of them is evicted once
+# the table holds more than MAX_ENTRIES. Listing and slot writes invalidate
+# every cached search at once by bumping listings.search_cache.VERSION_KEY.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "listing_search": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "listing_search_cache",
+        "OPTIONS": {"MAX_ENTRIES": 500},
+    },
+}
+
+LISTING_SEARCH_CACHE_TIMEOUT = 60
+
+
+# Request instrumentation (ParkEasy/instrumentation.py)
+# Every request is logged as one JSON line on the "parkeasy.instrumentation"
+# logger at INFO; requests above INSTRUMENTATION_QUERY_WARNING queries log a
+# warning instead. Set the INSTRUMENTATION_LOG_LEVEL environment variable to
+# WARNING to keep only those. The test runner (TEST_RUNNER) silences the
+# logger unless INSTRUMENTATION_LOG_LEVEL is set.
+INSTRUMENTATION_WINDOW = 500  # requests kept per URL name for percentiles
+INSTRUMENTATION_QUERY_WARNING = int(
+    os.environ.get("INSTRUMENTATION_QUERY_WARNING", 100)
+)
+INSTRUMENTATION_PANEL = DEBUG  # serve the staff-only summary endpoint
+
+TEST_RUNNER = "ParkEasy.test_runner.ParkEasyTestRunner"
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "parkeasy.instrumentation": {
+            "handlers": ["console"],
+            "level": os.environ.get("INSTRUMENTATION_LOG_LEVEL", "INFO"),
+            "propagate": False,
+        },
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -174,3 +232,47 @@ DEFAULT_FROM_EMAIL = "smi6079@nyu.edu"
 # Save and access verification files
 MEDIA_URL = "/verification_documents/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "verification_documents")
+
+# Verification documents are private: they are stored through the
+# "verification" storage and only sent to their owner and to staff by the
+# verification_document view (see accounts/storage.py).
+# Seconds a signed document URL stays valid when documents are kept in S3.
+VERIFICATION_URL_EXPIRY = 300
+if "VERIFICATION_S3_BUCKET" in os.environ:
+    VERIFICATION_STORAGE = {
+        "BACKEND": "storages.backends.s3boto3.S3Boto3Storage",
+        "OPTIONS": {
+            "bucket_name": os.environ["VERIFICATION_S3_BUCKET"],
+            # Set to use another S3-compatible service, e.g. a local MinIO.
+            "endpoint_url": os.environ.get("VERIFICATION_S3_ENDPOINT_URL"),
+            "region_name": os.environ.get("VERIFICATION_S3_REGION"),
+            "default_acl": "private",
+            "querystring_auth": True,
+            "querystring_expire": VERIFICATION_URL_EXPIRY,
+            "signature_version": "s3v4",
+            "file_overwrite": False,
+        },
+    }
+else:
+    # Files under MEDIA_ROOT.
+    VERIFICATION_STORAGE = {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    }
+
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    "verification": VERIFICATION_STORAGE,
+}
+
+# How the web server sends local documents once the view has checked
+# permissions: "x-accel-redirect" (nginx), "x-sendfile" (Apache, lighttpd),
+# or unset to stream them from Django (development only).
+VERIFICATION_SENDFILE = os.environ.get("VERIFICATION_SENDFILE")
+# Internal nginx location aliased to MEDIA_ROOT, used with X-Accel-Redirect.
+VERIFICATION_ACCEL_PREFIX = "/protected/"
+
+# Retention: read notifications and messages older than this many days are
+# moved to the archive tables by `manage.py archive_inbox`.
+NOTIFICATION_RETENTION_DAYS = 90
+MESSAGE_RETENTION_DAYS = 365
@@ -0,0 +1,18 @@
+import logging
+import os
+
+from django.test.runner import DiscoverRunner
+
+
+class ParkEasyTestRunner(DiscoverRunner):
+    """
+    DiscoverRunner that silences the per-request instrumentation log, which
+    would otherwise print a line for every test client request. Tests that
+    check the log use assertLogs, which lowers the level while it is active.
+    Set INSTRUMENTATION_LOG_LEVEL to keep the log in test runs.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        if "INSTRUMENTATION_LOG_LEVEL" not in os.environ:
+            logging.getLogger("parkeasy.instrumentation").setLevel(logging.ERROR)
@@ -0,0 +1,126 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models.signals import post_delete
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import Notification
+
+from .db import delete_rows
+from .instrumentation import RequestMetrics, RollingSummary, request_summary
+
+
+class RollingSummaryTest(TestCase):
+    def test_snapshot_percentiles(self):
+        summary = RollingSummary(window=3)
+        for queries in (1, 5, 2, 9):
+            metrics = RequestMetrics()
+            metrics.queries = queries
+            summary.add("view_listings", metrics)
+
+        entry = summary.snapshot()["view_listings"]
+        # Only the last three requests are kept.
+        self.assertEqual(entry["count"], 3)
+        self.assertEqual(entry["queries"]["p50"], 5)
+        self.assertEqual(entry["queries"]["max"], 9)
+
+
+@override_settings(INSTRUMENTATION_PANEL=True)
+class InstrumentationMiddlewareTest(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.staff = User.objects.create_user(
+            username="staff", password="pass", is_staff=True
+        )
+        request_summary.clear()
+
+    def test_request_is_recorded_by_url_name(self):
+        self.client.login(username="staff", password="pass")
+        with self.assertLogs("parkeasy.instrumentation", level="INFO") as logs:
+            self.client.get(reverse("view_listings"))
+
+        self.assertIn('"url_name": "view_listings"', logs.output[0])
+        entry = request_summary.snapshot()["view_listings"]
+        self.assertEqual(entry["count"], 1)
+        self.assertGreater(entry["queries"]["max"], 0)
+        self.assertGreater(entry["template_ms"]["max"], 0)
+        self.assertGreater(entry["context_processor_ms"]["max"], 0)
+
+    def test_counts_queries_made_by_other_middleware(self):
+        # Logging in saves the new session in SessionMiddleware, after the
+        # view has returned.
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(
+                reverse("login"), {"username": "staff", "password": "pass"}
+            )
+        entry = request_summary.snapshot()["login"]
+        self.assertEqual(entry["queries"]["max"], len(queries))
+
+    def test_streaming_response_is_recorded_after_its_body(self):
+        self.client.login(username="staff", password="pass")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("export_host_bookings"))
+            self.assertNotIn("export_host_bookings", request_summary.snapshot())
+            with self.assertLogs("parkeasy.instrumentation", level="INFO") as logs:
+                b"".join(response.streaming_content)
+
+        self.assertIn('"url_name": "export_host_bookings"', logs.output[0])
+        # The export queries run while the body is iterated.
+        entry = request_summary.snapshot()["export_host_bookings"]
+        self.assertEqual(entry["queries"]["max"], len(queries))
+
+    def test_query_warning_threshold(self):
+        with override_settings(INSTRUMENTATION_QUERY_WARNING=1000):
+            with self.assertLogs("parkeasy.instrumentation", level="INFO") as logs:
+                self.client.get(reverse("view_listings"))
+        self.assertEqual(logs.records[0].levelname, "INFO")
+        with override_settings(INSTRUMENTATION_QUERY_WARNING=0):
+            with self.assertLogs("parkeasy.instrumentation", level="INFO") as logs:
+                self.client.get(reverse("view_listings"))
+        self.assertEqual(logs.records[0].levelname, "WARNING")
+
+    def test_panel_requires_staff(self):
+        User.objects.create_user(username="regular", password="pass")
+        self.client.login(username="regular", password="pass")
+        response = self.client.get(reverse("instrumentation_summary"))
+        self.assertEqual(response.status_code, 403)
+
+    def test_panel_returns_summary(self):
+        self.client.login(username="staff", password="pass")
+        self.client.get(reverse("view_listings"))
+        response = self.client.get(reverse("instrumentation_summary"))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("view_listings", response.json()["views"])
+
+    @override_settings(INSTRUMENTATION_PANEL=False)
+    def test_panel_disabled(self):
+        self.client.login(username="staff", password="pass")
+        response = self.client.get(reverse("instrumentation_summary"))
+        self.assertEqual(response.status_code, 404)
+
+
+class DeleteRowsTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username="recipient")
+        Notification.objects.bulk_create(
+            Notification(recipient=user, subject=f"Notice {i}", content="Hi")
+            for i in range(5)
+        )
+
+    def test_deletes_matching_rows_without_signals(self):
+        deleted = []
+
+        def receiver(sender, instance, **kwargs):
+            deleted.append(instance.pk)
+
+        post_delete.connect(receiver, sender=Notification)
+        self.addCleanup(post_delete.disconnect, receiver, sender=Notification)
+        doomed = Notification.objects.order_by("pk")[:3]
+        with self.assertNumQueries(1):
+            self.assertEqual(delete_rows(doomed), 3)
+        self.assertEqual(deleted, [])
+        self.assertEqual(
+            list(Notification.objects.values_list("subject", flat=True).order_by("pk")),
+            ["Notice 3", "Notice 4"],
+        )
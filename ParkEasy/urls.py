@@ -18,8 +18,7 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 from accounts.views import home
-from django.views.static import serve
-from django.conf import settings
+from .views import instrumentation_summary
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -28,11 +27,10 @@ urlpatterns = [
     path("listings/", include("listings.urls")),
     path("booking/", include("booking.urls")),
     path("messaging/", include("messaging.urls")),
-    # This pattern will serve media files from MEDIA_ROOT
+    path("reports/", include("reports.urls")),
     path(
-        "verification_documents/<path:path>",
-        serve,
-        {"document_root": settings.MEDIA_ROOT},
+        "debug/instrumentation/",
+        instrumentation_summary,
+        name="instrumentation_summary",
     ),
-    path("reports/", include("reports.urls")),
 ]
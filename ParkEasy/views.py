@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.http import Http404, HttpResponseForbidden, JsonResponse
+
+from .instrumentation import request_summary
+
+
+@login_required
+def instrumentation_summary(request):
+    """
+    Debug panel with the rolling per-view SQL count and latency percentiles
+    recorded by InstrumentationMiddleware.
+    """
+    if not settings.INSTRUMENTATION_PANEL:
+        raise Http404
+    if not request.user.is_staff:
+        return HttpResponseForbidden("You do not have permission to view this page.")
+    return JsonResponse({"views": request_summary.snapshot()})
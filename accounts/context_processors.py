@@ -13,9 +13,10 @@ def notification_count(request):
             and hasattr(request.user, "is_authenticated")
             and request.user.is_authenticated
         ):
-            # Count unread notifications (get direct SQL count for performance)
-            unread_notification_count = Notification.objects.filter(
-                recipient=request.user, read=False
+            # Count unread notifications past the read watermark (an index
+            # range count)
+            unread_notification_count = Notification.objects.unread_for(
+                request.user
             ).count()
 
             # Count unread messages (also using direct SQL count)
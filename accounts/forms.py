@@ -1,6 +1,7 @@
 from django import forms
 from django.core.validators import RegexValidator
 from django.contrib.auth.models import User
+from messaging.forms import BulkActionForm
 
 
 # Existing EmailChangeForm
@@ -131,3 +132,23 @@ class AdminNotificationForm(forms.Form):
                 )
 
         return cleaned_data
+
+
+class VerificationBulkForm(BulkActionForm):
+    """Approve or decline many pending verification requests at once."""
+
+    action = forms.ChoiceField(choices=[("approve", "Approve"), ("decline", "Decline")])
+    decline_reason = forms.CharField(
+        required=False,
+        widget=forms.Textarea(attrs={"class": "form-control", "rows": 2}),
+    )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if cleaned_data.get("action") == "decline" and not cleaned_data.get(
+            "decline_reason", ""
+        ):
+            raise forms.ValidationError(
+                "Please provide a reason for declining the verification requests."
+            )
+        return cleaned_data
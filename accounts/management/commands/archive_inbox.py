@@ -0,0 +1,91 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count, Min
+from django.utils import timezone
+
+from accounts.models import (
+    Notification,
+    archivable_notifications,
+    archive_read_notifications,
+)
+from messaging.models import Message, archivable_messages, archive_read_messages
+
+
+class Command(BaseCommand):
+    help = (
+        "Move read notifications and messages older than the retention period "
+        "to their archive tables, keeping the live tables small."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--notification-days",
+            type=int,
+            default=settings.NOTIFICATION_RETENTION_DAYS,
+            help="Archive read notifications older than this many days.",
+        )
+        parser.add_argument(
+            "--message-days",
+            type=int,
+            default=settings.MESSAGE_RETENTION_DAYS,
+            help="Archive read messages older than this many days.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows moved per transaction.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be archived.",
+        )
+
+    def handle(self, *args, **options):
+        if options["notification_days"] < 1 or options["message_days"] < 1:
+            raise CommandError("Retention periods must be at least one day.")
+        now = timezone.now()
+        notifications_before = now - timedelta(days=options["notification_days"])
+        messages_before = now - timedelta(days=options["message_days"])
+
+        if options["dry_run"]:
+            self.report(
+                "notifications",
+                Notification.objects.all(),
+                archivable_notifications(notifications_before),
+                "notification_type",
+            )
+            self.report(
+                "messages", Message.objects.all(), archivable_messages(messages_before)
+            )
+            return
+
+        archived = archive_read_notifications(
+            notifications_before, batch_size=options["batch_size"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} notifications."))
+        archived = archive_read_messages(
+            messages_before, batch_size=options["batch_size"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} messages."))
+
+    def report(self, name, everything, eligible, group_by=None):
+        stats = eligible.aggregate(total=Count("pk"), oldest=Min("created_at"))
+        oldest = stats["oldest"]
+        oldest = f" (oldest from {oldest:%Y-%m-%d})" if oldest else ""
+        self.stdout.write(
+            f"{stats['total']} of {everything.count()} {name} would be "
+            f"archived{oldest}."
+        )
+        if group_by and stats["total"]:
+            rows = (
+                eligible.order_by()
+                .values(group_by)
+                .annotate(total=Count("pk"))
+                .order_by("-total")
+            )
+            for row in rows:
+                self.stdout.write(f"  {row[group_by]}: {row['total']}")
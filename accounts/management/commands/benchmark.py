@@ -0,0 +1,431 @@
+import datetime as dt
+import itertools
+import json
+import statistics
+import subprocess
+import time
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import Notification
+from booking.models import Booking, BookingSlot
+from listings.models import Listing, ListingSlot
+from messaging.models import Message
+from reports.models import Report
+
+# Random seed passed to create_fake_data, so every run of a scale gets the
+# same dataset.
+DATASET_SEED = 42
+
+# Dataset sizes passed to create_fake_data by --seed.
+SCALES = {
+    "1k": {
+        "users": 200,
+        "listings": 1_000,
+        "max_slots": 5,
+        "bookings": 5_000,
+        "reviews": 1_000,
+        "notifications": 50_000,
+        "messages": 20_000,
+        "reports": 500,
+    },
+    "10k": {
+        "users": 2_000,
+        "listings": 10_000,
+        "max_slots": 10,
+        "bookings": 50_000,
+        "reviews": 10_000,
+        "notifications": 500_000,
+        "messages": 200_000,
+        "reports": 5_000,
+    },
+    "100k": {
+        "users": 20_000,
+        "listings": 100_000,
+        "max_slots": 20,
+        "bookings": 500_000,
+        "reviews": 100_000,
+        "notifications": 5_000_000,
+        "messages": 2_000_000,
+        "reports": 50_000,
+    },
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Run scripted request scenarios with Django's test client against the "
+        "current database and report p50/p95 latency and query counts."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            choices=sorted(SCALES),
+            help="Regenerate the fake dataset at this scale before running.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="Requests issued per scenario.",
+        )
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            dest="scenarios",
+            help="Only run this scenario (can be repeated).",
+        )
+        parser.add_argument(
+            "--warm",
+            action="store_true",
+            help="Keep the listing search cache between requests instead of "
+            "clearing it before each one, to measure repeated searches.",
+        )
+        parser.add_argument("--output", help="Write the results as JSON to this file.")
+        parser.add_argument(
+            "--compare", help="Print the difference with an earlier --output file."
+        )
+
+    def handle(self, *args, **options):
+        if options["seed"]:
+            call_command(
+                "create_fake_data", seed=DATASET_SEED, **SCALES[options["seed"]]
+            )
+
+        scenarios = self.get_scenarios()
+        selected = options["scenarios"] or list(scenarios)
+        unknown = set(selected) - set(scenarios)
+        if unknown:
+            raise CommandError(f"Unknown scenario(s): {', '.join(sorted(unknown))}")
+
+        self.iterations = options["iterations"]
+        results = {}
+        # Every scenario runs inside a transaction that is rolled back, so
+        # write scenarios leave the dataset identical for the next run.
+        with override_settings(
+            EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend"
+        ):
+            for name in selected:
+                with transaction.atomic():
+                    results[name] = self.run_scenario(
+                        scenarios[name], options["iterations"], not options["warm"]
+                    )
+                    transaction.set_rollback(True)
+
+        report = {
+            "commit": self.current_commit(),
+            "database": connection.vendor,
+            "iterations": options["iterations"],
+            "search_cache": "warm" if options["warm"] else "cold",
+            "dataset": self.dataset_counts(),
+            "results": results,
+        }
+        self.print_report(report)
+
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                json.dump(report, file, indent=2)
+        if options["compare"]:
+            with open(options["compare"]) as file:
+                self.print_comparison(json.load(file), report)
+
+    def run_scenario(self, scenario, iterations, cold):
+        client = Client(SERVER_NAME="localhost")
+        setup = scenario(client)
+        if setup is None:
+            return {"skipped": True}
+
+        timings = []
+        query_counts = []
+        for i in range(iterations):
+            if cold:
+                caches["listing_search"].clear()
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                response = setup(i)
+                timings.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                raise CommandError(
+                    f"{scenario.__name__} returned HTTP {response.status_code}"
+                )
+            query_counts.append(len(queries))
+
+        timings.sort()
+        return {
+            "p50_ms": round(statistics.median(timings), 2),
+            "p95_ms": round(timings[int(0.95 * (len(timings) - 1))], 2),
+            "queries": int(statistics.median(query_counts)),
+            "max_queries": max(query_counts),
+        }
+
+    # -- Scenarios ---------------------------------------------------------
+    # Each scenario prepares its actors and returns a function issuing the
+    # i-th request, or None when the dataset has nothing to exercise.
+
+    def get_scenarios(self):
+        return {
+            "browse": self.scenario_browse,
+            "radius_search": self.scenario_radius_search,
+            "recurring_search": self.scenario_recurring_search,
+            "map": self.scenario_map,
+            "available_times": self.scenario_available_times,
+            "booking_creation": self.scenario_booking_creation,
+            "approval_storm": self.scenario_approval_storm,
+            "manage_listings": self.scenario_manage_listings,
+            "my_bookings": self.scenario_my_bookings,
+            "inbox": self.scenario_inbox,
+            "conversations": self.scenario_conversations,
+            "notifications": self.scenario_notifications,
+            "admin_reports": self.scenario_admin_reports,
+        }
+
+    def scenario_browse(self, client):
+        url = reverse("view_listings")
+        return lambda i: client.get(url)
+
+    def scenario_radius_search(self, client):
+        url = reverse("view_listings")
+        # Downtown Brooklyn
+        params = {"lat": "40.6928", "lng": "-73.9903", "radius": "2"}
+        return lambda i: client.get(url, params)
+
+    def scenario_recurring_search(self, client):
+        url = reverse("view_listings")
+        start = dt.date.today() + dt.timedelta(days=1)
+        params = {
+            "filter_type": "recurring",
+            "recurring_start_date": start.strftime("%Y-%m-%d"),
+            "recurring_start_time": "09:00",
+            "recurring_end_time": "17:00",
+            "recurring_pattern": "weekly",
+            "recurring_weeks": "4",
+        }
+        return lambda i: client.get(url, params)
+
+    def scenario_map(self, client):
+        url = reverse("map_view_listings")
+        return lambda i: client.get(url)
+
+    def scenario_available_times(self, client):
+        slot = self.future_slots().first()
+        guest = self.guest_for(slot)
+        if guest is None:
+            return None
+        client.force_login(guest)
+        url = reverse("available_times")
+        params = {
+            "listing_id": slot.listing_id,
+            "date": slot.start_date.strftime("%Y-%m-%d"),
+        }
+        return lambda i: client.get(url, params)
+
+    def scenario_booking_creation(self, client):
+        guest = self.guest_for(self.future_slots().first())
+        if guest is None:
+            return None
+        client.force_login(guest)
+        # Each request books its own half hour, so every iteration measures
+        # a successful booking rather than the rejection of a taken slot.
+        windows = list(
+            itertools.islice(
+                self.half_hours(self.future_slots().exclude(listing__user=guest)),
+                self.iterations,
+            )
+        )
+        if not windows:
+            return None
+
+        def book(i):
+            listing_id, start_time = windows[i % len(windows)]
+            end_time = start_time + dt.timedelta(minutes=30)
+            data = {
+                "email": "benchmark@example.com",
+                "form-TOTAL_FORMS": "1",
+                "form-INITIAL_FORMS": "0",
+                "form-MIN_NUM_FORMS": "0",
+                "form-MAX_NUM_FORMS": "1000",
+                "form-0-start_date": start_time.strftime("%Y-%m-%d"),
+                "form-0-start_time": start_time.strftime("%H:%M"),
+                "form-0-end_date": end_time.strftime("%Y-%m-%d"),
+                "form-0-end_time": end_time.strftime("%H:%M"),
+            }
+            return client.post(reverse("book_listing", args=[listing_id]), data)
+
+        return book
+
+    def scenario_approval_storm(self, client):
+        # The host with the most pending requests approves them one by one.
+        busiest = (
+            Booking.objects.filter(status="PENDING")
+            .values("listing__user")
+            .annotate(pending=Count("id"))
+            .order_by("-pending")
+            .first()
+        )
+        if busiest is None:
+            return None
+        host = User.objects.get(pk=busiest["listing__user"])
+        client.force_login(host)
+        pending = list(
+            Booking.objects.filter(listing__user=host, status="PENDING").values_list(
+                "pk", flat=True
+            )
+        )
+
+        def approve(i):
+            booking_id = pending[i % len(pending)]
+            return client.get(reverse("manage_booking", args=[booking_id, "approve"]))
+
+        return approve
+
+    def scenario_manage_listings(self, client):
+        host = self.busiest_user(Listing, "user")
+        if host is None:
+            return None
+        client.force_login(host)
+        url = reverse("manage_listings")
+        return lambda i: client.get(url)
+
+    def scenario_my_bookings(self, client):
+        guest = self.busiest_user(Booking, "user")
+        if guest is None:
+            return None
+        client.force_login(guest)
+        url = reverse("my_bookings")
+        return lambda i: client.get(url)
+
+    def scenario_inbox(self, client):
+        recipient = self.busiest_user(Message, "recipient")
+        if recipient is None:
+            return None
+        client.force_login(recipient)
+        url = reverse("inbox")
+        return lambda i: client.get(url)
+
+    def scenario_conversations(self, client):
+        recipient = self.busiest_user(Message, "recipient")
+        if recipient is None:
+            return None
+        client.force_login(recipient)
+        url = reverse("conversations")
+        return lambda i: client.get(url)
+
+    def scenario_notifications(self, client):
+        recipient = self.busiest_user(Notification, "recipient")
+        if recipient is None:
+            return None
+        client.force_login(recipient)
+        url = reverse("user_notifications")
+        return lambda i: client.get(url)
+
+    def scenario_admin_reports(self, client):
+        staff, _ = User.objects.get_or_create(
+            username="benchmark_admin", defaults={"is_staff": True}
+        )
+        client.force_login(staff)
+        url = reverse("admin_reports")
+        return lambda i: client.get(url, {"status": "ALL"})
+
+    # -- Helpers -----------------------------------------------------------
+
+    def future_slots(self):
+        tomorrow = dt.date.today() + dt.timedelta(days=1)
+        return ListingSlot.objects.filter(start_date__gte=tomorrow).order_by(
+            "start_date", "listing_id"
+        )
+
+    def half_hours(self, slots):
+        """Yield (listing ID, start) for every bookable half hour of ``slots``."""
+        for slot in slots.iterator():
+            start = dt.datetime.combine(slot.start_date, slot.start_time)
+            end = dt.datetime.combine(slot.end_date, slot.end_time)
+            while start + dt.timedelta(minutes=30) <= end:
+                yield slot.listing_id, start
+                start += dt.timedelta(minutes=30)
+
+    def guest_for(self, slot):
+        if slot is None:
+            return None
+        return User.objects.exclude(pk=slot.listing.user_id).order_by("pk").first()
+
+    def busiest_user(self, model, field):
+        row = (
+            model.objects.values(field)
+            .annotate(total=Count("id"))
+            .order_by("-total")
+            .first()
+        )
+        return User.objects.get(pk=row[field]) if row else None
+
+    def dataset_counts(self):
+        return {
+            "users": User.objects.count(),
+            "listings": Listing.objects.count(),
+            "listing_slots": ListingSlot.objects.count(),
+            "bookings": Booking.objects.count(),
+            "booking_slots": BookingSlot.objects.count(),
+            "notifications": Notification.objects.count(),
+            "messages": Message.objects.count(),
+            "reports": Report.objects.count(),
+        }
+
+    def current_commit(self):
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def print_report(self, report):
+        self.stdout.write(
+            f"commit {report['commit']} on {report['database']}, "
+            f"{report['iterations']} requests per scenario, "
+            f"{report['search_cache']} search cache"
+        )
+        self.stdout.write(
+            ", ".join(f"{name}={count}" for name, count in report["dataset"].items())
+        )
+        self.stdout.write(
+            f"{'scenario':<20}{'p50 ms':>10}{'p95 ms':>10}{'queries':>10}{'max q':>8}"
+        )
+        for name, result in report["results"].items():
+            if result.get("skipped"):
+                self.stdout.write(f"{name:<20}{'skipped (no data)':>38}")
+                continue
+            self.stdout.write(
+                f"{name:<20}{result['p50_ms']:>10}{result['p95_ms']:>10}"
+                f"{result['queries']:>10}{result['max_queries']:>8}"
+            )
+
+    def print_comparison(self, baseline, report):
+        self.stdout.write(f"\nCompared with commit {baseline.get('commit')}:")
+        if baseline.get("search_cache", "warm") != report["search_cache"]:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Baseline ran with a {baseline.get('search_cache', 'warm')} "
+                    f"search cache, this run with a {report['search_cache']} one."
+                )
+            )
+        for name, result in report["results"].items():
+            before = baseline["results"].get(name)
+            if not before or before.get("skipped") or result.get("skipped"):
+                continue
+            self.stdout.write(
+                f"{name:<20}"
+                f"p50 {result['p50_ms'] - before['p50_ms']:+.2f} ms  "
+                f"p95 {result['p95_ms'] - before['p95_ms']:+.2f} ms  "
+                f"queries {result['queries'] - before['queries']:+d}"
+            )
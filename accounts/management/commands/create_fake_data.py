@@ -1,231 +1,478 @@
+import itertools
 import random
 from datetime import date, datetime, time, timedelta
 
+import numpy as np
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 from faker import Faker
 
-from accounts.utilities import get_valid_nyc_coordinate
+from accounts.models import Notification, Profile
+from accounts.utilities import (
+    borough_for_district,
+    classify_nyc_coordinates,
+    sample_nyc_coordinates,
+)
 from booking.models import Booking, BookingSlot
+from booking.utils import merge_intervals, subtract_interval
 from listings.models import Listing, ListingSlot, Review
+from listings.search_cache import invalidate_search_cache
+from listings.utils import simplify_location
+from messaging.models import (
+    ContactPair,
+    Conversation,
+    ConversationMember,
+    Message,
+    refresh_conversations,
+)
+from reports.models import Report
+from ParkEasy.db import delete_rows
 
-# Import block_out_booking so that approved bookings subtract availability.
-from booking.utils import block_out_booking
+FAKE_USERNAME_REGEX = r"^user[0-9]+$"
 
+# Faker is slow per call, so texts are drawn from a pool generated up front.
+TEXT_POOL_SIZE = 500
 
-class Command(BaseCommand):
-    help = "Create fake data: 10 users, 100 listings, 200 bookings, and 100 reviews"
 
-    def handle(self, *args, **kwargs):
-        # Check if fake data exists by verifying the existence of "user1"
-        if User.objects.filter(username="user1").exists():
-            self.stdout.write("Existing fake data found. Deleting...")
+def chunked(iterable, size):
+    """Yield lists of at most ``size`` items from ``iterable``."""
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
 
-            # Delete all users created by this script (user1 through user10)
-            for i in range(1, 11):
-                username = f"user{i}"
-                User.objects.filter(username=username).delete()
+class Command(BaseCommand):
+    help = (
+        "Create fake data (by default 10 users, 100 listings, 200 bookings, "
+        "and 100 reviews). Sizes can be raised for benchmarking; rows are "
+        "inserted in bulk so million-row datasets take minutes."
+    )
 
-            self.stdout.write(self.style.SUCCESS("Existing fake data deleted."))
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=10)
+        parser.add_argument("--listings", type=int, default=100)
+        parser.add_argument(
+            "--max-slots",
+            type=int,
+            default=3,
+            help="Maximum number of availability slots per listing.",
+        )
+        parser.add_argument("--bookings", type=int, default=200)
+        parser.add_argument("--reviews", type=int, default=100)
+        parser.add_argument("--notifications", type=int, default=0)
+        parser.add_argument("--messages", type=int, default=0)
+        parser.add_argument("--reports", type=int, default=0)
+        parser.add_argument(
+            "--seed",
+            type=int,
+            help="Random seed, to generate the same dataset on every run.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Number of rows inserted per bulk_create call.",
+        )
 
-        # Continue with creating new fake data...
+    def handle(self, *args, **options):
+        self.chunk_size = options["chunk_size"]
+        random.seed(options["seed"])
+        Faker.seed(options["seed"])
+        self.rng = np.random.default_rng(options["seed"])
         fake = Faker()
-        users = []
-
-        # Create 10 users with password "testdata"
-        self.stdout.write("Creating users...")
-        for i in range(1, 11):
-            username = f"user{i}"
-            email = f"{username}@example.com"
-            user, created = User.objects.get_or_create(
-                username=username, defaults={"email": email}
+        self.descriptions = [fake.text(max_nb_chars=200) for _ in range(TEXT_POOL_SIZE)]
+        self.sentences = [fake.sentence(nb_words=10) for _ in range(TEXT_POOL_SIZE)]
+
+        self.delete_existing_data()
+
+        with transaction.atomic():
+            users = self.create_users(options["users"])
+            listings, availability = self.create_listings(
+                users, options["listings"], options["max_slots"]
+            )
+            booking_count, review_count = self.create_bookings(
+                users, listings, availability, options["bookings"], options["reviews"]
             )
-            user.set_password("testdata")
-            user.save()
-            users.append(user)
-            self.stdout.write(self.style.SUCCESS(f"User created: {username}"))
+            slot_count = self.create_listing_slots(listings, availability)
+            self.create_inbox_data(users, listings, options)
+
+        # bulk_create skips the signals that keep search results fresh.
+        invalidate_search_cache()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Fake data creation complete: {len(users)} users, "
+                f"{len(listings)} listings, {slot_count} listing slots, "
+                f"{booking_count} bookings, {review_count} reviews."
+            )
+        )
+
+    def delete_existing_data(self):
+        fake_users = User.objects.filter(username__regex=FAKE_USERNAME_REGEX)
+        if not fake_users.exists():
+            return
+        self.stdout.write("Existing fake data found. Deleting...")
+
+        # Empty the large tables with plain DELETE statements first: the
+        # cascade collector would load every row, and each Listing and
+        # ListingSlot delete would refresh availability and invalidate the
+        # search cache through the post_delete signals. handle() invalidates
+        # the search cache once, after the new data is in.
+        fake_ids = fake_users.values("pk")
+        with transaction.atomic():
+            for queryset in (
+                ListingSlot.objects.filter(listing__user__in=fake_ids),
+                BookingSlot.objects.filter(
+                    Q(booking__user__in=fake_ids)
+                    | Q(booking__listing__user__in=fake_ids)
+                ),
+                Review.objects.filter(
+                    Q(user__in=fake_ids) | Q(listing__user__in=fake_ids)
+                ),
+                Notification.objects.filter(
+                    Q(sender__in=fake_ids) | Q(recipient__in=fake_ids)
+                ),
+                Conversation.objects.filter(members__user__in=fake_ids),
+                ConversationMember.objects.filter(
+                    Q(user__in=fake_ids) | Q(other_user__in=fake_ids)
+                ),
+                Message.objects.filter(
+                    Q(sender__in=fake_ids) | Q(recipient__in=fake_ids)
+                ),
+                Report.objects.filter(reporter__in=fake_ids),
+                Booking.objects.filter(
+                    Q(user__in=fake_ids) | Q(listing__user__in=fake_ids)
+                ),
+                Listing.objects.filter(user__in=fake_ids),
+            ):
+                delete_rows(queryset)
+            # Delete all users created by this script (user1, user2, ...)
+            fake_users.delete()
+
+        self.stdout.write(self.style.SUCCESS("Existing fake data deleted."))
+
+    def create_users(self, count):
+        # Create users with password "testdata", hashed once for all of them.
+        self.stdout.write(f"Creating {count} users...")
+        password = make_password("testdata")
+        User.objects.bulk_create(
+            (
+                User(
+                    username=f"user{i}",
+                    email=f"user{i}@example.com",
+                    password=password,
+                )
+                for i in range(1, count + 1)
+            ),
+            batch_size=self.chunk_size,
+        )
+        users = list(
+            User.objects.filter(username__regex=FAKE_USERNAME_REGEX).order_by("pk")
+        )
+        # bulk_create does not send post_save, so create the profiles here.
+        Profile.objects.bulk_create(
+            (Profile(user=user) for user in users), batch_size=self.chunk_size
+        )
+        return users
 
-        # Create 100 listings with valid NYC coordinates
-        self.stdout.write("Creating listings...")
+    def create_listings(self, users, count, max_slots):
+        """
+        Create listings at valid NYC coordinates. Their availability is kept
+        in memory as merged (start, end) intervals until the bookings have
+        been blocked out, and returned alongside the listings.
+        """
+        self.stdout.write(f"Creating {count} listings...")
+        coordinates = sample_nyc_coordinates(count, rng=self.rng)
+        # bulk_create skips Listing.save, so fill in the location fields here
+        # and tag the districts in one batch.
+        districts = classify_nyc_coordinates(coordinates)
+        now = timezone.now()
         listings = []
-        for i in range(1, 101):
-            user = random.choice(users)
-            title = f"Listing #{i}"
-
-            # Generate valid NYC coordinates
-            latitude, longitude = get_valid_nyc_coordinate()
-            location = f"Sample Location {i} [{latitude},{longitude}]"
-
-            rent_per_hour = round(random.uniform(10.00, 50.00), 2)
-            description = fake.text(max_nb_chars=200)
-            listing = Listing.objects.create(
-                user=user,
-                title=title,
-                location=location,
-                rent_per_hour=rent_per_hour,
-                description=description,
+        availability = []
+        for i, ((latitude, longitude), district) in enumerate(
+            zip(coordinates, districts), start=1
+        ):
+            intervals = merge_intervals(
+                [self.random_interval() for _ in range(random.randint(1, max_slots))]
+            )
+            listing = Listing(
+                user=random.choice(users),
+                title=f"Listing #{i}",
+                location=f"Sample Location {i} [{latitude},{longitude}]",
+                rent_per_hour=round(random.uniform(10.00, 50.00), 2),
+                description=random.choice(self.descriptions),
+                latitude=latitude,
+                longitude=longitude,
+                community_district=district,
+                borough=borough_for_district(district) or "",
             )
+            listing.location_name = simplify_location(listing.location)
+            self.set_availability(listing, intervals, now)
             listings.append(listing)
-            self.stdout.write(
-                self.style.SUCCESS(f"Listing created: {title} at {location}")
+            availability.append(intervals)
+
+        for chunk in chunked(listings, self.chunk_size):
+            Listing.objects.bulk_create(chunk)
+        return listings, availability
+
+    def random_interval(self):
+        # Choose a random start_date from today to 30 days ahead
+        start_date_obj = date.today() + timedelta(days=random.randint(0, 30))
+        # Determine duration: 0 for same-day, or 1-3 days for a multi-day slot.
+        duration_days = random.randint(0, 3)
+        end_date_obj = start_date_obj + timedelta(days=duration_days)
+
+        if duration_days == 0:
+            # Same-day slot: start between 6:00 and 16:00, end at least 30
+            # minutes later and before 22:00 (in minutes).
+            start_minutes = random.choice(range(360, 960, 30))
+            end_minutes = random.choice(range(start_minutes + 30, 1320, 30))
+        else:
+            # Multi-day slot: use a morning start and an evening end.
+            start_minutes = random.choice(range(360, 721, 30))  # 6:00 to 12:00
+            end_minutes = random.choice(range(960, 1320, 30))  # 16:00 to 22:00
+
+        return (
+            datetime.combine(start_date_obj, time.min)
+            + timedelta(minutes=start_minutes),
+            datetime.combine(end_date_obj, time.min) + timedelta(minutes=end_minutes),
+        )
+
+    def set_availability(self, listing, intervals, now):
+        """Fill in the fields the ListingSlot signals would normally maintain."""
+        listing.available_until = None
+        if intervals:
+            listing.available_until = timezone.make_aware(
+                max(end for _, end in intervals), timezone.get_current_timezone()
             )
+        listing.is_active = (
+            listing.available_until is not None and listing.available_until > now
+        )
 
-        # Create ListingSlots for each listing (1 to 3 slots per listing)
-        self.stdout.write("Creating listing slots...")
-        for listing in listings:
-            num_slots = random.randint(1, 3)
-            for _ in range(num_slots):
-                # Choose a random start_date from today to 30 days ahead
-                start_date_obj = date.today() + timedelta(days=random.randint(0, 30))
-                # Determine duration: 0 for same-day, or 1-3 days for a multi-day slot.
-                duration_days = random.randint(0, 3)
-                end_date_obj = start_date_obj + timedelta(days=duration_days)
-
-                if duration_days == 0:
-                    # Same-day slot: choose a start time between 6:00 and 16:00 (in minutes)
-                    start_minutes = random.choice(range(360, 960, 30))
-                    # End time must be at least 30 minutes after start, up to 22:00 (1320 minutes)
-                    possible_end_minutes = [
-                        m for m in range(start_minutes + 30, 1320, 30)
-                    ]
-                    if not possible_end_minutes:
-                        continue
-                    end_minutes = random.choice(possible_end_minutes)
-                else:
-                    # Multi-day slot: use a morning start and an evening end.
-                    start_minutes = random.choice(range(360, 721, 30))  # 6:00 to 12:00
-                    end_minutes = random.choice(range(960, 1320, 30))  # 16:00 to 22:00
-
-                st_time = time(hour=start_minutes // 60, minute=start_minutes % 60)
-                et_time = time(hour=end_minutes // 60, minute=end_minutes % 60)
-
-                listing_slot = ListingSlot.objects.create(
-                    listing=listing,
-                    start_date=start_date_obj,
-                    start_time=st_time,
-                    end_date=end_date_obj,
-                    end_time=et_time,
+    def create_bookings(self, users, listings, availability, count, review_count):
+        """
+        Create bookings with one slot inside an available interval of the
+        listing, and reviews for a random sample of them. Approved bookings
+        are subtracted from the in-memory availability, as block_out_booking
+        does for real bookings.
+        """
+        self.stdout.write(f"Creating {count} bookings...")
+        review_indices = set(random.sample(range(count), min(review_count, count)))
+        # Each review's created_at is before March 2025.
+        review_start = datetime(2020, 1, 1)
+        review_seconds = int((datetime(2025, 3, 1) - review_start).total_seconds())
+        tz = timezone.get_default_timezone()
+        status_choices = ["PENDING", "APPROVED", "DECLINED"]
+        reviews_created = 0
+
+        for chunk_start in range(0, count, self.chunk_size):
+            indices = range(chunk_start, min(chunk_start + self.chunk_size, count))
+            bookings = []
+            booked_intervals = []
+            for _ in indices:
+                listing_index = random.randrange(len(listings))
+                booking = Booking(
+                    user=random.choice(users),
+                    listing=listings[listing_index],
+                    total_price=round(random.uniform(20.00, 500.00), 2),
+                    status=random.choice(status_choices),
                 )
-                listing_slot.listing = listing
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"ListingSlot for {listing.title}: {start_date_obj} {st_time} - {end_date_obj} {et_time}"
+                interval = self.random_booking_interval(availability[listing_index])
+                if interval and booking.status == "APPROVED":
+                    availability[listing_index] = merge_intervals(
+                        [
+                            remainder
+                            for start, end in availability[listing_index]
+                            for remainder in subtract_interval(start, end, *interval)
+                        ]
                     )
-                )
-
-        # Create 200 bookings linking users and listings
-        self.stdout.write("Creating bookings...")
-        bookings = []
-        status_choices = ["PENDING", "APPROVED", "DECLINED"]
-        for i in range(1, 201):
-            user = random.choice(users)
-            listing = random.choice(listings)
-            email = "no-email@example.com"
-            total_price = round(random.uniform(20.00, 500.00), 2)
-            status = random.choice(status_choices)
-            booking = Booking.objects.create(
-                user=user,
-                listing=listing,
-                email=email,
-                total_price=total_price,
-                status=status,
+                bookings.append(booking)
+                booked_intervals.append(interval)
+            Booking.objects.bulk_create(bookings)
+            # bulk_create does not send post_save, so link the contacts here.
+            ContactPair.link(
+                (booking.user_id, booking.listing.user_id) for booking in bookings
             )
-            bookings.append(booking)
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"Booking #{booking.pk} for listing '{listing.title}' created."
+
+            BookingSlot.objects.bulk_create(
+                BookingSlot(
+                    booking=booking,
+                    start_date=start.date(),
+                    start_time=start.time(),
+                    end_date=end.date(),
+                    end_time=end.time(),
+                )
+                for booking, (start, end) in (
+                    (booking, interval)
+                    for booking, interval in zip(bookings, booked_intervals)
+                    if interval
                 )
             )
 
-        # Create BookingSlots for each booking (1 slot per booking)
-        self.stdout.write("Creating booking slots...")
-        for booking in bookings:
-            listing = booking.listing
-            listing_slots = list(listing.slots.all())
-            if not listing_slots:
-                continue
-            chosen_slot = random.choice(listing_slots)
-            # Compute listing slot start and end datetimes
-            listing_start_dt = datetime.combine(
-                chosen_slot.start_date, chosen_slot.start_time
+            reviews = [
+                Review(
+                    booking=booking,
+                    listing=booking.listing,
+                    user=booking.user,
+                    rating=random.randint(1, 5),
+                    comment=random.choice(self.sentences),
+                )
+                for index, booking in zip(indices, bookings)
+                if index in review_indices
+            ]
+            Review.objects.bulk_create(reviews)
+            # created_at is auto_now_add, so backdate it after the insert.
+            for review in reviews:
+                review.created_at = timezone.make_aware(
+                    review_start + timedelta(seconds=random.randint(0, review_seconds)),
+                    tz,
+                )
+            Review.objects.bulk_update(reviews, ["created_at"])
+            reviews_created += len(reviews)
+
+        return count, reviews_created
+
+    def random_booking_interval(self, intervals):
+        """
+        Pick a booking of whole half hours inside one of the intervals.
+        Returns None when the listing has no bookable time left.
+        """
+        if not intervals:
+            return None
+        listing_start, listing_end = random.choice(intervals)
+        total_minutes = int((listing_end - listing_start).total_seconds() // 60)
+        if total_minutes < 30:
+            return None
+
+        # Choose a random start offset in 30-minute increments, then a duration
+        # (in half-hour increments) that fits within the listing interval.
+        start_offset = random.randint(0, total_minutes // 30 - 1) * 30
+        duration = random.randint(1, (total_minutes - start_offset) // 30) * 30
+        start = listing_start + timedelta(minutes=start_offset)
+        return start, start + timedelta(minutes=duration)
+
+    def create_listing_slots(self, listings, availability):
+        """Insert the remaining availability and store it on the listings."""
+        self.stdout.write("Creating listing slots...")
+        now = timezone.now()
+        slots = (
+            ListingSlot(
+                listing=listing,
+                start_date=start.date(),
+                start_time=start.time(),
+                end_date=end.date(),
+                end_time=end.time(),
             )
-            listing_end_dt = datetime.combine(
-                chosen_slot.end_date, chosen_slot.end_time
+            for listing, intervals in zip(listings, availability)
+            for start, end in intervals
+        )
+        slot_count = 0
+        for chunk in chunked(slots, self.chunk_size):
+            ListingSlot.objects.bulk_create(chunk)
+            slot_count += len(chunk)
+
+        # Approved bookings may have shortened the last interval.
+        changed = []
+        for listing, intervals in zip(listings, availability):
+            available_until = listing.available_until
+            self.set_availability(listing, intervals, now)
+            if listing.available_until != available_until:
+                changed.append(listing)
+        Listing.objects.bulk_update(
+            changed, ["is_active", "available_until"], batch_size=1000
+        )
+        return slot_count
+
+    def create_inbox_data(self, users, listings, options):
+        """Bulk-create notifications, messages and reports between fake users."""
+        if options["notifications"]:
+            self.stdout.write(f"Creating {options['notifications']} notifications...")
+            self.bulk_create(
+                Notification,
+                (
+                    Notification(
+                        sender=random.choice(users),
+                        recipient=random.choice(users),
+                        subject=random.choice(self.sentences),
+                        content=random.choice(self.descriptions),
+                        notification_type=random.choice(["SYSTEM", "BOOKING"]),
+                        read=random.random() < 0.7,
+                    )
+                    for _ in range(options["notifications"])
+                ),
             )
-            total_minutes = int(
-                (listing_end_dt - listing_start_dt).total_seconds() // 60
+
+        if options["messages"]:
+            self.create_messages(users, options["messages"])
+
+        if options["reports"] and listings:
+            self.stdout.write(f"Creating {options['reports']} reports...")
+            listing_type = ContentType.objects.get_for_model(Listing)
+            self.bulk_create(
+                Report,
+                (
+                    Report(
+                        reporter=random.choice(users),
+                        content_type=listing_type,
+                        object_id=random.choice(listings).pk,
+                        report_type=random.choice(Report.REPORT_TYPES)[0],
+                        description=random.choice(self.sentences),
+                        status=random.choice(Report.STATUS_CHOICES)[0],
+                        alerted_at=timezone.now(),
+                    )
+                    for _ in range(options["reports"])
+                ),
             )
-            if total_minutes < 30:
-                continue
-
-            # Choose a random start offset in 30-minute increments
-            max_offset_slots = (
-                total_minutes // 30 - 1
-            )  # ensure at least one slot is available
-            if max_offset_slots < 0:
-                max_offset_slots = 0
-            start_offset = random.randint(0, max_offset_slots) * 30
-            booking_start_dt = listing_start_dt + timedelta(minutes=start_offset)
-
-            # Choose a duration (in half-hour increments) that fits within the listing slot
-            remaining_minutes = total_minutes - start_offset
-            possible_durations = [
-                30 * i for i in range(1, (remaining_minutes // 30) + 1)
+
+    def create_messages(self, users, count):
+        """
+        Bulk-create messages together with the conversations that
+        Message.save() would otherwise start for each pair of users.
+        """
+        self.stdout.write(f"Creating {count} messages...")
+        # Conversation ID of each (lower user ID, higher user ID) pair.
+        conversation_ids = {}
+        for chunk in chunked(range(count), self.chunk_size):
+            messages = [
+                Message(
+                    sender=random.choice(users),
+                    recipient=random.choice(users),
+                    subject=random.choice(self.sentences),
+                    body=random.choice(self.descriptions),
+                    read=random.random() < 0.7,
+                )
+                for _ in chunk
             ]
-            if not possible_durations:
-                continue
-            duration = random.choice(possible_durations)
-            booking_end_dt = booking_start_dt + timedelta(minutes=duration)
-
-            bs_start_date = booking_start_dt.date()
-            bs_start_time = booking_start_dt.time().replace(second=0, microsecond=0)
-            bs_end_date = booking_end_dt.date()
-            bs_end_time = booking_end_dt.time().replace(second=0, microsecond=0)
-
-            booking_slot = BookingSlot.objects.create(
-                booking=booking,
-                start_date=bs_start_date,
-                start_time=bs_start_time,
-                end_date=bs_end_date,
-                end_time=bs_end_time,
+            pairs = {
+                tuple(sorted((message.sender_id, message.recipient_id)))
+                for message in messages
+            }
+            new_pairs = sorted(pairs - conversation_ids.keys())
+            conversations = Conversation.objects.bulk_create(
+                [Conversation() for _ in new_pairs]
             )
-            booking_slot.booking = booking
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"BookingSlot for Booking \
-                        #{booking.pk}: {bs_start_date} {bs_start_time} - {bs_end_date} {bs_end_time}"
+            ConversationMember.objects.bulk_create(
+                ConversationMember(
+                    conversation=conversation, user_id=a, other_user_id=b
                 )
+                for conversation, pair in zip(conversations, new_pairs)
+                for a, b in {pair, pair[::-1]}
             )
-            # --- NEW: Subtract booking interval from listing availability if approved ---
-            if booking.status == "APPROVED":
-                block_out_booking(listing, booking)
-            # --- END NEW ---
-
-        # Create 100 reviews for random bookings; each review's created_at is before March 2025.
-        self.stdout.write("Creating reviews...")
-        review_bookings = random.sample(bookings, 100)
-        start_date_dt = datetime(2020, 1, 1)
-        end_date_dt = datetime(2025, 3, 1)
-        for booking in review_bookings:
-            rating = random.randint(1, 5)
-            comment = fake.sentence(nb_words=10)
-            review = Review.objects.create(
-                booking=booking,
-                listing=booking.listing,
-                user=booking.user,
-                rating=rating,
-                comment=comment,
-            )
-            delta = end_date_dt - start_date_dt
-            random_seconds = random.randint(0, int(delta.total_seconds()))
-            random_date = start_date_dt + timedelta(seconds=random_seconds)
-            aware_random_date = timezone.make_aware(
-                random_date, timezone.get_default_timezone()
-            )
-            Review.objects.filter(pk=review.pk).update(created_at=aware_random_date)
-            self.stdout.write(
-                self.style.SUCCESS(f"Review for Booking #{booking.pk} created.")
-            )
+            for conversation, pair in zip(conversations, new_pairs):
+                conversation_ids[pair] = conversation.pk
+            for message in messages:
+                message.conversation_id = conversation_ids[
+                    tuple(sorted((message.sender_id, message.recipient_id)))
+                ]
+            Message.objects.bulk_create(messages)
+        # Set each conversation's last message and unread counts in SQL.
+        refresh_conversations()
 
-        self.stdout.write(self.style.SUCCESS("Fake data creation complete."))
+    def bulk_create(self, model, objects):
+        # bulk_create materialises its argument, so feed it one chunk at a time.
+        for chunk in chunked(objects, self.chunk_size):
+            model.objects.bulk_create(chunk)
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.19 on 2026-10-19 00:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0009_verificationrequest"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="notifications_read_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["recipient", "-created_at", "-id"], name="notification_feed_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["recipient", "read", "created_at"],
+                name="notification_unread_idx",
+            ),
+        ),
+    ]
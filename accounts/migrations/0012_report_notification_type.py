@@ -0,0 +1,28 @@
+# Generated by Django 4.2.19 on 2026-10-19 00:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0011_archive_tables"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="notification",
+            name="notification_type",
+            field=models.CharField(
+                choices=[
+                    ("SYSTEM", "System Notification"),
+                    ("BOOKING", "Booking Notification"),
+                    ("ADMIN", "Admin Notification"),
+                    ("VERIFICATION", "Verification Notification"),
+                    ("REPORT", "Report Notification"),
+                ],
+                default="SYSTEM",
+                max_length=15,
+            ),
+        ),
+    ]
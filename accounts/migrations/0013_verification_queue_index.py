@@ -0,0 +1,21 @@
+# Generated by Django 4.2.19 on 2026-10-19 00:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0012_report_notification_type"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="verificationrequest",
+            index=models.Index(
+                condition=models.Q(("status", "PENDING")),
+                fields=["-created_at", "-id"],
+                name="verification_queue_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.19 on 2026-10-19 00:23
+
+import accounts.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0013_verification_queue_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="profile",
+            name="verification_file",
+            field=models.FileField(
+                blank=True,
+                null=True,
+                storage=accounts.storage.verification_storage,
+                upload_to="verification_documents/",
+            ),
+        ),
+    ]
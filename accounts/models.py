@@ -1,8 +1,11 @@
 # accounts/models.py
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Q
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from django.utils import timezone
+from .storage import verification_storage
 
 
 class Profile(models.Model):
@@ -10,12 +13,18 @@ class Profile(models.Model):
     is_verified = models.BooleanField(default=False)
     verification_requested = models.BooleanField(default=False)
     verification_file = models.FileField(
-        upload_to="verification_documents/", null=True, blank=True
+        upload_to="verification_documents/",
+        storage=verification_storage,
+        null=True,
+        blank=True,
     )
     # New user information fields
     age = models.PositiveIntegerField(null=True, blank=True)
     address = models.TextField(null=True, blank=True)
     phone_number = models.CharField(max_length=20, null=True, blank=True)
+    # Notifications created up to this moment have been seen, so they are no
+    # longer counted as unread even if their own ``read`` flag was never set.
+    notifications_read_at = models.DateTimeField(null=True, blank=True)
 
     def __str__(self):
         return f"{self.user.username}'s Profile"
@@ -28,12 +37,26 @@ def create_or_update_user_profile(sender, instance, created, **kwargs):
     instance.profile.save()
 
 
+class NotificationQuerySet(models.QuerySet):
+    def unread_for(self, user):
+        """
+        The user's unread notifications: not marked read and newer than the
+        user's read watermark.
+        """
+        notifications = self.filter(recipient=user, read=False)
+        read_at = user.profile.notifications_read_at
+        if read_at is not None:
+            notifications = notifications.filter(created_at__gt=read_at)
+        return notifications
+
+
 class Notification(models.Model):
     NOTIFICATION_TYPES = [
         ("SYSTEM", "System Notification"),
         ("BOOKING", "Booking Notification"),
         ("ADMIN", "Admin Notification"),
         ("VERIFICATION", "Verification Notification"),
+        ("REPORT", "Report Notification"),
     ]
 
     # Sender is optional (could be system notification)
@@ -55,16 +78,162 @@ class Notification(models.Model):
         max_length=15, choices=NOTIFICATION_TYPES, default="SYSTEM"
     )
 
+    objects = NotificationQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Feed: a user's notifications, newest first.
+            models.Index(
+                fields=["recipient", "-created_at", "-id"],
+                name="notification_feed_idx",
+            ),
+            # Unread count: a range scan past the read watermark.
+            models.Index(
+                fields=["recipient", "read", "created_at"],
+                name="notification_unread_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Notification for {self.recipient.username}: {self.subject}"
 
 
+class ArchivedNotification(models.Model):
+    """
+    A read notification moved out of the Notification table by
+    ``archive_read_notifications``. Keeps the original ID and content.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    sender = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    recipient = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    subject = models.CharField(max_length=255)
+    content = models.TextField()
+    notification_type = models.CharField(max_length=15)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["recipient", "created_at"], name="archived_notification_idx"
+            )
+        ]
+
+    def __str__(self):
+        return f"Archived notification for {self.recipient_id}: {self.subject}"
+
+
+def archivable_notifications(before):
+    """
+    Notifications created before ``before`` that their recipient has read,
+    either explicitly or by moving their read watermark past them.
+    """
+    return Notification.objects.filter(created_at__lt=before).filter(
+        Q(read=True) | Q(created_at__lte=F("recipient__profile__notifications_read_at"))
+    )
+
+
+def archive_read_notifications(before, batch_size=1000):
+    """
+    Move read notifications created before ``before`` to
+    ArchivedNotification, ``batch_size`` rows per transaction. Returns the
+    number of notifications archived.
+    """
+    eligible = archivable_notifications(before).order_by("pk")
+    archived = 0
+    while True:
+        batch = list(eligible[:batch_size])
+        if not batch:
+            break
+        with transaction.atomic():
+            ArchivedNotification.objects.bulk_create(
+                [
+                    ArchivedNotification(
+                        id=notification.pk,
+                        sender_id=notification.sender_id,
+                        recipient_id=notification.recipient_id,
+                        subject=notification.subject,
+                        content=notification.content,
+                        notification_type=notification.notification_type,
+                        created_at=notification.created_at,
+                    )
+                    for notification in batch
+                ],
+                ignore_conflicts=True,
+            )
+            # Nothing references notifications and no delete signals are
+            # connected, so this is a single DELETE statement.
+            deleted, _ = Notification.objects.filter(
+                pk__in=[notification.pk for notification in batch]
+            ).delete()
+            archived += deleted
+    return archived
+
+
 # Update the accounts/models.py file with this new model
 
 
+class VerificationRequestQuerySet(models.QuerySet):
+    def approve(self, admin):
+        """
+        Approve these requests: verify their users and notify them, with one
+        statement per table however many requests there are. Returns the
+        number of requests approved.
+        """
+        with transaction.atomic():
+            rows = list(self.select_for_update().values_list("pk", "user_id"))
+            if not rows:
+                return 0
+            request_ids, user_ids = zip(*rows)
+            Profile.objects.filter(user_id__in=user_ids).update(is_verified=True)
+            VerificationRequest.objects.filter(pk__in=request_ids).update(
+                status="APPROVED", updated_at=timezone.now()
+            )
+            Notification.objects.bulk_create(
+                Notification(
+                    sender=admin,
+                    recipient_id=user_id,
+                    subject="Account Verification Approved",
+                    content="Congratulations! Your account has been verified. "
+                    "You can now post parking spots on ParkEasy.",
+                    notification_type="VERIFICATION",
+                )
+                for user_id in set(user_ids)
+            )
+        return len(request_ids)
+
+    def decline(self, admin, reason):
+        """
+        Decline these requests with ``reason`` and notify their users.
+        Returns the number of requests declined.
+        """
+        with transaction.atomic():
+            rows = list(self.select_for_update().values_list("pk", "user_id"))
+            if not rows:
+                return 0
+            request_ids, user_ids = zip(*rows)
+            VerificationRequest.objects.filter(pk__in=request_ids).update(
+                status="DECLINED", decline_reason=reason, updated_at=timezone.now()
+            )
+            Notification.objects.bulk_create(
+                Notification(
+                    sender=admin,
+                    recipient_id=user_id,
+                    subject="Account Verification Declined",
+                    content="Your account verification has been declined for the "
+                    f"following reason:\n\n{reason}\n\nPlease submit a new "
+                    "verification request with updated information or documents.",
+                    notification_type="VERIFICATION",
+                )
+                for user_id in set(user_ids)
+            )
+        return len(request_ids)
+
+
 class VerificationRequest(models.Model):
     STATUS_CHOICES = [
         ("PENDING", "Pending"),
@@ -83,8 +252,19 @@ class VerificationRequest(models.Model):
     # Verification data will be stored in the Profile model
     # This is just for managing the verification request workflow
 
+    objects = VerificationRequestQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Review queue: pending requests, newest first. Handled requests
+            # are the bulk of the table and are left out of the index.
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="verification_queue_idx",
+                condition=Q(status="PENDING"),
+            ),
+        ]
 
     def __str__(self):
         return f"Verification request for {self.user.username} ({self.get_status_display()})"
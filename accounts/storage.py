@@ -0,0 +1,63 @@
+"""
+Storage and delivery of private verification documents.
+
+Documents go through the "verification" storage alias (see ``STORAGES`` in
+settings): the local filesystem by default, or an S3-compatible bucket. They
+are never exposed under a public URL. After the permission check in the
+``verification_document`` view, the bytes are handed off so they do not
+stream through a Python worker:
+
+* remote storage: a redirect to a signed URL that expires after
+  ``VERIFICATION_URL_EXPIRY`` seconds;
+* local storage: an ``X-Accel-Redirect`` (nginx) or ``X-Sendfile`` (Apache,
+  lighttpd) header, as selected by ``VERIFICATION_SENDFILE``. Without one,
+  Django streams the file itself, which is only meant for development.
+"""
+
+import mimetypes
+import os
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.files.storage import storages
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseRedirect
+from django.utils.cache import patch_cache_control
+from django.utils.http import content_disposition_header
+
+
+def verification_storage():
+    """Storage of Profile.verification_file, resolved from settings."""
+    return storages["verification"]
+
+
+def document_response(field_file):
+    """Response that delivers ``field_file`` without reading it in Python."""
+    try:
+        path = field_file.storage.path(field_file.name)
+    except NotImplementedError:
+        # Remote storage: the URL is signed and expires.
+        response = HttpResponseRedirect(field_file.url)
+    else:
+        response = _local_file_response(field_file.name, path)
+    patch_cache_control(response, private=True, no_store=True)
+    return response
+
+
+def _local_file_response(name, path):
+    filename = os.path.basename(name)
+    mode = settings.VERIFICATION_SENDFILE
+    if mode == "x-accel-redirect":
+        response = HttpResponse()
+        response["X-Accel-Redirect"] = settings.VERIFICATION_ACCEL_PREFIX + quote(name)
+    elif mode == "x-sendfile":
+        response = HttpResponse()
+        response["X-Sendfile"] = path
+    else:
+        try:
+            return FileResponse(open(path, "rb"), filename=filename)
+        except FileNotFoundError:
+            raise Http404("Verification document not found.")
+    content_type, _ = mimetypes.guess_type(filename)
+    response["Content-Type"] = content_type or "application/octet-stream"
+    response["Content-Disposition"] = content_disposition_header(False, filename)
+    return response
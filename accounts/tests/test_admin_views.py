@@ -2,8 +2,11 @@
 
 import shutil
 import tempfile
+from unittest.mock import patch
 
+from django.db import connection
 from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth.models import User
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -199,6 +202,112 @@ class AdminVerificationViewsTest(TestCase):
         self.assertEqual(response.status_code, 403)
 
 
+class VerificationQueueTest(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            username="admin", password="adminpass", is_staff=True
+        )
+        self.users = [User.objects.create_user(username=f"user{i}") for i in range(3)]
+        self.requests = [
+            VerificationRequest.objects.create(user=user, status="PENDING")
+            for user in self.users
+        ]
+        self.queue_url = reverse("admin_verification_requests")
+        self.bulk_url = reverse("bulk_verification_requests")
+        self.client.login(username="admin", password="adminpass")
+
+    def add_requests(self, count):
+        for i in range(count):
+            user = User.objects.create_user(username=f"extra{i}")
+            VerificationRequest.objects.create(user=user, status="PENDING")
+
+    def test_queue_query_count_independent_of_request_count(self):
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(self.queue_url)
+        self.add_requests(5)
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.get(self.queue_url)
+        self.assertEqual(len(response.context["verification_requests"]), 8)
+        self.assertEqual(len(large), len(small))
+
+    def test_queue_is_keyset_paginated(self):
+        with patch("accounts.views.VERIFICATIONS_PER_PAGE", 2):
+            response = self.client.get(self.queue_url)
+            first_page = response.context["verification_requests"]
+            self.assertEqual(first_page, self.requests[:0:-1])
+            cursor = response.context["next_cursor"]
+            self.assertIsNotNone(cursor)
+
+            response = self.client.get(self.queue_url, {"cursor": cursor})
+        self.assertEqual(response.context["verification_requests"], self.requests[:1])
+        self.assertIsNone(response.context["next_cursor"])
+
+    def test_bulk_approve(self):
+        VerificationRequest.objects.filter(pk=self.requests[2].pk).update(
+            status="DECLINED"
+        )
+        response = self.client.post(
+            self.bulk_url,
+            {"action": "approve", "ids": [r.pk for r in self.requests]},
+        )
+        self.assertRedirects(response, self.queue_url, fetch_redirect_response=False)
+
+        statuses = VerificationRequest.objects.order_by("pk").values_list(
+            "status", flat=True
+        )
+        self.assertEqual(list(statuses), ["APPROVED", "APPROVED", "DECLINED"])
+        verified = User.objects.filter(profile__is_verified=True)
+        self.assertQuerySetEqual(verified, self.users[:2], ordered=False)
+        self.assertEqual(
+            Notification.objects.filter(
+                subject="Account Verification Approved", sender=self.admin
+            ).count(),
+            2,
+        )
+        response = self.client.get(self.queue_url)
+        self.assertEqual(
+            response.context["success_message"], "2 verification request(s) approved."
+        )
+
+    def test_bulk_decline_requires_reason(self):
+        response = self.client.post(
+            self.bulk_url, {"action": "decline", "ids": [self.requests[0].pk]}
+        )
+        self.assertRedirects(response, self.queue_url, fetch_redirect_response=False)
+        self.requests[0].refresh_from_db()
+        self.assertEqual(self.requests[0].status, "PENDING")
+        response = self.client.get(self.queue_url)
+        self.assertIn("reason", response.context["error_message"])
+
+    def test_bulk_decline(self):
+        self.client.post(
+            self.bulk_url,
+            {
+                "action": "decline",
+                "ids": [r.pk for r in self.requests[:2]],
+                "decline_reason": "Document is blurry.",
+            },
+        )
+        declined = VerificationRequest.objects.filter(status="DECLINED")
+        self.assertEqual(declined.count(), 2)
+        self.assertTrue(
+            all(r.decline_reason == "Document is blurry." for r in declined)
+        )
+        notification = Notification.objects.get(recipient=self.users[0])
+        self.assertEqual(notification.subject, "Account Verification Declined")
+        self.assertIn("Document is blurry.", notification.content)
+        self.assertFalse(User.objects.filter(profile__is_verified=True).exists())
+
+    def test_bulk_requires_staff(self):
+        self.client.force_login(self.users[0])
+        response = self.client.post(
+            self.bulk_url, {"action": "approve", "ids": [self.requests[0].pk]}
+        )
+        self.assertEqual(response.status_code, 403)
+        self.requests[0].refresh_from_db()
+        self.assertEqual(self.requests[0].status, "PENDING")
+
+
 class NotificationViewsTest(TestCase):
     def setUp(self):
         self.client = Client()
@@ -256,10 +365,10 @@ class NotificationViewsTest(TestCase):
         self.assertIn("notifications", response.context)
         self.assertEqual(len(response.context["notifications"]), 2)
 
-        # Check that notifications are marked as read
-        self.assertFalse(
-            Notification.objects.filter(recipient=self.user1, read=False).exists()
-        )
+        # Check that notifications are no longer unread (the read watermark
+        # moved past them)
+        user = User.objects.get(pk=self.user1.pk)
+        self.assertFalse(Notification.objects.unread_for(user).exists())
 
     def test_admin_send_notification_get(self):
         """Test admin send notification form display"""
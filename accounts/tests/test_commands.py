@@ -0,0 +1,175 @@
+# accounts/tests/test_commands.py
+
+import json
+import os
+import tempfile
+from datetime import date, time, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from accounts.management.commands import benchmark
+from accounts.models import Notification, Profile
+from booking.models import Booking, BookingSlot
+from listings.models import Listing, ListingSlot, Review
+from messaging.models import Conversation, ConversationMember, Message
+from reports.models import Report
+
+
+class BenchmarkCommandTest(TestCase):
+    def setUp(self):
+        host = User.objects.create_user(username="host")
+        guest = User.objects.create_user(username="guest")
+        listing = Listing.objects.create(
+            user=host,
+            title="Benchmark Spot",
+            location="Benchmark St [40.7,-73.9]",
+            rent_per_hour=Decimal("10.00"),
+            description="Benchmark",
+        )
+        day = date.today() + timedelta(days=2)
+        ListingSlot.objects.create(
+            listing=listing,
+            start_date=day,
+            start_time=time(9, 0),
+            end_date=day,
+            end_time=time(17, 0),
+        )
+        Booking.objects.create(
+            user=guest,
+            listing=listing,
+            email="guest@example.com",
+            status="PENDING",
+            total_price=Decimal("10.00"),
+        )
+        Message.objects.create(sender=host, recipient=guest, body="Hello")
+
+    def test_runs_every_scenario_cold_by_default(self):
+        out = StringIO()
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "results.json")
+            call_command("benchmark", iterations=2, output=output, stdout=out)
+            with open(output) as file:
+                report = json.load(file)
+
+        self.assertEqual(report["search_cache"], "cold")
+        self.assertEqual(report["dataset"]["listings"], 1)
+        for name in ("browse", "recurring_search", "booking_creation", "inbox"):
+            self.assertGreater(report["results"][name]["queries"], 0)
+        self.assertIn("cold search cache", out.getvalue())
+        # Write scenarios are rolled back.
+        self.assertEqual(Booking.objects.count(), 1)
+
+    def test_booking_creation_books_a_new_slot_every_iteration(self):
+        command = benchmark.Command()
+        command.iterations = 3
+        book = command.scenario_booking_creation(Client())
+        for i in range(3):
+            book(i)
+        self.assertEqual(Booking.objects.count(), 4)
+        self.assertEqual(
+            sorted(BookingSlot.objects.values_list("start_time", flat=True)),
+            [time(9, 0), time(9, 30), time(10, 0)],
+        )
+
+    def test_warm_run_and_comparison(self):
+        with tempfile.TemporaryDirectory() as directory:
+            baseline = os.path.join(directory, "baseline.json")
+            call_command(
+                "benchmark",
+                iterations=1,
+                scenarios=["browse"],
+                output=baseline,
+                stdout=StringIO(),
+            )
+            out = StringIO()
+            call_command(
+                "benchmark",
+                iterations=2,
+                scenarios=["browse"],
+                warm=True,
+                compare=baseline,
+                stdout=out,
+            )
+        self.assertIn("warm search cache", out.getvalue())
+        self.assertIn("Baseline ran with a cold search cache", out.getvalue())
+
+
+class CreateFakeDataCommandTest(TestCase):
+    options = {
+        "users": 5,
+        "listings": 8,
+        "max_slots": 2,
+        "bookings": 12,
+        "reviews": 4,
+        "notifications": 6,
+        "messages": 10,
+        "reports": 3,
+    }
+
+    def create_fake_data(self, seed):
+        call_command("create_fake_data", seed=seed, stdout=StringIO(), **self.options)
+
+    def assert_fake_data(self):
+        self.assertEqual(User.objects.filter(username__startswith="user").count(), 5)
+        self.assertEqual(Profile.objects.filter(user__username="host").count(), 1)
+        self.assertEqual(Profile.objects.count(), User.objects.count())
+        self.assertEqual(Listing.objects.exclude(user__username="host").count(), 8)
+        self.assertEqual(Booking.objects.count(), 12)
+        self.assertEqual(Review.objects.count(), 4)
+        self.assertEqual(Notification.objects.count(), 6)
+        self.assertEqual(Message.objects.count(), 11)
+        self.assertEqual(Report.objects.count(), 3)
+        self.assertLessEqual(BookingSlot.objects.count(), 12)
+        self.assertGreater(ListingSlot.objects.count(), 0)
+
+        # Every foreign key points at an existing row, and every generated
+        # message and report belongs to the current run's data.
+        connection.check_constraints()
+        listing_ids = set(Listing.objects.values_list("pk", flat=True))
+        self.assertTrue(
+            set(Report.objects.values_list("object_id", flat=True)) <= listing_ids
+        )
+        for message in Message.objects.all():
+            self.assertTrue(
+                ConversationMember.objects.filter(
+                    conversation=message.conversation_id, user=message.sender_id
+                ).exists()
+            )
+        self.assertFalse(Conversation.objects.filter(members__isnull=True).exists())
+
+    def test_rerun_replaces_existing_fake_data(self):
+        host = User.objects.create_user(username="host")
+        guest = User.objects.create_user(username="guest")
+        Listing.objects.create(
+            user=host,
+            title="Real Spot",
+            location="Real St [40.7,-73.9]",
+            rent_per_hour=Decimal("10.00"),
+            description="Not fake",
+        )
+        Message.objects.create(sender=guest, recipient=host, body="Hello")
+
+        self.create_fake_data(seed=1)
+        self.assert_fake_data()
+        first_run = set(User.objects.values_list("pk", flat=True))
+
+        with CaptureQueriesContext(connection) as queries:
+            self.create_fake_data(seed=2)
+        self.assert_fake_data()
+        # The old rows are deleted without per-row signals, each of which
+        # would touch the search cache.
+        cache_queries = [
+            query for query in queries if "listing_search_cache" in query["sql"]
+        ]
+        self.assertLessEqual(len(cache_queries), 4)
+        # The fake users were replaced; the real users and their data were kept.
+        second_run = set(User.objects.values_list("pk", flat=True))
+        self.assertEqual(first_run & second_run, {host.pk, guest.pk})
+        self.assertTrue(Listing.objects.filter(title="Real Spot").exists())
+        self.assertTrue(Message.objects.filter(body="Hello").exists())
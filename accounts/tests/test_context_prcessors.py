@@ -101,6 +101,21 @@ class NotificationCountTest(TestCase):
         self.assertEqual(context["unread_message_count"], 0)
         self.assertEqual(context["total_unread_count"], 0)
 
+    def test_notification_count_respects_read_watermark(self):
+        """Notifications older than the read watermark are not unread"""
+        newest = Notification.objects.filter(recipient=self.user).latest("created_at")
+        self.user.profile.notifications_read_at = newest.created_at
+        self.user.profile.save()
+        Notification.objects.create(
+            recipient=self.user, subject="Later", content="Arrived after"
+        )
+
+        request = self.factory.get("/")
+        request.user = self.user
+
+        context = notification_count(request)
+        self.assertEqual(context["unread_notification_count"], 1)
+
     def test_notification_count_error_handling(self):
         """Test notification_count error handling"""
         request = self.factory.get("/")
@@ -2,11 +2,20 @@
 
 import shutil
 import tempfile
+from datetime import timedelta
+from io import StringIO
 
+from django.core.management import call_command
 from django.test import TestCase, override_settings
 from django.contrib.auth.models import User
 from django.core.files.uploadedfile import SimpleUploadedFile
-from accounts.models import Profile
+from django.utils import timezone
+from accounts.models import (
+    ArchivedNotification,
+    Notification,
+    Profile,
+    archive_read_notifications,
+)
 
 # Create a temporary directory for MEDIA_ROOT during tests.
 TEMP_MEDIA_ROOT = tempfile.mkdtemp()
@@ -88,3 +97,55 @@ class ProfileModelTest(TestCase):
         self.assertTrue(profile.verification_file)
         # Check that the file name ends with .pdf
         self.assertTrue(profile.verification_file.name.endswith(".pdf"))
+
+
+class ArchiveNotificationsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="user", password="pass")
+        self.now = timezone.now()
+        self.old = self.now - timedelta(days=100)
+
+    def notify(self, created_at, read=False):
+        notification = Notification.objects.create(
+            recipient=self.user, subject="Subject", content="Content", read=read
+        )
+        Notification.objects.filter(pk=notification.pk).update(created_at=created_at)
+        return notification
+
+    def test_archives_only_old_read_notifications(self):
+        old_read = self.notify(self.old, read=True)
+        old_unread = self.notify(self.old)
+        recent_read = self.notify(self.now, read=True)
+
+        cutoff = self.now - timedelta(days=90)
+        self.assertEqual(archive_read_notifications(cutoff, batch_size=1), 1)
+
+        self.assertEqual(
+            set(Notification.objects.values_list("pk", flat=True)),
+            {old_unread.pk, recent_read.pk},
+        )
+        archived = ArchivedNotification.objects.get()
+        self.assertEqual(archived.pk, old_read.pk)
+        self.assertEqual(archived.recipient, self.user)
+        self.assertEqual(archived.created_at, self.old)
+
+    def test_watermark_counts_as_read(self):
+        seen = self.notify(self.old)
+        unseen = self.notify(self.old + timedelta(days=1))
+        self.user.profile.notifications_read_at = self.old
+        self.user.profile.save()
+
+        archive_read_notifications(self.now - timedelta(days=90))
+        self.assertEqual(list(Notification.objects.all()), [unseen])
+        self.assertTrue(ArchivedNotification.objects.filter(pk=seen.pk).exists())
+
+    def test_dry_run_reports_without_archiving(self):
+        self.notify(self.old, read=True)
+        out = StringIO()
+        call_command("archive_inbox", "--dry-run", stdout=out)
+        self.assertIn("1 of 1 notifications would be archived", out.getvalue())
+        self.assertEqual(Notification.objects.count(), 1)
+
+        call_command("archive_inbox", stdout=StringIO())
+        self.assertEqual(Notification.objects.count(), 0)
+        self.assertEqual(ArchivedNotification.objects.count(), 1)
@@ -4,12 +4,26 @@ import json
 import unittest
 from unittest.mock import mock_open, patch
 
+import numpy as np
+
 from shapely.geometry import Point, shape
-from accounts.utilities import get_valid_nyc_coordinate
+from accounts.utilities import (
+    borough_for_district,
+    classify_nyc_coordinates,
+    get_community_district,
+    get_nyc_land_index,
+    get_valid_nyc_coordinate,
+    sample_nyc_coordinates,
+)
 
 
 class GetValidNYCCoordinateTest(unittest.TestCase):
     def setUp(self):
+        # The polygon index is cached per process; make each test load the
+        # (mocked) file itself and leave no dummy index behind.
+        get_nyc_land_index.cache_clear()
+        self.addCleanup(get_nyc_land_index.cache_clear)
+
         # Create a dummy GeoJSON that covers the entire NYC_BOUNDS defined in the function.
         # This polygon is a rectangle matching the bounding box.
         self.dummy_geojson = {
@@ -73,5 +87,34 @@ class GetValidNYCCoordinateTest(unittest.TestCase):
         self.assertTrue(polygon.contains(point))
 
 
+class NYCLandIndexTest(unittest.TestCase):
+    def test_classify_known_points(self):
+        districts = classify_nyc_coordinates(
+            [
+                (40.7580, -73.9855),  # Times Square
+                (40.6928, -73.9903),  # Downtown Brooklyn
+                (40.6000, -74.0500),  # Lower New York Bay
+            ]
+        )
+        self.assertEqual(districts, [105, 302, None])
+
+    def test_get_community_district_and_borough(self):
+        district = get_community_district(40.7580, -73.9855)
+        self.assertEqual(borough_for_district(district), "Manhattan")
+        self.assertIsNone(borough_for_district(None))
+
+    def test_index_is_built_once(self):
+        self.assertIs(get_nyc_land_index(), get_nyc_land_index())
+
+    def test_sample_returns_points_on_land(self):
+        coordinates = sample_nyc_coordinates(50, rng=np.random.default_rng(0))
+        self.assertEqual(len(coordinates), 50)
+        self.assertNotIn(None, classify_nyc_coordinates(coordinates))
+        # The same seed yields the same sample.
+        self.assertEqual(
+            coordinates, sample_nyc_coordinates(50, rng=np.random.default_rng(0))
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,13 +1,20 @@
 # accounts/tests/test_views.py
 
+import os
 import shutil
 import tempfile
+from unittest.mock import patch
 
+from django.db import connection
 from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth.models import User
+from django.core.files.base import ContentFile
 from django.core.files.uploadedfile import SimpleUploadedFile
+from storages.backends.s3boto3 import S3Boto3Storage
 from accounts.forms import VerificationForm
+from accounts.models import Notification, Profile
 
 # Create a temporary directory for MEDIA_ROOT during tests.
 TEMP_MEDIA_ROOT = tempfile.mkdtemp()
@@ -377,3 +384,234 @@ class AccountsViewsTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "accounts/notifications.html")
         self.assertIn("messages", response.context)
+
+
+class NotificationFeedTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="user", password="pass")
+        self.sender = User.objects.create_user(username="sender", password="pass")
+        self.client.login(username="user", password="pass")
+
+    def notify(self, count):
+        return [
+            Notification.objects.create(
+                sender=self.sender,
+                recipient=self.user,
+                subject=f"Subject {i}",
+                content="Content",
+            )
+            for i in range(count)
+        ]
+
+    def feed_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("user_notifications"))
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_visit_moves_watermark_without_flipping_read(self):
+        notifications = self.notify(3)
+        response = self.client.get(reverse("user_notifications"))
+        self.assertTrue(all(n.is_new for n in response.context["notifications"]))
+
+        self.user.profile.refresh_from_db()
+        self.assertEqual(
+            self.user.profile.notifications_read_at, notifications[-1].created_at
+        )
+        self.assertEqual(Notification.objects.filter(read=True).count(), 0)
+        self.assertEqual(Notification.objects.unread_for(self.user).count(), 0)
+
+        response = self.client.get(reverse("user_notifications"))
+        self.assertFalse(any(n.is_new for n in response.context["notifications"]))
+        self.assertEqual(response.context["unread_notification_count"], 0)
+
+    def test_query_count_does_not_grow_with_notifications(self):
+        self.notify(2)
+        self.feed_queries()
+        baseline = self.feed_queries()
+        self.notify(30)
+        self.feed_queries()
+        self.assertEqual(self.feed_queries(), baseline)
+
+    @patch("accounts.views.NOTIFICATIONS_PER_PAGE", 2)
+    def test_feed_is_paginated(self):
+        self.notify(3)
+        response = self.client.get(reverse("user_notifications"))
+        self.assertEqual(
+            [n.subject for n in response.context["notifications"]],
+            ["Subject 2", "Subject 1"],
+        )
+        response = self.client.get(
+            reverse("user_notifications"),
+            {"cursor": response.context["next_cursor"]},
+        )
+        self.assertEqual(
+            [n.subject for n in response.context["notifications"]], ["Subject 0"]
+        )
+        self.assertIsNone(response.context["next_cursor"])
+
+    @patch("accounts.views.NOTIFICATIONS_PER_PAGE", 2)
+    def test_delete_all_is_only_offered_on_the_first_page(self):
+        self.notify(3)
+        response = self.client.get(reverse("user_notifications"))
+        self.assertContains(response, 'name="up_to"')
+        response = self.client.get(
+            reverse("user_notifications"),
+            {"cursor": response.context["next_cursor"]},
+        )
+        self.assertNotContains(response, 'name="up_to"')
+
+
+class BulkNotificationsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="user", password="pass")
+        self.other = User.objects.create_user(username="other", password="pass")
+        self.notifications = [
+            Notification.objects.create(
+                recipient=self.user, subject=f"Subject {i}", content="Content"
+            )
+            for i in range(3)
+        ]
+        self.foreign = Notification.objects.create(
+            recipient=self.other, subject="Not yours", content="Content"
+        )
+        self.client.login(username="user", password="pass")
+        self.url = reverse("bulk_notifications")
+
+    def test_mark_selected_read_in_one_update(self):
+        ids = [self.notifications[0].id, self.notifications[1].id, self.foreign.id]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, {"action": "read", "ids": ids})
+        updates = [
+            q for q in queries if q["sql"].startswith('UPDATE "accounts_notification"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(response.url, reverse("user_notifications"))
+        self.assertEqual(
+            Notification.objects.filter(recipient=self.user, read=True).count(), 2
+        )
+        self.foreign.refresh_from_db()
+        self.assertFalse(self.foreign.read)
+
+    def test_delete_everything_up_to(self):
+        newer = Notification.objects.create(
+            recipient=self.user, subject="Arrived later", content="Content"
+        )
+        response = self.client.post(
+            self.url, {"action": "delete", "up_to": self.notifications[-1].id}
+        )
+        self.assertRedirects(response, reverse("user_notifications"))
+        self.assertEqual(
+            list(Notification.objects.filter(recipient=self.user)), [newer]
+        )
+        self.assertTrue(Notification.objects.filter(pk=self.foreign.pk).exists())
+
+    def test_requires_a_selection(self):
+        response = self.client.post(self.url, {"action": "delete"})
+        self.assertRedirects(response, reverse("user_notifications"))
+        self.assertEqual(Notification.objects.count(), 4)
+
+    def test_get_not_allowed(self):
+        self.assertEqual(self.client.get(self.url).status_code, 405)
+
+
+class VerificationDocumentTest(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.owner = User.objects.create_user(username="owner", password="pass")
+        self.owner.profile.verification_file.save(
+            "doc.pdf", ContentFile(b"%PDF-1.4 document")
+        )
+        self.url = reverse("verification_document", args=[self.owner.id])
+        self.path = self.owner.profile.verification_file.path
+
+    def test_owner_and_staff_can_view(self):
+        staff = User.objects.create_user(username="staff", is_staff=True)
+        for user in (self.owner, staff):
+            self.client.force_login(user)
+            response = self.client.get(self.url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(b"".join(response.streaming_content), b"%PDF-1.4 document")
+            self.assertIn("private", response["Cache-Control"])
+
+    def test_other_users_cannot_view(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 302)
+        other = User.objects.create_user(username="other")
+        self.client.force_login(other)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_no_document(self):
+        staff = User.objects.create_user(username="staff", is_staff=True)
+        self.client.force_login(staff)
+        response = self.client.get(reverse("verification_document", args=[staff.id]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_documents_are_not_public(self):
+        response = self.client.get("/verification_documents/doc.pdf")
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(VERIFICATION_SENDFILE="x-accel-redirect")
+    def test_x_accel_redirect(self):
+        self.client.force_login(self.owner)
+        response = self.client.get(self.url)
+        self.assertEqual(
+            response["X-Accel-Redirect"], "/protected/verification_documents/doc.pdf"
+        )
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertEqual(response.content, b"")
+
+    @override_settings(VERIFICATION_SENDFILE="x-accel-redirect")
+    def test_non_ascii_filename(self):
+        self.owner.profile.verification_file.save(
+            "résumé.pdf", ContentFile(b"%PDF-1.4 document")
+        )
+        self.client.force_login(self.owner)
+        response = self.client.get(self.url)
+        self.assertEqual(
+            response["X-Accel-Redirect"],
+            "/protected/verification_documents/r%C3%A9sum%C3%A9.pdf",
+        )
+        self.assertEqual(
+            response["Content-Disposition"],
+            "inline; filename*=utf-8''r%C3%A9sum%C3%A9.pdf",
+        )
+
+    def test_missing_file(self):
+        os.remove(self.path)
+        self.client.force_login(self.owner)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    @override_settings(VERIFICATION_SENDFILE="x-sendfile")
+    def test_x_sendfile(self):
+        self.client.force_login(self.owner)
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Sendfile"], self.path)
+        self.assertEqual(response.content, b"")
+
+    def test_remote_storage_redirects_to_signed_url(self):
+        bucket = S3Boto3Storage(
+            bucket_name="documents",
+            endpoint_url="http://minio.test:9000",
+            access_key="minio",
+            secret_key="minio-secret",
+            querystring_expire=300,
+            signature_version="s3v4",
+        )
+        field = Profile._meta.get_field("verification_file")
+        self.client.force_login(self.owner)
+        with patch.object(field, "storage", bucket):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(
+            response.url.startswith(
+                "http://minio.test:9000/documents/verification_documents/doc.pdf?"
+            )
+        )
+        self.assertIn("X-Amz-Signature=", response.url)
+        self.assertIn("X-Amz-Expires=300", response.url)
@@ -13,7 +13,10 @@ from .views import (
     change_email,
     admin_verify_user,
     admin_verification_requests,  # Add this
+    bulk_verification_requests,
+    verification_document,
     user_notifications,
+    bulk_notifications,
     admin_send_notification,
     admin_sent_notifications,
     debug_notification_counts,
@@ -38,8 +41,19 @@ urlpatterns = [
         admin_verification_requests,
         name="admin_verification_requests",
     ),
+    path(
+        "verification_document/<int:user_id>/",
+        verification_document,
+        name="verification_document",
+    ),
+    path(
+        "admin/verification_requests/bulk/",
+        bulk_verification_requests,
+        name="bulk_verification_requests",
+    ),
     # Other admin URLs
     path("notifications/", user_notifications, name="user_notifications"),
+    path("notifications/bulk/", bulk_notifications, name="bulk_notifications"),
     path(
         "admin/send_notification/",
         admin_send_notification,
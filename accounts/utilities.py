@@ -1,37 +1,138 @@
+import functools
 import json
-import random
+from pathlib import Path
 
-from shapely.geometry import Point, shape
+import numpy as np
+import shapely
+from shapely.geometry import shape
+from shapely.strtree import STRtree
+
+GEOJSON_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "data"
+    / "community-districts-polygon.geojson"
+)
+
+# Define NYC bounding box (approximate limits to sample within)
+NYC_BOUNDS = {
+    "min_lat": 40.477399,  # Southernmost point of NYC
+    "max_lat": 40.917577,  # Northernmost point of NYC
+    "min_lng": -74.259090,  # Westernmost point of NYC
+    "max_lng": -73.700272,  # Easternmost point of NYC
+}
+
+# The first digit of a community district code is its borough.
+BOROUGHS = {
+    1: "Manhattan",
+    2: "Bronx",
+    3: "Brooklyn",
+    4: "Queens",
+    5: "Staten Island",
+}
+
+
+class NYCLandIndex:
+    """
+    Spatial index over the NYC community-district polygons.
+
+    The polygons are prepared and stored in an STRtree, so testing a batch of
+    points is a single vectorised query instead of one shapely call per
+    polygon per point.
+    """
+
+    def __init__(self, geojson_data):
+        features = geojson_data["features"]
+        self.polygons = np.array([shape(feature["geometry"]) for feature in features])
+        self.districts = np.array(
+            [feature["properties"].get("communityDistrict") for feature in features],
+            dtype=object,
+        )
+        shapely.prepare(self.polygons)
+        self.tree = STRtree(self.polygons)
+
+    def _query(self, latitudes, longitudes):
+        points = shapely.points(np.asarray(longitudes), np.asarray(latitudes))
+        return self.tree.query(points, predicate="within")
+
+    def classify(self, latitudes, longitudes):
+        """
+        Return the community district of each point, or None for points that
+        are not on NYC land.
+        """
+        result = np.full(len(latitudes), None, dtype=object)
+        point_indices, polygon_indices = self._query(latitudes, longitudes)
+        result[point_indices] = self.districts[polygon_indices]
+        return result.tolist()
+
+    def sample(self, count, rng=None):
+        """Return ``count`` random (latitude, longitude) pairs on NYC land."""
+        rng = rng or np.random.default_rng()
+        coordinates = []
+        while len(coordinates) < count:
+            # Roughly half of the bounding box is land, so oversample.
+            batch = max(2 * (count - len(coordinates)), 100)
+            latitudes = rng.uniform(NYC_BOUNDS["min_lat"], NYC_BOUNDS["max_lat"], batch)
+            longitudes = rng.uniform(
+                NYC_BOUNDS["min_lng"], NYC_BOUNDS["max_lng"], batch
+            )
+            point_indices, _ = self._query(latitudes, longitudes)
+            for index in np.unique(point_indices):
+                coordinates.append((float(latitudes[index]), float(longitudes[index])))
+        return coordinates[:count]
+
+
+@functools.cache
+def get_nyc_land_index():
+    """
+    Load the NYC land polygons from the GeoJSON file on first use and keep
+    the index for the lifetime of the process. Call
+    ``get_nyc_land_index.cache_clear()`` to reload it.
+    """
+    with open(GEOJSON_PATH, "r") as file:
+        return NYCLandIndex(json.load(file))
 
 
 def get_valid_nyc_coordinate():
     """
-    Reads a GeoJSON file of NYC land boundaries and generates a random latitude
-    and longitude that falls within a land polygon.
+    Generates a random latitude and longitude that falls within a NYC land
+    polygon.
+    """
+    return get_nyc_land_index().sample(1)[0]
+
+
+def sample_nyc_coordinates(count, rng=None):
+    """
+    Generate ``count`` random (latitude, longitude) pairs that fall within a
+    NYC land polygon.
+
+    Args:
+        count (int): Number of coordinates to generate
+        rng: Optional numpy random Generator, for reproducible samples
+
+    Returns:
+        list: (latitude, longitude) tuples
     """
+    return get_nyc_land_index().sample(count, rng=rng)
 
-    geojson_path = "data/community-districts-polygon.geojson"
-    # Load GeoJSON file
-    with open(geojson_path, "r") as file:
-        geojson_data = json.load(file)
 
-    # Extract polygons from the GeoJSON file
-    polygons = [shape(feature["geometry"]) for feature in geojson_data["features"]]
+def classify_nyc_coordinates(coordinates):
+    """
+    Map (latitude, longitude) pairs to their community district codes
+    (e.g. 105 for Midtown Manhattan), with None for points off NYC land.
+    """
+    if not coordinates:
+        return []
+    latitudes, longitudes = zip(*coordinates)
+    return get_nyc_land_index().classify(latitudes, longitudes)
+
 
-    # Define NYC bounding box (approximate limits to sample within)
-    NYC_BOUNDS = {
-        "min_lat": 40.477399,  # Southernmost point of NYC
-        "max_lat": 40.917577,  # Northernmost point of NYC
-        "min_lng": -74.259090,  # Westernmost point of NYC
-        "max_lng": -73.700272,  # Easternmost point of NYC
-    }
+def get_community_district(latitude, longitude):
+    """Return the community district code of a single point, or None."""
+    return classify_nyc_coordinates([(latitude, longitude)])[0]
 
-    # Generate a valid coordinate within NYC land boundaries
-    while True:
-        latitude = random.uniform(NYC_BOUNDS["min_lat"], NYC_BOUNDS["max_lat"])
-        longitude = random.uniform(NYC_BOUNDS["min_lng"], NYC_BOUNDS["max_lng"])
-        point = Point(longitude, latitude)
 
-        # Ensure the point is inside at least one NYC land polygon
-        if any(polygon.contains(point) for polygon in polygons):
-            return latitude, longitude  # Return a valid coordinate
+def borough_for_district(district):
+    """Return the borough name of a community district code, or None."""
+    if district is None:
+        return None
+    return BOROUGHS.get(district // 100)
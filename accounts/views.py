@@ -6,17 +6,28 @@ from django.contrib.auth.forms import (
 )
 from django.shortcuts import redirect, render, get_object_or_404
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponseForbidden
+from django.db.models import Case, IntegerField, When
+from django.http import Http404, HttpResponseForbidden
+from django.views.decorators.http import require_POST
 from .forms import (
     EmailChangeForm,
     VerificationForm,
     AdminNotificationForm,
+    VerificationBulkForm,
 )  # Update import
-from .models import Notification, VerificationRequest
+from .models import Notification, Profile, VerificationRequest
+from .storage import document_response
 
 # Import the messaging model and User to send admin notifications.
+from messaging.forms import BulkActionForm
 from messaging.models import Message
 from django.contrib.auth.models import User
+from ParkEasy.pagination import keyset_page
+
+NOTIFICATIONS_PER_PAGE = 20
+NOTIFICATION_ORDERING = ["-created_at", "-id"]
+VERIFICATIONS_PER_PAGE = 100
+VERIFICATION_ORDERING = ["-created_at", "-id"]
 
 
 def home(request):
@@ -123,18 +134,58 @@ def admin_verification_requests(request):
             "You do not have permission to view verification requests."
         )
 
-    # Get all pending verification requests
-    verification_requests = VerificationRequest.objects.filter(
-        status="PENDING"
-    ).order_by("-created_at")
+    # Get a page of pending verification requests, newest first
+    cursor = request.GET.get("cursor")
+    verification_requests, next_cursor = keyset_page(
+        VerificationRequest.objects.filter(status="PENDING").select_related(
+            "user__profile"
+        ),
+        VERIFICATION_ORDERING,
+        cursor,
+        VERIFICATIONS_PER_PAGE,
+    )
 
     return render(
         request,
         "accounts/admin_verification_requests.html",
-        {"verification_requests": verification_requests},
+        {
+            "verification_requests": verification_requests,
+            "next_cursor": next_cursor,
+            "is_first_page": not cursor,
+            "success_message": request.session.pop("success_message", None),
+            "error_message": request.session.pop("error_message", None),
+        },
     )
 
 
+@login_required
+@require_POST
+def bulk_verification_requests(request):
+    """Approve or decline many pending verification requests at once."""
+    if not request.user.is_staff:
+        return HttpResponseForbidden("You do not have permission to verify users.")
+
+    form = VerificationBulkForm(request.POST)
+    if not form.is_valid():
+        request.session["error_message"] = " ".join(form.non_field_errors()) or (
+            "Invalid selection."
+        )
+        return redirect("admin_verification_requests")
+
+    pending = form.select(VerificationRequest.objects.filter(status="PENDING"))
+    if form.cleaned_data["action"] == "approve":
+        count = pending.approve(request.user)
+        request.session["success_message"] = (
+            f"{count} verification request(s) approved."
+        )
+    else:
+        count = pending.decline(request.user, form.cleaned_data["decline_reason"])
+        request.session["success_message"] = (
+            f"{count} verification request(s) declined."
+        )
+    return redirect("admin_verification_requests")
+
+
 @login_required
 def admin_verify_user(request, user_id):
     """
@@ -146,7 +197,9 @@ def admin_verify_user(request, user_id):
         return HttpResponseForbidden("You do not have permission to verify users.")
 
     # Get the user to verify
-    user_to_verify = get_object_or_404(User, pk=user_id)
+    user_to_verify = get_object_or_404(
+        User.objects.select_related("profile"), pk=user_id
+    )
 
     # Check if user is already verified
     if user_to_verify.profile.is_verified:
@@ -156,46 +209,22 @@ def admin_verify_user(request, user_id):
             {"already_verified": True, "username": user_to_verify.username},
         )
 
-    # Find the pending verification request
-    try:
-        verification_request = VerificationRequest.objects.get(
+    # Find the pending verification request, or else the most recent one
+    verification_request = user_to_verify.verification_requests.order_by(
+        Case(When(status="PENDING", then=0), default=1, output_field=IntegerField()),
+        "-created_at",
+    ).first()
+    if verification_request is None:
+        # Create a new request if none exists
+        verification_request = VerificationRequest.objects.create(
             user=user_to_verify, status="PENDING"
         )
-    except VerificationRequest.DoesNotExist:
-        # If no request exists, check if there are any older requests
-        has_request = VerificationRequest.objects.filter(user=user_to_verify).exists()
-        if not has_request:
-            # Create a new request if none exists
-            verification_request = VerificationRequest.objects.create(
-                user=user_to_verify, status="PENDING"
-            )
-        else:
-            # Get the most recent request
-            verification_request = (
-                VerificationRequest.objects.filter(user=user_to_verify)
-                .order_by("-created_at")
-                .first()
-            )
+    selected_request = VerificationRequest.objects.filter(pk=verification_request.pk)
 
     if request.method == "POST":
         if "confirm_verification" in request.POST:
-            # Process verification approval
-            user_to_verify.profile.is_verified = True
-            user_to_verify.profile.save()
-
-            # Update verification request status
-            verification_request.status = "APPROVED"
-            verification_request.save()
-
-            # Create a notification for the verified user
-            Notification.objects.create(
-                sender=request.user,
-                recipient=user_to_verify,
-                subject="Account Verification Approved",
-                content="Congratulations! Your account has been verified. \
-                    You can now post parking spots on ParkEasy.",
-                notification_type="VERIFICATION",
-            )
+            # Verify the user, approve the request and notify the user
+            selected_request.approve(request.user)
 
             # Show confirmation page
             return render(
@@ -222,21 +251,8 @@ def admin_verify_user(request, user_id):
                     },
                 )
 
-            # Update verification request status
-            verification_request.status = "DECLINED"
-            verification_request.decline_reason = decline_reason
-            verification_request.save()
-
-            # Create a notification for the user
-            Notification.objects.create(
-                sender=request.user,
-                recipient=user_to_verify,
-                subject="Account Verification Declined",
-                content=f"Your account verification has been declined for the following reason:\
-                    \n\n{decline_reason}\n\
-                        \nPlease submit a new verification request with updated information or documents.",
-                notification_type="VERIFICATION",
-            )
+            # Decline the request and notify the user
+            selected_request.decline(request.user, decline_reason)
 
             # Show confirmation page
             return render(
@@ -257,39 +273,103 @@ def admin_verify_user(request, user_id):
 
 
 @login_required
-def user_notifications(request):
+def verification_document(request, user_id):
     """
-    Display all notifications for the user, including system messages,
-    booking notifications, and admin messages.
+    Send a user's verification document to that user or to an admin. The
+    file itself is delivered by the storage or the web server.
     """
-    # Get all notifications for this user
-    notifications = Notification.objects.filter(recipient=request.user).order_by(
-        "-created_at"
+    if request.user.pk != user_id and not request.user.is_staff:
+        return HttpResponseForbidden(
+            "You do not have permission to view this document."
+        )
+    profile = get_object_or_404(
+        Profile.objects.only("verification_file"), user_id=user_id
     )
+    if not profile.verification_file:
+        raise Http404("No verification document was uploaded.")
+    return document_response(profile.verification_file)
 
-    # Mark all as read (do this before rendering the template)
-    Notification.objects.filter(recipient=request.user, read=False).update(read=True)
 
-    # Get verification messages from the Message model for backward compatibility
-    verification_messages = Message.objects.filter(
-        recipient=request.user, subject="Account Verification Approved"
-    ).order_by("-created_at")
+@login_required
+def user_notifications(request):
+    """
+    Display the user's notifications, newest first and a page at a time,
+    including system messages, booking notifications, and admin messages.
+    """
+    profile = request.user.profile
+    last_read_at = profile.notifications_read_at
+    cursor = request.GET.get("cursor")
+    notifications, next_cursor = keyset_page(
+        Notification.objects.filter(recipient=request.user).select_related("sender"),
+        NOTIFICATION_ORDERING,
+        cursor,
+        NOTIFICATIONS_PER_PAGE,
+    )
+    for notification in notifications:
+        notification.is_new = not notification.read and (
+            last_read_at is None or notification.created_at > last_read_at
+        )
 
-    # Mark verification messages as read too
-    Message.objects.filter(
-        recipient=request.user, subject="Account Verification Approved", read=False
-    ).update(read=True)
+    # Seeing the newest notification moves the read watermark up to it: one
+    # single-row UPDATE instead of flipping ``read`` on every notification.
+    if notifications and (
+        last_read_at is None or notifications[0].created_at > last_read_at
+    ):
+        profile.notifications_read_at = notifications[0].created_at
+        profile.save(update_fields=["notifications_read_at"])
+
+    verification_messages = []
+    if not cursor:
+        # Get verification messages from the Message model for backward
+        # compatibility
+        verification_messages = list(
+            Message.objects.filter(
+                recipient=request.user, subject="Account Verification Approved"
+            )
+            .select_related("sender")
+            .order_by("-created_at")
+        )
+        # Mark verification messages as read too
+        if any(not message.read for message in verification_messages):
+            Message.objects.filter(
+                recipient=request.user, subject="Account Verification Approved"
+            ).mark_read()
 
     return render(
         request,
         "accounts/notifications.html",
         {
             "notifications": notifications,
+            "next_cursor": next_cursor,
+            "is_first_page": not cursor,
             "verification_messages": verification_messages,
+            "success_message": request.session.pop("success_message", None),
+            "error_message": request.session.pop("error_message", None),
         },
     )
 
 
+@login_required
+@require_POST
+def bulk_notifications(request):
+    """Mark as read or delete many notifications with a single statement."""
+    form = BulkActionForm(request.POST)
+    if not form.is_valid():
+        request.session["error_message"] = " ".join(form.non_field_errors()) or (
+            "Invalid selection."
+        )
+        return redirect("user_notifications")
+
+    notifications = form.select(Notification.objects.filter(recipient=request.user))
+    if form.cleaned_data["action"] == "read":
+        count = notifications.filter(read=False).update(read=True)
+        request.session["success_message"] = f"{count} notification(s) marked as read."
+    else:
+        count, _ = notifications.delete()
+        request.session["success_message"] = f"{count} notification(s) deleted."
+    return redirect("user_notifications")
+
+
 @login_required
 def profile_view(request):
     # Get messages from session if present
@@ -495,9 +575,7 @@ def debug_notification_counts(request):
     """
     Simple view to debug notification counts
     """
-    unread_notifications = Notification.objects.filter(
-        recipient=request.user, read=False
-    )
+    unread_notifications = Notification.objects.unread_for(request.user)
 
     unread_messages = Message.objects.filter(
         recipient=request.user, read=False
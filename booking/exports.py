@@ -0,0 +1,106 @@
+"""
+Streaming exports of a host's booking history.
+
+Rows are generated from a queryset iterator with prefetched slots, so the
+memory used by an export stays flat however many bookings a host has.
+"""
+
+import csv
+import datetime as dt
+import json
+from decimal import Decimal
+
+from django.db.models import Exists, OuterRef
+
+from .models import Booking, BookingSlot
+
+EXPORT_FORMATS = ("csv", "jsonl")
+
+EXPORT_COLUMNS = [
+    "booking_id",
+    "listing_id",
+    "listing_title",
+    "guest",
+    "status",
+    "created_at",
+    "slots",
+    "hours",
+    "total_price",
+    "earnings",
+]
+
+# Bookings fetched per database round trip while streaming.
+EXPORT_CHUNK_SIZE = 500
+
+
+def host_bookings(host, start_date=None, end_date=None):
+    """
+    Bookings on the host's listings, oldest first. With a date range, only
+    bookings with a slot starting within [start_date, end_date] are kept.
+    """
+    bookings = Booking.objects.filter(listing__user=host)
+    if start_date or end_date:
+        slots = BookingSlot.objects.filter(booking=OuterRef("pk"))
+        if start_date:
+            slots = slots.filter(start_date__gte=start_date)
+        if end_date:
+            slots = slots.filter(start_date__lte=end_date)
+        bookings = bookings.filter(Exists(slots))
+    return (
+        bookings.select_related("listing", "user")
+        .prefetch_related("slots")
+        .order_by("created_at", "pk")
+    )
+
+
+def booking_record(booking):
+    """Flatten a booking and its prefetched slots into an export row."""
+    # Slot times are local wall-clock times, exported as such.
+    intervals = sorted(
+        (
+            dt.datetime.combine(slot.start_date, slot.start_time),
+            dt.datetime.combine(slot.end_date, slot.end_time),
+        )
+        for slot in booking.slots.all()
+    )
+    hours = sum((end - start).total_seconds() / 3600 for start, end in intervals)
+    # Only approved bookings earn the host money.
+    earnings = booking.total_price if booking.status == "APPROVED" else Decimal("0.00")
+    return {
+        "booking_id": booking.pk,
+        "listing_id": booking.listing_id,
+        "listing_title": booking.listing.title,
+        "guest": booking.user.username,
+        "status": booking.status,
+        "created_at": booking.created_at.isoformat(),
+        "slots": [
+            {"start": start.isoformat(), "end": end.isoformat()}
+            for start, end in intervals
+        ],
+        "hours": round(hours, 2),
+        "total_price": str(booking.total_price),
+        "earnings": str(earnings),
+    }
+
+
+class _Echo:
+    """File-like object whose write() returns the line for streaming."""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(bookings):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+    for booking in bookings.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        record = booking_record(booking)
+        record["slots"] = "; ".join(
+            f"{slot['start']} - {slot['end']}" for slot in record["slots"]
+        )
+        yield writer.writerow([record[column] for column in EXPORT_COLUMNS])
+
+
+def stream_jsonl(bookings):
+    for booking in bookings.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield json.dumps(booking_record(booking)) + "\n"
@@ -1,4 +1,12 @@
 from django.db import models
+from django.db.models import (
+    BooleanField,
+    Exists,
+    ExpressionWrapper,
+    OuterRef,
+    Q,
+    Subquery,
+)
 from django.contrib.auth.models import User
 from listings.models import Listing
 from django.core.mail import send_mail
@@ -9,6 +17,52 @@ from django.utils import timezone
 import datetime as dt
 
 
+def slot_moment_q(date_field, time_field, lookup, moment):
+    """
+    Q comparing a slot's (date, time) pair with a naive local datetime, e.g.
+    slot_moment_q("start_date", "start_time", "lte", now) for start <= now.
+    """
+    return Q(**{f"{date_field}__{lookup[:2]}": moment.date()}) | Q(
+        **{date_field: moment.date(), f"{time_field}__{lookup}": moment.time()}
+    )
+
+
+class BookingQuerySet(models.QuerySet):
+    def with_timeline(self, now=None):
+        """
+        Annotate each booking with its first slot start and last slot end
+        (timeline_start_date/_time, timeline_end_date/_time) and with the
+        status flags timeline_ongoing, timeline_within_24h and
+        timeline_passed, computed in SQL against ``now``. The matching
+        Booking properties use these annotations when present, and views
+        can filter and order on them.
+        """
+        now = timezone.localtime(now or timezone.now()).replace(tzinfo=None)
+        slots = BookingSlot.objects.filter(booking=OuterRef("pk"))
+        first_slot = slots.order_by("start_date", "start_time")
+        last_slot = slots.order_by("-end_date", "-end_time")
+        started = slot_moment_q("start_date", "start_time", "lte", now)
+        not_ended = slot_moment_q("end_date", "end_time", "gte", now)
+        starts_soon = slot_moment_q(
+            "start_date", "start_time", "gte", now
+        ) & slot_moment_q(
+            "start_date", "start_time", "lte", now + dt.timedelta(hours=24)
+        )
+        unfinished = slot_moment_q("end_date", "end_time", "gt", now)
+        return self.annotate(
+            timeline_start_date=Subquery(first_slot.values("start_date")[:1]),
+            timeline_start_time=Subquery(first_slot.values("start_time")[:1]),
+            timeline_end_date=Subquery(last_slot.values("end_date")[:1]),
+            timeline_end_time=Subquery(last_slot.values("end_time")[:1]),
+            timeline_ongoing=Exists(slots.filter(started & not_ended)),
+            timeline_within_24h=Exists(slots.filter(starts_soon)),
+            timeline_passed=ExpressionWrapper(
+                Exists(slots) & ~Exists(slots.filter(unfinished)),
+                output_field=BooleanField(),
+            ),
+        )
+
+
 class Booking(models.Model):
     STATUS_CHOICES = [
         ("PENDING", "Pending"),
@@ -25,6 +79,8 @@ class Booking(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = BookingQuerySet.as_manager()
+
     def __str__(self):
         return f"Booking #{self.pk} by {self.user.username} for {self.listing.title}"
 
@@ -74,36 +130,46 @@ class Booking(models.Model):
         """Check if booking has been reviewed."""
         return hasattr(self, "review")
 
+    def slot_datetimes(self):
+        """
+        Return (start, end) aware datetimes of the booking slots. Uses the
+        prefetched slots when the queryset prefetched them.
+        """
+        tz = timezone.get_current_timezone()
+        return [
+            (
+                timezone.make_aware(
+                    dt.datetime.combine(slot.start_date, slot.start_time), tz
+                ),
+                timezone.make_aware(
+                    dt.datetime.combine(slot.end_date, slot.end_time), tz
+                ),
+            )
+            for slot in self.slots.all()
+        ]
+
     @property
     def is_within_24_hours(self):
         """Check if any slot is within 24 hours from now."""
+        if hasattr(self, "timeline_within_24h"):
+            return self.timeline_within_24h
         now = timezone.now()
         time_threshold = now + dt.timedelta(hours=24)
-
-        for slot in self.slots.all():
-            slot_start = timezone.make_aware(
-                dt.datetime.combine(slot.start_date, slot.start_time),
-                timezone.get_current_timezone(),
-            )
-            if now <= slot_start <= time_threshold:
-                return True
-        return False
+        return any(
+            now <= slot_start <= time_threshold
+            for slot_start, _ in self.slot_datetimes()
+        )
 
     @property
     def has_passed(self):
         """Check if all booking slots have passed."""
-        if not self.slots.exists():
+        if hasattr(self, "timeline_passed"):
+            return self.timeline_passed
+        slots = self.slot_datetimes()
+        if not slots:
             return False
-
         now = timezone.now()
-        for slot in self.slots.all():
-            slot_end = timezone.make_aware(
-                dt.datetime.combine(slot.end_date, slot.end_time),
-                timezone.get_current_timezone(),
-            )
-            if slot_end > now:
-                return False
-        return True
+        return all(slot_end <= now for _, slot_end in slots)
 
     @property
     def can_be_reviewed(self):
@@ -113,24 +179,14 @@ class Booking(models.Model):
     @property
     def is_ongoing(self):
         """Check if any booking slot is currently active."""
+        if hasattr(self, "timeline_ongoing"):
+            return self.timeline_ongoing
         now = timezone.now()
-
-        for slot in self.slots.all():
-            # Convert start and end dates/times to datetime with timezone
-            slot_start = timezone.make_aware(
-                dt.datetime.combine(slot.start_date, slot.start_time),
-                timezone.get_current_timezone(),
-            )
-            slot_end = timezone.make_aware(
-                dt.datetime.combine(slot.end_date, slot.end_time),
-                timezone.get_current_timezone(),
-            )
-
-            # If current time is between start and end, booking is ongoing
-            if slot_start <= now <= slot_end:
-                return True
-
-        return False
+        # If current time is between start and end, booking is ongoing
+        return any(
+            slot_start <= now <= slot_end
+            for slot_start, slot_end in self.slot_datetimes()
+        )
 
 
 class BookingSlot(models.Model):
@@ -357,3 +357,74 @@ class BookingPropertiesTest(TestCase):
         )
         self.assertFalse(self.booking.is_ongoing)
         past_slot.delete()
+
+
+class BookingTimelineTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="timeline", password="12345")
+        self.listing = Listing.objects.create(
+            user=self.user,
+            title="Timeline Spot",
+            description="Timeline test",
+            rent_per_hour=10,
+            location="1 Timeline St",
+        )
+        self.now = timezone.make_aware(datetime.datetime(2025, 6, 10, 12, 0))
+
+    def create_booking(self, *offsets):
+        """Create a booking with one slot per (start, end) hour offset."""
+        booking = Booking.objects.create(user=self.user, listing=self.listing)
+        for start_hours, end_hours in offsets:
+            start = timezone.localtime(self.now) + datetime.timedelta(hours=start_hours)
+            end = timezone.localtime(self.now) + datetime.timedelta(hours=end_hours)
+            BookingSlot.objects.create(
+                booking=booking,
+                start_date=start.date(),
+                start_time=start.time(),
+                end_date=end.date(),
+                end_time=end.time(),
+            )
+        return booking
+
+    def test_flags_match_python_properties(self):
+        bookings = {
+            "past": self.create_booking((-50, -48), (-26, -25)),
+            "ongoing": self.create_booking((-1, 1)),
+            "soon": self.create_booking((-30, -29), (5, 6)),
+            "later": self.create_booking((48, 50)),
+            "empty": self.create_booking(),
+        }
+        annotated = {
+            booking.pk: booking
+            for booking in Booking.objects.with_timeline(now=self.now)
+        }
+        with patch("django.utils.timezone.now", return_value=self.now):
+            for name, booking in bookings.items():
+                row = annotated[booking.pk]
+                for flag in ("has_passed", "is_ongoing", "is_within_24_hours"):
+                    self.assertEqual(
+                        getattr(row, flag), getattr(booking, flag), (name, flag)
+                    )
+
+        self.assertTrue(annotated[bookings["past"].pk].timeline_passed)
+        self.assertTrue(annotated[bookings["ongoing"].pk].timeline_ongoing)
+        self.assertTrue(annotated[bookings["soon"].pk].timeline_within_24h)
+        self.assertFalse(annotated[bookings["empty"].pk].timeline_passed)
+
+    def test_first_start_and_last_end(self):
+        booking = self.create_booking((30, 31), (-2, -1), (5, 8))
+        row = Booking.objects.with_timeline(now=self.now).get(pk=booking.pk)
+        local_now = timezone.localtime(self.now)
+        first_start = local_now - datetime.timedelta(hours=2)
+        last_end = local_now + datetime.timedelta(hours=31)
+        self.assertEqual(row.timeline_start_date, first_start.date())
+        self.assertEqual(row.timeline_start_time, first_start.time())
+        self.assertEqual(row.timeline_end_date, last_end.date())
+        self.assertEqual(row.timeline_end_time, last_end.time())
+
+    def test_filter_on_flags(self):
+        past = self.create_booking((-5, -4))
+        upcoming = self.create_booking((4, 5))
+        bookings = Booking.objects.with_timeline(now=self.now)
+        self.assertEqual(list(bookings.filter(timeline_passed=True)), [past])
+        self.assertEqual(list(bookings.filter(timeline_passed=False)), [upcoming])
@@ -1,6 +1,13 @@
+import csv
 import datetime as dt
+import io
+import json
 
+from unittest.mock import patch
+
+from django.db import connection
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 
@@ -877,3 +884,167 @@ class RecurringBookingTests(TestCase):
 
         # Instead of checking context, check that no new booking was created
         self.assertEqual(Booking.objects.count(), 1)  # Still just the original booking
+
+
+class ExportHostBookingsTests(TestCase):
+    def setUp(self):
+        self.host = User.objects.create_user(username="host", password="pass123")
+        self.guest = User.objects.create_user(username="guest", password="pass123")
+        self.client = Client()
+        self.client.login(username="host", password="pass123")
+        self.listing = Listing.objects.create(
+            user=self.host,
+            title="Export Spot",
+            location="123 Main St",
+            rent_per_hour="5.00",
+            description="Export test",
+        )
+        self.day = dt.date(2025, 5, 1)
+        self.approved = self.create_booking("APPROVED", "20.00", self.day)
+        self.pending = self.create_booking(
+            "PENDING", "10.00", self.day + dt.timedelta(days=10)
+        )
+        # A booking on someone else's listing is never exported.
+        other_listing = Listing.objects.create(
+            user=self.guest,
+            title="Other Spot",
+            location="456 Side St",
+            rent_per_hour="5.00",
+            description="Not exported",
+        )
+        Booking.objects.create(
+            user=self.host, listing=other_listing, total_price="5.00"
+        )
+        self.url = reverse("export_host_bookings")
+
+    def create_booking(self, status, total_price, day):
+        booking = Booking.objects.create(
+            user=self.guest,
+            listing=self.listing,
+            status=status,
+            total_price=total_price,
+        )
+        BookingSlot.objects.create(
+            booking=booking,
+            start_date=day,
+            start_time=dt.time(9, 0),
+            end_date=day,
+            end_time=dt.time(13, 0),
+        )
+        return booking
+
+    def test_csv_export(self):
+        response = self.client.get(self.url, {"format": "csv"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        content = b"".join(response.streaming_content).decode()
+        rows = list(csv.DictReader(io.StringIO(content)))
+        self.assertEqual(
+            [int(row["booking_id"]) for row in rows],
+            [self.approved.pk, self.pending.pk],
+        )
+        self.assertEqual(rows[0]["guest"], "guest")
+        self.assertEqual(rows[0]["hours"], "4.0")
+        self.assertEqual(rows[0]["earnings"], "20.00")
+        self.assertEqual(rows[1]["earnings"], "0.00")
+        self.assertEqual(rows[0]["slots"], "2025-05-01T09:00:00 - 2025-05-01T13:00:00")
+
+    def test_jsonl_export_with_date_range(self):
+        response = self.client.get(
+            self.url,
+            {"format": "jsonl", "start_date": "2025-05-05", "end_date": "2025-05-31"},
+        )
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        records = [json.loads(line) for line in lines]
+        self.assertEqual([r["booking_id"] for r in records], [self.pending.pk])
+        self.assertEqual(records[0]["status"], "PENDING")
+        self.assertEqual(len(records[0]["slots"]), 1)
+
+    def test_invalid_parameters(self):
+        self.assertEqual(self.client.get(self.url, {"format": "xml"}).status_code, 400)
+        response = self.client.get(self.url, {"start_date": "05/01/2025"})
+        self.assertEqual(response.status_code, 400)
+
+
+class MyBookingsTests(TestCase):
+    def setUp(self):
+        self.host = User.objects.create_user(username="host", password="pass123")
+        self.guest = User.objects.create_user(username="guest", password="pass123")
+        self.client = Client()
+        self.client.login(username="guest", password="pass123")
+        self.listing = Listing.objects.create(
+            user=self.host,
+            title="Commute Spot",
+            location="123 Main St",
+            rent_per_hour="5.00",
+            description="My bookings test",
+        )
+
+    def add_bookings(self, count):
+        bookings = []
+        for i in range(count):
+            booking = Booking.objects.create(
+                user=self.guest,
+                listing=self.listing,
+                status="APPROVED",
+                total_price="5.00",
+            )
+            day = dt.date.today() + dt.timedelta(days=i - count // 2)
+            for hour in (8, 17):
+                BookingSlot.objects.create(
+                    booking=booking,
+                    start_date=day,
+                    start_time=dt.time(hour, 0),
+                    end_date=day,
+                    end_time=dt.time(hour + 1, 0),
+                )
+            bookings.append(booking)
+        return bookings
+
+    def page_query_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("my_bookings"))
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_bookings(self):
+        self.add_bookings(2)
+        baseline = self.page_query_count()
+        self.add_bookings(8)
+        self.assertEqual(self.page_query_count(), baseline)
+
+    @patch("booking.views.MY_BOOKINGS_PER_PAGE", 3)
+    def test_pagination_newest_first(self):
+        bookings = self.add_bookings(5)
+        response = self.client.get(reverse("my_bookings"), {"page": 2})
+        self.assertEqual(
+            [b.pk for b in response.context["bookings"]],
+            [bookings[1].pk, bookings[0].pk],
+        )
+        self.assertFalse(response.context["page_obj"].has_next())
+
+    def test_filter_upcoming_and_past(self):
+        bookings = {}
+        for days in (-3, -2, 2, 3):
+            booking = Booking.objects.create(user=self.guest, listing=self.listing)
+            day = dt.date.today() + dt.timedelta(days=days)
+            BookingSlot.objects.create(
+                booking=booking,
+                start_date=day,
+                start_time=dt.time(9, 0),
+                end_date=day,
+                end_time=dt.time(10, 0),
+            )
+            bookings[days] = booking.pk
+
+        response = self.client.get(reverse("my_bookings"), {"when": "past"})
+        self.assertEqual(
+            [b.pk for b in response.context["bookings"]],
+            [bookings[-2], bookings[-3]],
+        )
+        response = self.client.get(reverse("my_bookings"), {"when": "upcoming"})
+        self.assertEqual(
+            [b.pk for b in response.context["bookings"]],
+            [bookings[2], bookings[3]],
+        )
@@ -12,4 +12,5 @@ urlpatterns = [
     ),
     path("review/<int:booking_id>/", views.review_booking, name="review_booking"),
     path("available_times/", views.available_times, name="available_times"),
+    path("export/", views.export_host_bookings, name="export_host_bookings"),
 ]
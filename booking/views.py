@@ -3,7 +3,10 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 import datetime as dt
 from django.utils import timezone
-from django.http import JsonResponse
+from django.core.paginator import Paginator
+from django.db.models import Prefetch
+from django.http import HttpResponseBadRequest, JsonResponse, StreamingHttpResponse
+from .exports import EXPORT_FORMATS, host_bookings, stream_csv, stream_jsonl
 from .models import Booking, BookingSlot
 from .forms import (
     BookingForm,
@@ -21,6 +24,9 @@ from .utils import (
 )
 from accounts.models import Notification
 
+# Number of bookings per page of my_bookings
+MY_BOOKINGS_PER_PAGE = 20
+
 
 @login_required
 def available_times(request):
@@ -524,9 +530,37 @@ def review_booking(request, booking_id):
 
 @login_required
 def my_bookings(request):
-    user_bookings = Booking.objects.filter(user=request.user).order_by("-created_at")
+    # Listing, host and review are joined and the slots prefetched, and the
+    # status flags the template checks (is_ongoing, can_be_reviewed, ...)
+    # come from the with_timeline() annotations instead of per-booking work.
+    user_bookings = (
+        Booking.objects.filter(user=request.user)
+        .with_timeline()
+        .select_related("listing__user", "review")
+        .prefetch_related(
+            Prefetch(
+                "slots",
+                queryset=BookingSlot.objects.order_by("start_date", "start_time"),
+            )
+        )
+    )
+    when = request.GET.get("when")
+    if when == "upcoming":
+        user_bookings = user_bookings.filter(timeline_passed=False).order_by(
+            "timeline_start_date", "timeline_start_time", "id"
+        )
+    elif when == "past":
+        user_bookings = user_bookings.filter(timeline_passed=True).order_by(
+            "-timeline_end_date", "-timeline_end_time", "-id"
+        )
+    else:
+        when = ""
+        user_bookings = user_bookings.order_by("-created_at", "-id")
+    page_obj = Paginator(user_bookings, MY_BOOKINGS_PER_PAGE).get_page(
+        request.GET.get("page")
+    )
     now_naive = dt.datetime.now()
-    for booking in user_bookings:
+    for booking in page_obj:
         slots_info = []
         for slot in booking.slots.all():
             slot_dt = dt.datetime.combine(slot.start_date, slot.start_time)
@@ -539,7 +573,42 @@ def my_bookings(request):
                 }
             )
         booking.slots_info = slots_info
-    return render(request, "booking/my_bookings.html", {"bookings": user_bookings})
+    return render(
+        request,
+        "booking/my_bookings.html",
+        {"bookings": page_obj, "page_obj": page_obj, "when": when},
+    )
+
+
+@login_required
+def export_host_bookings(request):
+    """
+    Stream the bookings on the user's listings as CSV or JSON lines, with an
+    optional start_date/end_date (YYYY-MM-DD) range on the slot dates.
+    """
+    export_format = request.GET.get("format", "csv")
+    if export_format not in EXPORT_FORMATS:
+        return HttpResponseBadRequest("Unsupported export format.")
+    try:
+        start_date, end_date = (
+            dt.datetime.strptime(value, "%Y-%m-%d").date() if value else None
+            for value in (
+                request.GET.get("start_date"),
+                request.GET.get("end_date"),
+            )
+        )
+    except ValueError:
+        return HttpResponseBadRequest("Dates must use the YYYY-MM-DD format.")
+
+    bookings = host_bookings(request.user, start_date, end_date)
+    if export_format == "csv":
+        response = StreamingHttpResponse(stream_csv(bookings), content_type="text/csv")
+    else:
+        response = StreamingHttpResponse(
+            stream_jsonl(bookings), content_type="application/x-ndjson"
+        )
+    response["Content-Disposition"] = f'attachment; filename="bookings.{export_format}"'
+    return response
 
 
 def notify_owner_booking_created(booking):
@@ -19,9 +19,28 @@ class ListingAdmin(admin.ModelAdmin):
         "created_at",
         "rating_display",
     ]
-    list_filter = ["parking_spot_size", "has_ev_charger", "charger_level", "created_at"]
+    list_filter = [
+        "is_active",
+        "borough",
+        "parking_spot_size",
+        "has_ev_charger",
+        "charger_level",
+        "created_at",
+    ]
     search_fields = ["title", "description", "location", "user__username"]
-    readonly_fields = ["created_at", "updated_at", "avg_rating", "rating_count"]
+    readonly_fields = [
+        "created_at",
+        "updated_at",
+        "is_active",
+        "available_until",
+        "latitude",
+        "longitude",
+        "location_name",
+        "community_district",
+        "borough",
+        "avg_rating",
+        "rating_count",
+    ]
     inlines = [ListingSlotInline]
 
     fieldsets = (
@@ -40,7 +59,21 @@ class ListingAdmin(admin.ModelAdmin):
         ),
         (
             "Metadata",
-            {"fields": ("created_at", "updated_at", "avg_rating", "rating_count")},
+            {
+                "fields": (
+                    "created_at",
+                    "updated_at",
+                    "is_active",
+                    "available_until",
+                    "latitude",
+                    "longitude",
+                    "location_name",
+                    "community_district",
+                    "borough",
+                    "avg_rating",
+                    "rating_count",
+                )
+            },
         ),
     )
 
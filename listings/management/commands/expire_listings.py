@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from listings.models import (
+    Listing,
+    deactivate_expired_listings,
+    refresh_listing_availability,
+)
+
+
+class Command(BaseCommand):
+    help = "Deactivate listings whose last availability slot has ended."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Recompute is_active/available_until for every listing from its slots.",
+        )
+
+    def handle(self, *args, **options):
+        if options["rebuild"]:
+            listing_ids = Listing.objects.values_list("pk", flat=True)
+            rebuilt = 0
+            for listing_id in listing_ids.iterator():
+                refresh_listing_availability(listing_id)
+                rebuilt += 1
+            self.stdout.write(f"Rebuilt availability for {rebuilt} listings.")
+
+        deactivated = deactivate_expired_listings()
+        self.stdout.write(self.style.SUCCESS(f"Deactivated {deactivated} listings."))
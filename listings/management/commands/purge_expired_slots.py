@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from listings.models import ListingSlot, expired_slots_q, purge_expired_slots
+
+
+class Command(BaseCommand):
+    help = "Delete availability slots that have already ended."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of slots removed per DELETE statement.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many slots would be deleted.",
+        )
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            now = timezone.localtime().replace(tzinfo=None)
+            count = ListingSlot.objects.filter(expired_slots_q(now)).count()
+            self.stdout.write(f"{count} expired slots would be deleted.")
+            return
+
+        deleted = purge_expired_slots(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired slots."))
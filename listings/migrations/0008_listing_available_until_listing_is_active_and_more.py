@@ -0,0 +1,54 @@
+# Generated by Django 4.2.19 on 2026-10-18 23:35
+
+import datetime as dt
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_availability(apps, schema_editor):
+    Listing = apps.get_model("listings", "Listing")
+    ListingSlot = apps.get_model("listings", "ListingSlot")
+    now = timezone.now()
+    for listing in Listing.objects.all().iterator():
+        latest = (
+            ListingSlot.objects.filter(listing_id=listing.pk)
+            .order_by("-end_date", "-end_time")
+            .values_list("end_date", "end_time")
+            .first()
+        )
+        if not latest:
+            continue
+        available_until = timezone.make_aware(
+            dt.datetime.combine(*latest), timezone.get_current_timezone()
+        )
+        Listing.objects.filter(pk=listing.pk).update(
+            is_active=available_until > now, available_until=available_until
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("listings", "0007_listing_parking_spot_size"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="listing",
+            name="available_until",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="listing",
+            name="is_active",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name="listing",
+            index=models.Index(
+                fields=["is_active", "available_until"], name="listing_active_until_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_availability, migrations.RunPython.noop),
+    ]
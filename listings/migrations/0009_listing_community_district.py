@@ -0,0 +1,109 @@
+# Generated by Django 4.2.19 on 2026-10-18 23:53
+
+import json
+from pathlib import Path
+
+import numpy as np
+import shapely
+from django.db import migrations, models
+from shapely.geometry import shape
+from shapely.strtree import STRtree
+
+# Frozen copies of the helpers in accounts.utilities and listings.utils, so
+# later changes to the app code cannot change what this migration does.
+GEOJSON_PATH = (
+    Path(__file__).resolve().parent.parent.parent
+    / "data"
+    / "community-districts-polygon.geojson"
+)
+
+BOROUGHS = {
+    1: "Manhattan",
+    2: "Bronx",
+    3: "Brooklyn",
+    4: "Queens",
+    5: "Staten Island",
+}
+
+
+def extract_coordinates(location_string):
+    """Return (latitude, longitude) from "name [lat,lng]", or None."""
+    try:
+        coords = location_string.split("[")[1].strip("]").split(",")
+        return float(coords[0]), float(coords[1])
+    except (IndexError, ValueError):
+        return None
+
+
+def classify_coordinates(coordinates):
+    """Map (latitude, longitude) pairs to community district codes or None."""
+    if not coordinates:
+        return []
+    with open(GEOJSON_PATH, "r") as file:
+        features = json.load(file)["features"]
+    polygons = np.array([shape(feature["geometry"]) for feature in features])
+    districts = np.array(
+        [feature["properties"].get("communityDistrict") for feature in features],
+        dtype=object,
+    )
+    shapely.prepare(polygons)
+    latitudes, longitudes = zip(*coordinates)
+    points = shapely.points(np.asarray(longitudes), np.asarray(latitudes))
+    point_indices, polygon_indices = STRtree(polygons).query(points, predicate="within")
+    result = np.full(len(coordinates), None, dtype=object)
+    result[point_indices] = districts[polygon_indices]
+    return result.tolist()
+
+
+def backfill_community_district(apps, schema_editor):
+    Listing = apps.get_model("listings", "Listing")
+    listings = []
+    coordinates = []
+    for listing in Listing.objects.only("location").iterator():
+        point = extract_coordinates(listing.location)
+        if point is None:
+            continue
+        listings.append(listing)
+        coordinates.append(point)
+
+    # Classify all listings in one batch against the polygon index.
+    for listing, district in zip(listings, classify_coordinates(coordinates)):
+        listing.community_district = district
+        listing.borough = "" if district is None else BOROUGHS.get(district // 100, "")
+    Listing.objects.bulk_update(
+        listings, ["community_district", "borough"], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("listings", "0008_listing_available_until_listing_is_active_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="listing",
+            name="borough",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("Manhattan", "Manhattan"),
+                    ("Bronx", "Bronx"),
+                    ("Brooklyn", "Brooklyn"),
+                    ("Queens", "Queens"),
+                    ("Staten Island", "Staten Island"),
+                ],
+                db_index=True,
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="listing",
+            name="community_district",
+            field=models.PositiveSmallIntegerField(
+                blank=True, db_index=True, null=True
+            ),
+        ),
+        migrations.RunPython(backfill_community_district, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 4.2.19 on 2026-10-18 23:55
+
+from django.db import migrations, models
+
+
+# Frozen copies of the parsers in listings.utils, so later changes to the app
+# code cannot change what this migration does.
+def extract_coordinates(location_string):
+    """Return (latitude, longitude) from "name [lat,lng]", or (None, None)."""
+    try:
+        coords = location_string.split("[")[1].strip("]").split(",")
+        return float(coords[0]), float(coords[1])
+    except (IndexError, ValueError):
+        return None, None
+
+
+def simplify_location(location_string):
+    """Shorten a full address to "building, street, borough"."""
+    location_full = location_string.split("[")[0].strip()
+    if not location_full:
+        return ""
+
+    parts = [part.strip() for part in location_full.split(",")]
+    if len(parts) < 2:
+        return location_full
+
+    building = parts[0]
+    city = next(
+        (
+            part
+            for part in parts
+            if part in ["Brooklyn", "Manhattan", "Queens", "Bronx", "Staten Island"]
+        ),
+        "New York",
+    )
+    if any(
+        term in building.lower()
+        for term in ["school", "university", "college", "institute"]
+    ):
+        return f"{building}, {city}"
+    return f"{building}, {parts[1]}, {city}"
+
+
+def backfill_location_fields(apps, schema_editor):
+    Listing = apps.get_model("listings", "Listing")
+    listings = list(Listing.objects.only("location"))
+    for listing in listings:
+        listing.latitude, listing.longitude = extract_coordinates(listing.location)
+        listing.location_name = simplify_location(listing.location)
+    Listing.objects.bulk_update(
+        listings, ["latitude", "longitude", "location_name"], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("listings", "0009_listing_community_district"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="listing",
+            name="latitude",
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="listing",
+            name="location_name",
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name="listing",
+            name="longitude",
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_location_fields, migrations.RunPython.noop),
+    ]
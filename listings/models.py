@@ -3,12 +3,16 @@ import datetime as dt
 from django.contrib.auth.models import User
 from django.db import models
 from django.db.models import Max, Min
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 
-# extract coordinates from location string
-from .utils import extract_coordinates
+from accounts.utilities import BOROUGHS, borough_for_district, get_community_district
+from ParkEasy.db import delete_rows
 
-from .utils import simplify_location
+from .search_cache import invalidate_search_cache
+
+from .utils import extract_coordinates, simplify_location
 
 EV_CHARGER_LEVELS = [
     ("L1", "Level 1 (120V)"),
@@ -32,6 +36,17 @@ PARKING_SPOT_SIZES = [
     ("COMMERCIAL", "Truck/Commercial"),
 ]
 
+BOROUGH_CHOICES = [(name, name) for name in BOROUGHS.values()]
+
+# Listing fields recomputed by Listing.save whenever the location changes.
+LOCATION_DERIVED_FIELDS = (
+    "latitude",
+    "longitude",
+    "location_name",
+    "community_district",
+    "borough",
+)
+
 
 class Listing(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -42,20 +57,11 @@ class Listing(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    @property
-    def location_name(self):
-        """Returns a simplified version of the location string."""
-        return simplify_location(self.location)
-
-    @property
-    def latitude(self):
-        """Returns the latitude of the listing."""
-        return extract_coordinates(self.location)[0]
-
-    @property
-    def longitude(self):
-        """Returns the longitude of the listing."""
-        return extract_coordinates(self.location)[1]
+    # Derived from location on save (see parse_location), so read paths never
+    # parse the location string. Coordinates are None when it has none.
+    latitude = models.FloatField(null=True, blank=True, editable=False)
+    longitude = models.FloatField(null=True, blank=True, editable=False)
+    location_name = models.CharField(max_length=255, blank=True, editable=False)
 
     @property
     def avg_rating(self):
@@ -208,6 +214,54 @@ class Listing(models.Model):
         verbose_name="Parking Spot Size",
     )
 
+    # Materialised availability, kept in sync with the listing's slots so the
+    # browse pages can filter on an indexed column instead of joining slots.
+    is_active = models.BooleanField(default=False)
+    available_until = models.DateTimeField(null=True, blank=True)
+
+    # NYC community district (e.g. 302) and borough of the listing's
+    # coordinates, tagged on save for district/borough filters and counts.
+    community_district = models.PositiveSmallIntegerField(
+        null=True, blank=True, db_index=True
+    )
+    borough = models.CharField(
+        max_length=20, choices=BOROUGH_CHOICES, blank=True, db_index=True
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["is_active", "available_until"],
+                name="listing_active_until_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "location" in update_fields:
+            self.parse_location()
+            self.tag_community_district()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, *LOCATION_DERIVED_FIELDS}
+        super().save(*args, **kwargs)
+
+    def parse_location(self):
+        """Set the coordinate and display name fields from the location string."""
+        try:
+            self.latitude, self.longitude = extract_coordinates(self.location)
+        except ValueError:
+            self.latitude = self.longitude = None
+        self.location_name = simplify_location(self.location)
+
+    def tag_community_district(self):
+        """Set community_district and borough from the listing coordinates."""
+        self.community_district = None
+        if self.latitude is not None and self.longitude is not None:
+            self.community_district = get_community_district(
+                self.latitude, self.longitude
+            )
+        self.borough = borough_for_district(self.community_district) or ""
+
 
 class ListingSlot(models.Model):
     listing = models.ForeignKey(Listing, on_delete=models.CASCADE, related_name="slots")
@@ -220,6 +274,126 @@ class ListingSlot(models.Model):
         return f"{self.listing.title} slot: {self.start_date} {self.start_time} - {self.end_date} {self.end_time}"
 
 
+def refresh_listing_availability(listing_id, now=None):
+    """
+    Store the end of the latest slot of a listing on the listing row and flag
+    the listing as active if that end is still in the future.
+
+    Returns:
+        tuple: (is_active, available_until)
+    """
+    latest = (
+        ListingSlot.objects.filter(listing_id=listing_id)
+        .order_by("-end_date", "-end_time")
+        .values_list("end_date", "end_time")
+        .first()
+    )
+    available_until = None
+    if latest:
+        available_until = timezone.make_aware(
+            dt.datetime.combine(*latest), timezone.get_current_timezone()
+        )
+    now = now or timezone.now()
+    is_active = available_until is not None and available_until > now
+    Listing.objects.filter(pk=listing_id).update(
+        is_active=is_active, available_until=available_until
+    )
+    return is_active, available_until
+
+
+def listing_counts_by_district(queryset=None):
+    """
+    Count listings per community district in a single GROUP BY query.
+
+    Returns:
+        list: dicts with "borough", "community_district" and "count" keys
+    """
+    if queryset is None:
+        queryset = Listing.objects.all()
+    return list(
+        queryset.exclude(community_district=None)
+        .values("borough", "community_district")
+        .annotate(count=models.Count("id"))
+        .order_by("community_district")
+    )
+
+
+def listing_counts_by_borough(queryset=None):
+    """Return {borough: listing count} from a single GROUP BY query."""
+    if queryset is None:
+        queryset = Listing.objects.all()
+    return dict(
+        queryset.exclude(borough="")
+        .values_list("borough")
+        .annotate(count=models.Count("id"))
+        .order_by("borough")
+    )
+
+
+def deactivate_expired_listings(now=None):
+    """
+    Clear the active flag of listings whose last slot has ended.
+    Returns the number of listings deactivated.
+    """
+    now = now or timezone.now()
+    return Listing.objects.filter(is_active=True, available_until__lte=now).update(
+        is_active=False
+    )
+
+
+def expired_slots_q(now):
+    """
+    Q object matching slots that ended at or before ``now``, a naive local
+    datetime (slot dates and times are stored in local time).
+    """
+    return models.Q(end_date__lt=now.date()) | models.Q(
+        end_date=now.date(), end_time__lte=now.time()
+    )
+
+
+def purge_expired_slots(now=None, batch_size=1000):
+    """
+    Delete every ListingSlot that has already ended, ``batch_size`` rows per
+    DELETE statement, and keep the affected listings' availability in sync.
+    Returns the number of slots deleted.
+    """
+    now = now or timezone.now()
+    expired = ListingSlot.objects.filter(
+        expired_slots_q(timezone.localtime(now).replace(tzinfo=None))
+    )
+    deleted = 0
+    while True:
+        batch = list(expired.values_list("pk", "listing_id")[:batch_size])
+        if not batch:
+            break
+        # One DELETE statement without loading the rows or sending per-slot
+        # signals; the listings are synced once per batch below instead.
+        deleted += delete_rows(
+            ListingSlot.objects.filter(pk__in=[pk for pk, _ in batch])
+        )
+        Listing.objects.filter(
+            pk__in={listing_id for _, listing_id in batch}, slots__isnull=True
+        ).update(is_active=False, available_until=None)
+    deactivate_expired_listings(now=now)
+    if deleted:
+        invalidate_search_cache()
+    return deleted
+
+
+@receiver(post_save, sender=ListingSlot)
+@receiver(post_delete, sender=ListingSlot)
+def sync_listing_availability(sender, instance, **kwargs):
+    refresh_listing_availability(instance.listing_id)
+
+
+@receiver(post_save, sender=Listing)
+@receiver(post_delete, sender=Listing)
+@receiver(post_save, sender=ListingSlot)
+@receiver(post_delete, sender=ListingSlot)
+def expire_listing_searches(sender, instance, **kwargs):
+    invalidate_search_cache()
+
+
 class Review(models.Model):
     # Use a one-to-one relation to Booking so that each booking gets one review
     booking = models.OneToOneField(
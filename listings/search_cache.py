@@ -0,0 +1,148 @@
+import bisect
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import caches
+
+from .utils import filter_listings
+
+# Query parameters that do not change the search result itself.
+IGNORED_PARAMS = {"page", "ajax", "cursor"}
+
+VERSION_KEY = "listing_search:version"
+CURSOR_SALT = "listings.search_cursor"
+
+
+def _cache():
+    return caches["listing_search"]
+
+
+def _search_version():
+    version = _cache().get(VERSION_KEY)
+    if version is None:
+        # Seed from the clock so an evicted version never reuses an old number.
+        _cache().add(VERSION_KEY, int(time.time() * 1000), timeout=None)
+        version = _cache().get(VERSION_KEY)
+    return version
+
+
+def invalidate_search_cache():
+    """Make every cached search stale by bumping the cache version."""
+    try:
+        _cache().incr(VERSION_KEY)
+    except ValueError:
+        _search_version()
+
+
+def normalise_search_params(query_dict):
+    """
+    Return the search parameters of a request as a sorted list of
+    (name, value) pairs, dropping pagination and empty values.
+    """
+    params = []
+    for name in query_dict:
+        if name in IGNORED_PARAMS:
+            continue
+        for value in query_dict.getlist(name):
+            value = value.strip()
+            if value and value != "None":
+                params.append((name, value))
+    return sorted(params)
+
+
+def search_filter_hash(query_dict):
+    """Stable hash of the normalised search parameters of a request."""
+    return hashlib.sha256(
+        urlencode(normalise_search_params(query_dict)).encode()
+    ).hexdigest()
+
+
+def search_cache_key(query_dict):
+    return f"listing_search:{_search_version()}:{search_filter_hash(query_dict)}"
+
+
+def cached_search_results(all_listings, request):
+    """
+    Run filter_listings for a request, or reuse the result of an identical
+    earlier search.
+
+    Returns:
+        tuple: (results, error_messages, warning_messages) where results is
+        the ordered list of (listing_id, distance) pairs
+    """
+    key = search_cache_key(request.GET)
+    entry = _cache().get(key)
+    if entry is None:
+        listings, errors, warnings = filter_listings(all_listings, request)
+        entry = {
+            "results": [
+                (listing.id, getattr(listing, "distance", None)) for listing in listings
+            ],
+            "errors": errors,
+            "warnings": warnings,
+        }
+        _cache().set(key, entry, settings.LISTING_SEARCH_CACHE_TIMEOUT)
+    return entry["results"], list(entry["errors"]), list(entry["warnings"])
+
+
+def hydrate_results(all_listings, results):
+    """
+    Load the listings of (listing_id, distance) pairs in one query, keeping
+    their order. Listings that expired since the search was cached drop out.
+    """
+    by_id = all_listings.in_bulk([listing_id for listing_id, _ in results])
+    listings = []
+    for listing_id, distance in results:
+        listing = by_id.get(listing_id)
+        if listing is not None:
+            listing.distance = distance
+            listings.append(listing)
+    return listings
+
+
+def cached_filter_listings(all_listings, request):
+    """
+    Same contract as filter_listings, but backed by cached_search_results so
+    repeated searches only fetch the listings by primary key.
+    """
+    results, errors, warnings = cached_search_results(all_listings, request)
+    return hydrate_results(all_listings, results), errors, warnings
+
+
+def _sort_key(distance, listing_id):
+    # Search results are ordered by distance (missing distances last) and
+    # then by listing ID.
+    return (distance if distance is not None else float("inf"), listing_id)
+
+
+def encode_cursor(query_dict, last_result):
+    """Signed token pointing just past ``last_result`` for this search."""
+    listing_id, distance = last_result
+    return signing.dumps(
+        {"f": search_filter_hash(query_dict), "d": distance, "i": listing_id},
+        salt=CURSOR_SALT,
+    )
+
+
+def cursor_position(query_dict, results):
+    """
+    Index in ``results`` at which the page after the request's ``cursor``
+    starts, or None if there is no valid cursor for this search.
+    """
+    token = query_dict.get("cursor")
+    if not token:
+        return None
+    try:
+        cursor = signing.loads(token, salt=CURSOR_SALT)
+    except signing.BadSignature:
+        return None
+    if cursor.get("f") != search_filter_hash(query_dict):
+        return None
+    return bisect.bisect_right(
+        results,
+        _sort_key(cursor["d"], cursor["i"]),
+        key=lambda result: _sort_key(result[1], result[0]),
+    )
@@ -88,6 +88,7 @@ function removeLoadMoreButtons() {
 function loadMoreListings() {
   const loadMoreBtn = this;
   const nextPage = loadMoreBtn.getAttribute("data-next-page");
+  const nextCursor = loadMoreBtn.getAttribute("data-next-cursor");
   const listingsContainer = document.querySelector(".listings-container");
 
   // Show loading state
@@ -97,7 +98,13 @@ function loadMoreListings() {
 
   // Build URL with existing filters
   let url = new URL(window.location.href);
-  url.searchParams.set("page", nextPage);
+  // Resume from the cursor of the last page; the page number is the fallback
+  if (nextCursor) {
+    url.searchParams.set("cursor", nextCursor);
+    url.searchParams.delete("page");
+  } else {
+    url.searchParams.set("page", nextPage);
+  }
   url.searchParams.set("ajax", "1");
 
   fetch(url)
@@ -190,6 +197,7 @@ function loadMoreListings() {
       retryButton.id = "load-more-btn";
       retryButton.className = "btn btn-primary";
       retryButton.setAttribute("data-next-page", nextPage);
+      if (nextCursor) retryButton.setAttribute("data-next-cursor", nextCursor);
       retryButton.textContent = "Try Again";
       retryButton.addEventListener("click", loadMoreListings);
 
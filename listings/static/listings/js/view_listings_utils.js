@@ -122,6 +122,10 @@ function setupAdvancedFilters() {
         document.getElementById("connector_type_hidden").value = connectorType;
       }
 
+      // Borough
+      document.getElementById("borough_hidden").value =
+        document.getElementById("borough").value;
+
       // POSSIBLE BUG
       // Date and time for single booking
       if (filterType === "single") {
@@ -364,6 +368,11 @@ function applyAdvancedFilters() {
   // update or create parking spot size hidden input
   updateOrCreateHiddenInput(filterForm, "parking_spot_size", parkingSpotSize);
 
+  // Borough
+  const borough = document.getElementById("borough").value;
+  document.getElementById("borough_hidden").value = borough;
+  updateOrCreateHiddenInput(filterForm, "borough", borough);
+
   // Close the modal
   const modal = bootstrap.Modal.getInstance(
     document.getElementById("advanced-filters-modal")
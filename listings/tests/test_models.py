@@ -1,7 +1,16 @@
 import datetime as dt
 from django.test import TestCase
 from django.contrib.auth import get_user_model
-from listings.models import Listing, ListingSlot, Review
+from django.utils import timezone
+from listings.models import (
+    Listing,
+    ListingSlot,
+    Review,
+    deactivate_expired_listings,
+    listing_counts_by_borough,
+    listing_counts_by_district,
+    purge_expired_slots,
+)
 from ..utils import simplify_location
 
 User = get_user_model()
@@ -225,6 +234,215 @@ class ListingSlotModelTests(TestCase):
         self.assertEqual(str(slot), expected)
 
 
+class ListingAvailabilityTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="activeuser", password="pass")
+        self.listing = Listing.objects.create(
+            user=self.user,
+            title="Availability Listing",
+            location="1 Main St",
+            rent_per_hour="12.00",
+            description="Availability test",
+            parking_spot_size="STANDARD",
+        )
+        self.tomorrow = dt.date.today() + dt.timedelta(days=1)
+
+    def test_new_listing_is_inactive(self):
+        self.assertFalse(self.listing.is_active)
+        self.assertIsNone(self.listing.available_until)
+
+    def test_slot_save_activates_listing(self):
+        ListingSlot.objects.create(
+            listing=self.listing,
+            start_date=self.tomorrow,
+            start_time=dt.time(8, 0),
+            end_date=self.tomorrow + dt.timedelta(days=2),
+            end_time=dt.time(18, 0),
+        )
+        self.listing.refresh_from_db()
+        self.assertTrue(self.listing.is_active)
+        self.assertEqual(
+            timezone.localtime(self.listing.available_until).replace(tzinfo=None),
+            dt.datetime.combine(self.tomorrow + dt.timedelta(days=2), dt.time(18, 0)),
+        )
+
+    def test_slot_delete_deactivates_listing(self):
+        slot = ListingSlot.objects.create(
+            listing=self.listing,
+            start_date=self.tomorrow,
+            start_time=dt.time(8, 0),
+            end_date=self.tomorrow,
+            end_time=dt.time(18, 0),
+        )
+        slot.delete()
+        self.listing.refresh_from_db()
+        self.assertFalse(self.listing.is_active)
+        self.assertIsNone(self.listing.available_until)
+
+    def test_past_slot_keeps_listing_inactive(self):
+        yesterday = dt.date.today() - dt.timedelta(days=1)
+        ListingSlot.objects.create(
+            listing=self.listing,
+            start_date=yesterday,
+            start_time=dt.time(8, 0),
+            end_date=yesterday,
+            end_time=dt.time(18, 0),
+        )
+        self.listing.refresh_from_db()
+        self.assertFalse(self.listing.is_active)
+        self.assertIsNotNone(self.listing.available_until)
+
+    def test_deactivate_expired_listings(self):
+        ListingSlot.objects.create(
+            listing=self.listing,
+            start_date=self.tomorrow,
+            start_time=dt.time(8, 0),
+            end_date=self.tomorrow,
+            end_time=dt.time(18, 0),
+        )
+        later = timezone.now() + dt.timedelta(days=3)
+        self.assertEqual(deactivate_expired_listings(now=later), 1)
+        self.listing.refresh_from_db()
+        self.assertFalse(self.listing.is_active)
+        # Already inactive listings are not touched again.
+        self.assertEqual(deactivate_expired_listings(now=later), 0)
+
+
+class PurgeExpiredSlotsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="purgeuser", password="pass")
+        self.today = dt.date.today()
+
+    def _listing_with_slot(self, title, day):
+        listing = Listing.objects.create(
+            user=self.user,
+            title=title,
+            location="2 Main St",
+            rent_per_hour="12.00",
+            description="Purge test",
+            parking_spot_size="STANDARD",
+        )
+        ListingSlot.objects.create(
+            listing=listing,
+            start_date=day,
+            start_time=dt.time(8, 0),
+            end_date=day,
+            end_time=dt.time(18, 0),
+        )
+        return listing
+
+    def test_purge_deletes_only_expired_slots(self):
+        past = self._listing_with_slot("Past", self.today - dt.timedelta(days=2))
+        future = self._listing_with_slot("Future", self.today + dt.timedelta(days=2))
+        ListingSlot.objects.create(
+            listing=future,
+            start_date=self.today - dt.timedelta(days=3),
+            start_time=dt.time(8, 0),
+            end_date=self.today - dt.timedelta(days=3),
+            end_time=dt.time(9, 0),
+        )
+
+        self.assertEqual(purge_expired_slots(batch_size=1), 2)
+        self.assertFalse(past.slots.exists())
+        self.assertEqual(future.slots.count(), 1)
+
+        past.refresh_from_db()
+        future.refresh_from_db()
+        self.assertFalse(past.is_active)
+        self.assertIsNone(past.available_until)
+        self.assertTrue(future.is_active)
+
+    def test_purge_deactivates_listing_whose_last_slot_ended(self):
+        listing = self._listing_with_slot("Ending", self.today + dt.timedelta(days=1))
+        later = timezone.now() + dt.timedelta(days=3)
+        self.assertEqual(purge_expired_slots(now=later), 1)
+        listing.refresh_from_db()
+        self.assertFalse(listing.is_active)
+        self.assertIsNone(listing.available_until)
+
+
+class ListingLocationFieldsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="locuser", password="pass")
+
+    def test_fields_are_stored_on_save(self):
+        location = (
+            "383, Grand Street, Lower East Side, Manhattan Community Board 3, "
+            "Manhattan, New York County, New York, 10002, United States "
+            "[40.7155,-73.9880]"
+        )
+        Listing.objects.create(
+            user=self.user,
+            title="Grand Street",
+            location=location,
+            rent_per_hour="10.00",
+            description="Location test",
+        )
+        listing = Listing.objects.get()
+        self.assertEqual(listing.latitude, 40.7155)
+        self.assertEqual(listing.longitude, -73.9880)
+        self.assertEqual(listing.location_name, simplify_location(location))
+
+    def test_location_without_coordinates(self):
+        listing = Listing.objects.create(
+            user=self.user,
+            title="Nowhere",
+            location="Somewhere",
+            rent_per_hour="10.00",
+            description="Location test",
+        )
+        self.assertIsNone(listing.latitude)
+        self.assertIsNone(listing.longitude)
+        self.assertEqual(listing.location_name, "Somewhere")
+
+
+class ListingDistrictTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="districtuser", password="pass")
+
+    def create_listing(self, location):
+        return Listing.objects.create(
+            user=self.user,
+            title="District Listing",
+            location=location,
+            rent_per_hour="10.00",
+            description="District test",
+        )
+
+    def test_save_tags_district_and_borough(self):
+        listing = self.create_listing("Times Square [40.7580,-73.9855]")
+        self.assertEqual(listing.community_district, 105)
+        self.assertEqual(listing.borough, "Manhattan")
+
+    def test_location_change_retags(self):
+        listing = self.create_listing("Times Square [40.7580,-73.9855]")
+        listing.location = "Downtown Brooklyn [40.6928,-73.9903]"
+        listing.save(update_fields=["location"])
+        listing.refresh_from_db()
+        self.assertEqual(listing.community_district, 302)
+        self.assertEqual(listing.borough, "Brooklyn")
+
+    def test_location_without_coordinates_is_untagged(self):
+        listing = self.create_listing("Somewhere")
+        self.assertIsNone(listing.community_district)
+        self.assertEqual(listing.borough, "")
+
+    def test_counts_group_by_district(self):
+        self.create_listing("Times Square [40.7580,-73.9855]")
+        self.create_listing("Bryant Park [40.7536,-73.9832]")
+        self.create_listing("Downtown Brooklyn [40.6928,-73.9903]")
+        self.create_listing("Somewhere")
+
+        self.assertEqual(
+            listing_counts_by_district(),
+            [
+                {"borough": "Manhattan", "community_district": 105, "count": 2},
+                {"borough": "Brooklyn", "community_district": 302, "count": 1},
+            ],
+        )
+        self.assertEqual(listing_counts_by_borough(), {"Brooklyn": 1, "Manhattan": 2})
+
+
 class ReviewModelTests(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(username="reviewuser", password="pass")
@@ -1,5 +1,12 @@
-from django.test import TestCase
+from datetime import date, time, timedelta
+from unittest.mock import patch
 
+from django.contrib.auth.models import User
+from django.test import RequestFactory, TestCase
+
+from listings.models import Listing, ListingSlot
+
+from ..search_cache import cached_filter_listings, search_cache_key
 from ..utils import simplify_location
 
 
@@ -62,3 +69,59 @@ class SimplifyLocationTests(TestCase):
         # expected = "456 Elm St, Queens, Queens"
         expected = "456 Elm St, Queens, Queens"
         self.assertEqual(simplify_location(input_str), expected)
+
+
+class SearchCacheTests(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username="cacheuser", password="pass")
+        self.listing = Listing.objects.create(
+            user=self.user,
+            title="Cached Listing",
+            location="Cache St [40.7,-73.9]",
+            rent_per_hour="10.00",
+            description="Cache test",
+            parking_spot_size="STANDARD",
+        )
+        day = date.today() + timedelta(days=1)
+        ListingSlot.objects.create(
+            listing=self.listing,
+            start_date=day,
+            start_time=time(8, 0),
+            end_date=day,
+            end_time=time(18, 0),
+        )
+
+    def test_key_ignores_page_order_and_empty_values(self):
+        first = self.factory.get("/", {"max_price": "20", "lat": "40.7", "page": "2"})
+        second = self.factory.get(
+            "/", {"lat": "40.7", "radius": "", "max_price": "20", "ajax": "1"}
+        )
+        self.assertEqual(
+            search_cache_key(first.GET),
+            search_cache_key(second.GET),
+        )
+
+    def test_repeated_search_uses_cached_ids(self):
+        request = self.factory.get(
+            "/", {"max_price": "20", "lat": "40.7", "lng": "-73.9"}
+        )
+        listings, _, _ = cached_filter_listings(Listing.objects.all(), request)
+        self.assertEqual([listing.id for listing in listings], [self.listing.id])
+
+        with patch("listings.search_cache.filter_listings") as mock_filter:
+            cached, _, _ = cached_filter_listings(Listing.objects.all(), request)
+        mock_filter.assert_not_called()
+        self.assertEqual([listing.id for listing in cached], [self.listing.id])
+        self.assertEqual(cached[0].distance, listings[0].distance)
+
+    def test_listing_write_invalidates_cache(self):
+        request = self.factory.get("/", {"max_price": "20"})
+        key = search_cache_key(request.GET)
+        cached_filter_listings(Listing.objects.all(), request)
+
+        self.listing.rent_per_hour = "30.00"
+        self.listing.save()
+        self.assertNotEqual(search_cache_key(request.GET), key)
+        listings, _, _ = cached_filter_listings(Listing.objects.all(), request)
+        self.assertEqual(listings, [])
@@ -3,13 +3,16 @@ from decimal import Decimal
 from unittest.mock import patch
 
 from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from booking.models import Booking, BookingSlot
 from listings.models import Listing, ListingSlot
 
-from ..utils import extract_coordinates
+from ..utils import extract_coordinates, filter_listings
 
 
 # Updated helper function to build formset data for any count.
@@ -771,6 +774,59 @@ class ManageListingsTest(TestCase):
             self.assertTrue(hasattr(listing, "pending_bookings"))
             self.assertTrue(hasattr(listing, "approved_bookings"))
 
+    def add_bookings(self, count):
+        guest = User.objects.create_user(username=f"guest{count}", password="pass")
+        day = date.today() + timedelta(days=1)
+        for i in range(count):
+            for listing in (self.listing1, self.listing2):
+                booking = Booking.objects.create(
+                    user=guest,
+                    listing=listing,
+                    total_price=0,
+                    status="PENDING" if i % 2 else "APPROVED",
+                )
+                BookingSlot.objects.create(
+                    booking=booking,
+                    start_date=day,
+                    start_time=time(9, 0),
+                    end_date=day,
+                    end_time=time(10, 0),
+                )
+
+    def dashboard_query_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("manage_listings"))
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_bookings(self):
+        self.add_bookings(2)
+        baseline = self.dashboard_query_count()
+        # Session, user and navbar counts plus seven dashboard queries.
+        self.assertLessEqual(baseline, 15)
+
+        self.add_bookings(10)
+        self.assertEqual(self.dashboard_query_count(), baseline)
+
+    def test_bookings_split_by_status(self):
+        response = self.client.get(reverse("manage_listings"))
+        listing1, listing2 = response.context["listings"]
+        self.assertEqual([b.status for b in listing1.pending_bookings], ["PENDING"])
+        self.assertEqual(listing1.approved_bookings, [])
+        self.assertEqual([b.status for b in listing2.approved_bookings], ["APPROVED"])
+
+    @patch("listings.views.MANAGE_LISTINGS_PER_PAGE", 1)
+    def test_pagination(self):
+        response = self.client.get(reverse("manage_listings"), {"page": 2})
+        self.assertEqual(list(response.context["listings"]), [self.listing2])
+        self.assertFalse(response.context["page_obj"].has_next())
+
+    @patch("listings.views.MANAGE_LISTINGS_PER_PAGE", 1)
+    def test_delete_error_shows_page_of_listing(self):
+        response = self.client.get(reverse("delete_listing", args=[self.listing2.id]))
+        self.assertContains(response, "Cannot delete listing with pending bookings")
+        self.assertEqual(list(response.context["listings"]), [self.listing2])
+
 
 class ListingOwnerBookingTest(TestCase):
     def setUp(self):
@@ -1313,3 +1369,133 @@ class SpotSizeFilterTest(TestCase):
 #############################
 # End of tests.
 #############################
+
+
+class ViewListingsCursorTest(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(username="cursoruser", password="pass")
+        day = date.today() + timedelta(days=1)
+        self.listings = []
+        for i in range(12):
+            listing = Listing.objects.create(
+                user=self.user,
+                title=f"Cursor Listing {i}",
+                location=f"Cursor St {i} [40.{70 + i},-73.9]",
+                rent_per_hour=Decimal("10.00"),
+                description="Cursor test",
+                parking_spot_size="STANDARD",
+            )
+            ListingSlot.objects.create(
+                listing=listing,
+                start_date=day,
+                start_time=time(9, 0),
+                end_date=day,
+                end_time=time(17, 0),
+            )
+            self.listings.append(listing)
+        self.view_url = reverse("view_listings")
+
+    def test_cursor_resumes_after_first_page(self):
+        response = self.client.get(self.view_url)
+        first_page = [listing.id for listing in response.context["listings"]]
+        self.assertEqual(first_page, [listing.id for listing in self.listings[:10]])
+        self.assertTrue(response.context["has_next"])
+        cursor = response.context["next_cursor"]
+        self.assertTrue(cursor)
+
+        response = self.client.get(self.view_url, {"ajax": "1", "cursor": cursor})
+        second_page = [listing.id for listing in response.context["listings"]]
+        self.assertEqual(second_page, [listing.id for listing in self.listings[10:]])
+        self.assertFalse(response.context["has_next"])
+        self.assertIsNone(response.context["next_cursor"])
+
+    def test_cursor_resumes_after_cache_is_cleared(self):
+        response = self.client.get(self.view_url)
+        cursor = response.context["next_cursor"]
+
+        # Page 2 served by a worker without the cached search, after a
+        # listing from page 1 went away: the search runs again and the
+        # cursor still resumes right after the last listing shown.
+        caches["listing_search"].clear()
+        self.listings[0].delete()
+        with patch(
+            "listings.search_cache.filter_listings", wraps=filter_listings
+        ) as mock_filter:
+            response = self.client.get(self.view_url, {"ajax": "1", "cursor": cursor})
+        mock_filter.assert_called_once()
+        second_page = [listing.id for listing in response.context["listings"]]
+        self.assertEqual(second_page, [listing.id for listing in self.listings[10:]])
+        self.assertFalse(response.context["has_next"])
+
+    def test_cursor_follows_distance_order(self):
+        params = {"lat": "40.85", "lng": "-73.9"}
+        response = self.client.get(self.view_url, params)
+        cursor = response.context["next_cursor"]
+        response = self.client.get(
+            self.view_url, {**params, "ajax": "1", "cursor": cursor}
+        )
+        # Closest listings come first, so the last page holds the furthest ones.
+        second_page = [listing.id for listing in response.context["listings"]]
+        self.assertEqual(second_page, [self.listings[1].id, self.listings[0].id])
+
+    def test_cursor_from_other_search_is_ignored(self):
+        response = self.client.get(self.view_url)
+        cursor = response.context["next_cursor"]
+        response = self.client.get(
+            self.view_url, {"ajax": "1", "cursor": cursor, "max_price": "20"}
+        )
+        self.assertEqual(len(response.context["listings"]), 10)
+
+    def test_invalid_cursor_starts_from_first_page(self):
+        response = self.client.get(self.view_url, {"ajax": "1", "cursor": "bogus"})
+        self.assertEqual(
+            response.context["listings"][0].id,
+            self.listings[0].id,
+        )
+
+
+class BoroughFilterTest(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(username="boroughuser", password="pass")
+        day = date.today() + timedelta(days=1)
+        self.manhattan = Listing.objects.create(
+            user=self.user,
+            title="Manhattan Spot",
+            location="Times Square [40.7580,-73.9855]",
+            rent_per_hour=Decimal("10.00"),
+            description="Manhattan",
+        )
+        self.brooklyn = Listing.objects.create(
+            user=self.user,
+            title="Brooklyn Spot",
+            location="Downtown Brooklyn [40.6928,-73.9903]",
+            rent_per_hour=Decimal("10.00"),
+            description="Brooklyn",
+        )
+        for listing in (self.manhattan, self.brooklyn):
+            ListingSlot.objects.create(
+                listing=listing,
+                start_date=day,
+                start_time=time(9, 0),
+                end_date=day,
+                end_time=time(17, 0),
+            )
+        self.view_url = reverse("view_listings")
+
+    def test_filter_by_borough(self):
+        response = self.client.get(self.view_url, {"borough": "Brooklyn"})
+        self.assertEqual(list(response.context["listings"]), [self.brooklyn])
+        self.assertTrue(response.context["has_active_filters"])
+
+    def test_filter_by_district(self):
+        response = self.client.get(self.view_url, {"district": "105"})
+        self.assertEqual(list(response.context["listings"]), [self.manhattan])
+
+    def test_borough_counts_in_context(self):
+        response = self.client.get(self.view_url)
+        counts = {b["name"]: b["count"] for b in response.context["boroughs"]}
+        self.assertEqual(counts["Manhattan"], 1)
+        self.assertEqual(counts["Brooklyn"], 1)
+        self.assertEqual(counts["Queens"], 0)
@@ -133,6 +133,8 @@ def has_active_filters(request):
     # Check non-recurring filters first
     non_recurring_filters = [
         "max_price",
+        "borough",
+        "district",
         "has_ev_charger",
         "charger_level",
         "connector_type",
@@ -192,6 +194,17 @@ def filter_listings(all_listings, request):
         except ValueError:
             pass
 
+    # Borough and community district are indexed columns tagged on save
+    borough = request.GET.get("borough")
+    if borough:
+        all_listings = all_listings.filter(borough=borough)
+    district = request.GET.get("district")
+    if district:
+        try:
+            all_listings = all_listings.filter(community_district=int(district))
+        except ValueError:
+            pass
+
     filter_type = request.GET.get("filter_type", "single")
 
     # Single date/time filter
@@ -400,6 +413,11 @@ def filter_listings(all_listings, request):
             search_lng = float(search_lng)
 
             for listing in all_listings:
+                if listing.latitude is None or listing.longitude is None:
+                    # No coordinates in the location string
+                    listing.distance = None
+                    processed_listings.append(listing)
+                    continue
                 try:
                     distance = calculate_distance(
                         search_lat, search_lng, listing.latitude, listing.longitude
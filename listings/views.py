@@ -6,8 +6,12 @@ from django.contrib.auth.models import User
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.paginator import Paginator
 from django.db import models
+from django.db.models import Prefetch
 from django.forms import inlineformset_factory
 from django.shortcuts import get_object_or_404, redirect, render
+from django.utils import timezone
+
+from booking.models import Booking
 
 from .forms import (
     ListingForm,
@@ -16,16 +20,23 @@ from .forms import (
     validate_non_overlapping_slots,
 )
 from .models import (
+    BOROUGH_CHOICES,
     EV_CHARGER_LEVELS,
     EV_CONNECTOR_TYPES,
     PARKING_SPOT_SIZES,
     Listing,
     ListingSlot,
+    expired_slots_q,
+    listing_counts_by_borough,
 )
-from .utils import (
-    filter_listings,
-    has_active_filters,
+from .search_cache import (
+    cached_filter_listings,
+    cached_search_results,
+    cursor_position,
+    encode_cursor,
+    hydrate_results,
 )
+from .utils import has_active_filters
 
 # Add this new function for API support
 from django.http import JsonResponse
@@ -84,6 +95,12 @@ ListingSlotFormSetEdit = inlineformset_factory(
     Listing, ListingSlot, form=ListingSlotForm, extra=0, can_delete=True
 )
 
+# Number of listing cards returned per page of the browse view
+LISTINGS_PER_PAGE = 10
+
+# Number of listings per page of the host dashboard
+MANAGE_LISTINGS_PER_PAGE = 20
+
 # Define half-hour choices for use in the search form
 HALF_HOUR_CHOICES = [
     (f"{hour:02d}:{minute:02d}", f"{hour:02d}:{minute:02d}")
@@ -300,10 +317,7 @@ def edit_listing(request, listing_id):
             slot_formset.save()
 
             # Delete any timeslots that have already passed.
-            for slot in listing.slots.all():
-                slot_end = datetime.combine(slot.end_date, slot.end_time)
-                if slot_end <= datetime.now():
-                    slot.delete()
+            listing.slots.filter(expired_slots_q(datetime.now())).delete()
 
             # Merge continuous slots if needed.
             merge_listing_slots(listing)
@@ -314,13 +328,7 @@ def edit_listing(request, listing_id):
             alert_message = "Please correct the errors below."
     else:
         # GET: Pre-process timeslots.
-        all_slots = listing.slots.all()
-        non_passed_ids = [
-            slot.id
-            for slot in all_slots
-            if datetime.combine(slot.end_date, slot.end_time) > current_dt
-        ]
-        non_passed_qs = listing.slots.filter(id__in=non_passed_ids)
+        non_passed_qs = listing.slots.exclude(expired_slots_q(current_dt))
         listing_form = ListingForm(instance=listing)
         slot_formset = ListingSlotFormSetEdit(
             instance=listing, prefix="form", queryset=non_passed_qs
@@ -354,17 +362,19 @@ def edit_listing(request, listing_id):
     )
 
 
-def view_listings(request):
-    current_datetime = datetime.now()
+def active_listings():
+    """
+    Listings with at least one slot that has not yet ended, ordered by ID so
+    search results (shared with the search cache) have a stable order.
+    """
+    return Listing.objects.filter(
+        is_active=True, available_until__gt=timezone.now()
+    ).order_by("id")
 
-    # This query returns listings with at least one slot that has not yet ended.
-    all_listings = Listing.objects.filter(
-        models.Q(slots__end_date__gt=current_datetime.date())
-        | models.Q(
-            slots__end_date=current_datetime.date(),
-            slots__end_time__gt=current_datetime.time(),
-        )
-    ).distinct()
+
+def view_listings(request):
+    # Listings with at least one slot that has not yet ended.
+    all_listings = active_listings()
 
     error_messages = []
     warning_messages = []
@@ -375,38 +385,50 @@ def view_listings(request):
     if success_message:
         success_messages.append(success_message)
 
-    processed_listings, filter_errors, filter_warnings = filter_listings(
+    results, filter_errors, filter_warnings = cached_search_results(
         all_listings, request
     )
     error_messages.extend(filter_errors)
     warning_messages.extend(filter_warnings)
 
-    # Process the listings before pagination
-    for listing in processed_listings:
+    # Resume after the cursor sent by the infinite scroll, falling back to
+    # the page number for plain links.
+    try:
+        page_number = max(int(request.GET.get("page", 1)), 1)
+    except ValueError:
+        page_number = 1
+    start = cursor_position(request.GET, results)
+    if start is None:
+        start = (page_number - 1) * LISTINGS_PER_PAGE
+    # Fetch one extra result to know whether there is a next page.
+    end = start + LISTINGS_PER_PAGE + 1
+    page_results = results[start:end]
+    has_next = len(page_results) > LISTINGS_PER_PAGE
+    page_results = page_results[:LISTINGS_PER_PAGE]
+    page_listings = hydrate_results(all_listings, page_results)
+
+    # Only the listings on this page need their availability data
+    for listing in page_listings:
         # Set availability data
         try:
             earliest_slot = listing.slots.earliest("start_date", "start_time")
             listing.available_from = earliest_slot.start_date
             listing.available_time_from = earliest_slot.start_time
-            latest_slot = listing.slots.latest("end_date", "end_time")
-            listing.available_until = latest_slot.end_date
-            listing.available_time_until = latest_slot.end_time
         except listing.slots.model.DoesNotExist:
             listing.available_from = None
             listing.available_time_from = None
-            listing.available_until = None
+        # The latest slot end is stored on the listing itself.
+        if listing.available_until:
+            available_until = timezone.localtime(listing.available_until)
+            listing.available_time_until = available_until.time()
+        else:
             listing.available_time_until = None
 
         # Explicitly mark listings as available in the main listings view
         listing.user_profile_available = True
 
-    # Continue with pagination
-    paginator = Paginator(processed_listings, 10)
-    page_number = request.GET.get("page", 1)
-    page_obj = paginator.get_page(page_number)
-
     context = {
-        "listings": page_obj,
+        "listings": page_listings,
         "half_hour_choices": HALF_HOUR_CHOICES,
         "filter_type": request.GET.get("filter_type", "single"),
         "max_price": request.GET.get("max_price", ""),
@@ -424,8 +446,11 @@ def view_listings(request):
         "recurring_end_time": request.GET.get("recurring_end_time", ""),
         "recurring_weeks": request.GET.get("recurring_weeks", "4"),
         "recurring_overnight": "on" if request.GET.get("recurring_overnight") else "",
-        "has_next": page_obj.has_next(),
-        "next_page": int(page_number) + 1 if page_obj.has_next() else None,
+        "has_next": has_next,
+        "next_page": page_number + 1 if has_next else None,
+        "next_cursor": (
+            encode_cursor(request.GET, page_results[-1]) if has_next else None
+        ),
         "error_messages": error_messages,
         "warning_messages": warning_messages,
         "success_messages": success_messages,
@@ -438,19 +463,19 @@ def view_listings(request):
 
     if request.GET.get("ajax") == "1":
         return render(request, "listings/partials/listing_cards.html", context)
+
+    # Active listings per borough for the filter, from one GROUP BY query
+    borough_counts = listing_counts_by_borough(all_listings)
+    context["boroughs"] = [
+        {"name": name, "count": borough_counts.get(name, 0)}
+        for name, _ in BOROUGH_CHOICES
+    ]
     return render(request, "listings/view_listings.html", context)
 
 
 def map_view_listings(request):
-    current_datetime = datetime.now()
-    all_listings = Listing.objects.filter(
-        models.Q(slots__end_date__gt=current_datetime.date())
-        | models.Q(
-            slots__end_date=current_datetime.date(),
-            slots__end_time__gt=current_datetime.time(),
-        )
-    ).distinct()
-    processed_listings, filter_errors, filter_warnings = filter_listings(
+    all_listings = active_listings()
+    processed_listings, filter_errors, filter_warnings = cached_filter_listings(
         all_listings, request
     )
 
@@ -480,32 +505,66 @@ def map_view_listings(request):
     return JsonResponse({"markers": markers})
 
 
-def manage_listings(request):
-    owner_listings = Listing.objects.filter(user=request.user)
-    for listing in owner_listings:
-        listing.pending_bookings = listing.booking_set.filter(status="PENDING")
-        listing.approved_bookings = listing.booking_set.filter(status="APPROVED")
-    return render(
-        request, "listings/manage_listings.html", {"listings": owner_listings}
+def host_dashboard_listings(user):
+    """
+    The user's listings with their slots and their pending and approved
+    bookings (with guests and booked slots) prefetched, so the dashboard
+    renders from a fixed number of queries however many bookings there are.
+    """
+    bookings = (
+        Booking.objects.select_related("user")
+        .prefetch_related("slots")
+        .order_by("created_at", "id")
+    )
+    return (
+        Listing.objects.filter(user=user)
+        .prefetch_related(
+            Prefetch(
+                "slots",
+                queryset=ListingSlot.objects.order_by("start_date", "start_time"),
+            ),
+            Prefetch(
+                "booking_set",
+                queryset=bookings.filter(status="PENDING"),
+                to_attr="pending_bookings",
+            ),
+            Prefetch(
+                "booking_set",
+                queryset=bookings.filter(status="APPROVED"),
+                to_attr="approved_bookings",
+            ),
+        )
+        .order_by("id")
     )
 
 
+def render_manage_listings(request, page_number=None, extra_context=None):
+    paginator = Paginator(
+        host_dashboard_listings(request.user), MANAGE_LISTINGS_PER_PAGE
+    )
+    page_obj = paginator.get_page(page_number or request.GET.get("page"))
+    context = {"listings": page_obj, "page_obj": page_obj, **(extra_context or {})}
+    return render(request, "listings/manage_listings.html", context)
+
+
+@login_required
+def manage_listings(request):
+    return render_manage_listings(request)
+
+
 @login_required
 def delete_listing(request, listing_id):
     listing = get_object_or_404(Listing, id=listing_id, user=request.user)
     active_bookings = listing.booking_set.filter(status__in=["PENDING", "APPROVED"])
     if active_bookings.exists():
-        owner_listings = Listing.objects.filter(user=request.user)
-        for lst in owner_listings:
-            lst.pending_bookings = lst.booking_set.filter(status="PENDING")
-            lst.approved_bookings = lst.booking_set.filter(status="APPROVED")
-        return render(
+        # Show the dashboard page that contains the listing
+        position = Listing.objects.filter(user=request.user, id__lt=listing.id).count()
+        return render_manage_listings(
             request,
-            "listings/manage_listings.html",
-            {
-                "listings": owner_listings,
+            page_number=position // MANAGE_LISTINGS_PER_PAGE + 1,
+            extra_context={
                 "delete_error": "Cannot delete listing with pending bookings. Please handle those first.",
-                "error_listing_id": listing_id,
+                "error_listing_id": listing.id,
             },
         )
     if request.method == "POST":
@@ -1,6 +1,6 @@
 # Register your models here.
 from django.contrib import admin
-from .models import Message
+from .models import ContactPair, Message
 
 
 @admin.register(Message)
@@ -8,3 +8,11 @@ class MessageAdmin(admin.ModelAdmin):
     list_display = ("id", "sender", "recipient", "subject", "created_at", "read")
     list_filter = ("read", "created_at")
     search_fields = ("sender__username", "recipient__username", "subject", "body")
+
+
+@admin.register(ContactPair)
+class ContactPairAdmin(admin.ModelAdmin):
+    list_display = ("id", "user", "contact", "created_at")
+    list_select_related = ("user", "contact")
+    search_fields = ("user__username", "contact__username")
+    raw_id_fields = ("user", "contact")
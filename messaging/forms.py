@@ -19,3 +19,46 @@ class MessageForm(forms.ModelForm):
     class Meta:
         model = Message
         fields = ["recipient", "subject", "body"]
+
+
+class IDListField(forms.Field):
+    """A list of integer IDs sent as repeated form values."""
+
+    widget = forms.MultipleHiddenInput
+
+    def to_python(self, value):
+        try:
+            return [int(item) for item in value or []]
+        except (TypeError, ValueError):
+            raise forms.ValidationError("Invalid selection.")
+
+
+class BulkActionForm(forms.Form):
+    """
+    Mark as read or delete the rows with the given ``ids``, or every row up
+    to ``up_to``: the newest ID on the page the user was looking at, so rows
+    that arrived after the page was rendered are left alone.
+    """
+
+    MAX_IDS = 1000
+
+    action = forms.ChoiceField(choices=[("read", "Mark as read"), ("delete", "Delete")])
+    ids = IDListField(required=False)
+    up_to = forms.IntegerField(required=False, min_value=1)
+
+    def clean(self):
+        cleaned_data = super().clean()
+        ids = cleaned_data.get("ids")
+        if not ids and not cleaned_data.get("up_to"):
+            raise forms.ValidationError("Nothing was selected.")
+        if ids and len(ids) > self.MAX_IDS:
+            raise forms.ValidationError(
+                f"You can select at most {self.MAX_IDS} items at once."
+            )
+        return cleaned_data
+
+    def select(self, queryset):
+        """Narrow ``queryset`` to the selected rows."""
+        if self.cleaned_data["ids"]:
+            return queryset.filter(pk__in=self.cleaned_data["ids"])
+        return queryset.filter(pk__lte=self.cleaned_data["up_to"])
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.19 on 2026-10-19 00:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("messaging", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(
+                fields=["recipient", "read", "-created_at", "-id"],
+                name="message_inbox_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(
+                fields=["sender", "-created_at", "-id"], name="message_sent_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 4.2.19 on 2026-10-19 00:03
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_contact_pairs(apps, schema_editor):
+    Booking = apps.get_model("booking", "Booking")
+    ContactPair = apps.get_model("messaging", "ContactPair")
+    pairs = (
+        Booking.objects.values_list("user_id", "listing__user_id")
+        .distinct()
+        .iterator(chunk_size=5000)
+    )
+    rows = []
+    for guest_id, host_id in pairs:
+        if guest_id == host_id:
+            continue
+        rows.append(ContactPair(user_id=guest_id, contact_id=host_id))
+        rows.append(ContactPair(user_id=host_id, contact_id=guest_id))
+        if len(rows) >= 5000:
+            ContactPair.objects.bulk_create(rows, ignore_conflicts=True)
+            rows = []
+    ContactPair.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("messaging", "0002_message_mailbox_indexes"),
+        ("booking", "0004_booking_email"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContactPair",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "contact",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="contact_pairs",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="contactpair",
+            constraint=models.UniqueConstraint(
+                fields=("user", "contact"), name="unique_contact_pair"
+            ),
+        ),
+        migrations.RunPython(backfill_contact_pairs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,183 @@
+# Generated by Django 4.2.19 on 2026-10-19 00:05
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+import django.db.models.deletion
+import django.utils.timezone
+
+BATCH_SIZE = 5000
+
+
+def backfill_conversations(apps, schema_editor):
+    Message = apps.get_model("messaging", "Message")
+    Conversation = apps.get_model("messaging", "Conversation")
+    ConversationMember = apps.get_model("messaging", "ConversationMember")
+
+    pairs = {
+        (min(sender_id, recipient_id), max(sender_id, recipient_id))
+        for sender_id, recipient_id in Message.objects.values_list(
+            "sender_id", "recipient_id"
+        )
+        .distinct()
+        .iterator(chunk_size=BATCH_SIZE)
+    }
+    pairs = sorted(pairs)
+    for start in range(0, len(pairs), BATCH_SIZE):
+        batch = pairs[start : start + BATCH_SIZE]
+        conversations = Conversation.objects.bulk_create(
+            [Conversation() for _ in batch]
+        )
+        ConversationMember.objects.bulk_create(
+            ConversationMember(conversation=conversation, user_id=a, other_user_id=b)
+            for conversation, pair in zip(conversations, batch)
+            for a, b in {pair, pair[::-1]}
+        )
+
+    Message.objects.update(
+        conversation_id=Subquery(
+            ConversationMember.objects.filter(
+                user=OuterRef("sender"), other_user=OuterRef("recipient")
+            ).values("conversation_id")[:1]
+        )
+    )
+    latest = Message.objects.filter(conversation=OuterRef("pk")).order_by(
+        "-created_at", "-id"
+    )
+    Conversation.objects.update(last_message=Subquery(latest.values("pk")[:1]))
+    unread = (
+        Message.objects.filter(
+            conversation=OuterRef("conversation"),
+            recipient=OuterRef("user"),
+            read=False,
+        )
+        .order_by()
+        .values("conversation")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    ConversationMember.objects.update(
+        unread_count=Coalesce(Subquery(unread), 0),
+        last_message_at=Coalesce(
+            Subquery(
+                Message.objects.filter(conversation=OuterRef("conversation"))
+                .order_by("-created_at", "-id")
+                .values("created_at")[:1]
+            ),
+            F("last_message_at"),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("messaging", "0003_contactpair"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Conversation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ConversationMember",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("unread_count", models.PositiveIntegerField(default=0)),
+                (
+                    "last_message_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="conversationmember",
+            name="conversation",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="members",
+                to="messaging.conversation",
+            ),
+        ),
+        migrations.AddField(
+            model_name="conversationmember",
+            name="other_user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="conversationmember",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="conversation_memberships",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="conversation",
+            name="last_message",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="messaging.message",
+            ),
+        ),
+        migrations.AddField(
+            model_name="message",
+            name="conversation",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="messages",
+                to="messaging.conversation",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(
+                fields=["conversation", "-created_at", "-id"], name="message_thread_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="conversationmember",
+            index=models.Index(
+                fields=["user", "-last_message_at", "-id"], name="conversation_list_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="conversationmember",
+            constraint=models.UniqueConstraint(
+                fields=("user", "other_user"), name="unique_conversation_member"
+            ),
+        ),
+        migrations.RunPython(backfill_conversations, migrations.RunPython.noop),
+    ]
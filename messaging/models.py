@@ -1,5 +1,53 @@
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Case, Count, Exists, F, OuterRef, Subquery, When
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.contrib.auth.models import User
+from django.utils import timezone
+from reports.models import Report
+from ParkEasy.db import delete_rows
+
+
+class MessageQuerySet(models.QuerySet):
+    def mark_read(self):
+        """
+        Mark the unread messages in this queryset as read with one UPDATE
+        and refresh the unread counts of their conversations.
+        """
+        unread = self.filter(read=False)
+        conversation_ids = set(
+            unread.order_by()
+            .values_list("conversation_id", flat=True)
+            .exclude(conversation=None)
+            .distinct()
+        )
+        updated = unread.update(read=True)
+        if updated:
+            refresh_conversations(conversation_ids)
+        return updated
+
+    def bulk_delete(self):
+        """
+        Delete these messages with one DELETE ... WHERE id IN and refresh
+        their conversations once, instead of loading every message and
+        refreshing its conversation through post_delete.
+        """
+        conversation_ids = set(
+            self.order_by()
+            .values_list("conversation_id", flat=True)
+            .exclude(conversation=None)
+            .distinct()
+        )
+        with transaction.atomic():
+            # Raw deletes skip on_delete handling, so clear the pointers first.
+            Conversation.objects.filter(last_message__in=self.values("pk")).update(
+                last_message=None
+            )
+            deleted = delete_rows(self)
+            refresh_conversations(conversation_ids)
+        return deleted
 
 
 class Message(models.Model):
@@ -13,6 +61,325 @@ class Message(models.Model):
     body = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     read = models.BooleanField(default=False)
+    conversation = models.ForeignKey(
+        "Conversation",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="messages",
+    )
+
+    objects = MessageQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Thread view: a conversation's messages, newest first.
+            models.Index(
+                fields=["conversation", "-created_at", "-id"],
+                name="message_thread_idx",
+            ),
+            # Inbox: a recipient's messages, unread first, newest first.
+            models.Index(
+                fields=["recipient", "read", "-created_at", "-id"],
+                name="message_inbox_idx",
+            ),
+            # Sent messages: a sender's messages, newest first.
+            models.Index(
+                fields=["sender", "-created_at", "-id"],
+                name="message_sent_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Message from {self.sender.username} to {self.recipient.username}"
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        with transaction.atomic():
+            if adding and self.conversation_id is None:
+                self.conversation_id = Conversation.between(
+                    self.sender_id, self.recipient_id
+                )
+            super().save(*args, **kwargs)
+            if adding:
+                Conversation.record_message(self)
+
+    def mark_read(self):
+        """Mark this message read, keeping its conversation's unread count."""
+        if self.read:
+            return
+        self.read = True
+        self.save(update_fields=["read"])
+        if self.conversation_id:
+            ConversationMember.objects.filter(
+                conversation_id=self.conversation_id,
+                user_id=self.recipient_id,
+                unread_count__gt=0,
+            ).update(unread_count=F("unread_count") - 1)
+
+
+class Conversation(models.Model):
+    """
+    The thread of messages between two users.
+
+    Each participant has a ConversationMember row with their own unread
+    count and the time of the latest message, so a user's threads are listed
+    from one indexed query without touching the messages themselves.
+    """
+
+    last_message = models.ForeignKey(
+        Message,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Conversation #{self.pk}"
+
+    @classmethod
+    def between(cls, user_id, other_id):
+        """ID of the conversation between two users, created on first use."""
+        existing = ConversationMember.objects.filter(
+            user_id=user_id, other_user_id=other_id
+        ).values_list("conversation_id", flat=True)
+        conversation_id = existing.first()
+        if conversation_id is not None:
+            return conversation_id
+        try:
+            with transaction.atomic():
+                conversation = cls.objects.create()
+                ConversationMember.objects.bulk_create(
+                    ConversationMember(
+                        conversation=conversation, user_id=a, other_user_id=b
+                    )
+                    for a, b in {(user_id, other_id), (other_id, user_id)}
+                )
+            return conversation.pk
+        except IntegrityError:
+            # Another request started the same conversation concurrently.
+            return existing.first()
+
+    @staticmethod
+    def record_message(message):
+        """Update the conversation summaries for a newly sent message."""
+        Conversation.objects.filter(pk=message.conversation_id).update(
+            last_message=message
+        )
+        unread_count = F("unread_count")
+        if not message.read:
+            unread_count = Case(
+                When(user_id=message.recipient_id, then=F("unread_count") + 1),
+                default=F("unread_count"),
+                output_field=models.PositiveIntegerField(),
+            )
+        ConversationMember.objects.filter(
+            conversation_id=message.conversation_id
+        ).update(last_message_at=message.created_at, unread_count=unread_count)
+
+
+class ConversationMember(models.Model):
+    """One participant's view of a conversation."""
+
+    conversation = models.ForeignKey(
+        Conversation, on_delete=models.CASCADE, related_name="members"
+    )
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="conversation_memberships"
+    )
+    other_user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    unread_count = models.PositiveIntegerField(default=0)
+    last_message_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "other_user"], name="unique_conversation_member"
+            )
+        ]
+        indexes = [
+            # Thread list: a user's conversations, most recent first.
+            models.Index(
+                fields=["user", "-last_message_at", "-id"],
+                name="conversation_list_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} in conversation #{self.conversation_id}"
+
+
+def refresh_conversations(conversation_ids=None):
+    """
+    Recompute the last message and unread counts of the given conversations
+    (all of them if None) from their messages, after messages were created,
+    updated or deleted in bulk.
+    """
+    conversations = Conversation.objects.all()
+    members = ConversationMember.objects.all()
+    if conversation_ids is not None:
+        if not conversation_ids:
+            return
+        conversations = conversations.filter(pk__in=conversation_ids)
+        members = members.filter(conversation_id__in=conversation_ids)
+    latest = Message.objects.filter(conversation=OuterRef("conversation")).order_by(
+        "-created_at", "-id"
+    )
+    conversations.update(
+        last_message=Subquery(
+            Message.objects.filter(conversation=OuterRef("pk"))
+            .order_by("-created_at", "-id")
+            .values("pk")[:1]
+        )
+    )
+    unread = (
+        Message.objects.filter(
+            conversation=OuterRef("conversation"),
+            recipient=OuterRef("user"),
+            read=False,
+        )
+        .order_by()
+        .values("conversation")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    members.update(
+        unread_count=Coalesce(Subquery(unread), 0),
+        last_message_at=Coalesce(
+            Subquery(latest.values("created_at")[:1]), F("last_message_at")
+        ),
+    )
+
+
+class ArchivedMessage(models.Model):
+    """
+    A read message moved out of the Message table by
+    ``archive_read_messages``. Keeps the original ID and content.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    sender = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    recipient = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    subject = models.CharField(max_length=255, blank=True, null=True)
+    body = models.TextField()
+    # Plain ID: the conversation may be gone by the time this is read.
+    conversation_id = models.BigIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["recipient", "created_at"], name="archived_inbox_idx"),
+            models.Index(fields=["sender", "created_at"], name="archived_sent_idx"),
+        ]
+
+    def __str__(self):
+        return f"Archived message #{self.pk}"
+
+
+def archivable_messages(before):
+    """
+    Read messages created before ``before``, except those that have been
+    reported: moderators still need to see them.
+    """
+    reports = Report.objects.filter(
+        content_type=ContentType.objects.get_for_model(Message),
+        object_id=OuterRef("pk"),
+    )
+    return Message.objects.filter(created_at__lt=before, read=True).exclude(
+        Exists(reports)
+    )
+
+
+def archive_read_messages(before, batch_size=1000):
+    """
+    Move read messages created before ``before`` to ArchivedMessage,
+    ``batch_size`` rows per transaction, keeping the conversation summaries
+    in sync. Returns the number of messages archived.
+    """
+    eligible = archivable_messages(before).order_by("pk")
+    archived = 0
+    while True:
+        batch = list(eligible[:batch_size])
+        if not batch:
+            break
+        with transaction.atomic():
+            ArchivedMessage.objects.bulk_create(
+                [
+                    ArchivedMessage(
+                        id=message.pk,
+                        sender_id=message.sender_id,
+                        recipient_id=message.recipient_id,
+                        subject=message.subject,
+                        body=message.body,
+                        conversation_id=message.conversation_id,
+                        created_at=message.created_at,
+                    )
+                    for message in batch
+                ],
+                ignore_conflicts=True,
+            )
+            archived += Message.objects.filter(
+                pk__in=[message.pk for message in batch]
+            ).bulk_delete()
+    return archived
+
+
+@receiver(post_delete, sender=Message)
+def refresh_conversation_on_delete(sender, instance, **kwargs):
+    if instance.conversation_id:
+        refresh_conversations([instance.conversation_id])
+
+
+class ContactPair(models.Model):
+    """
+    Two users who may message each other because one has booked the other's
+    listing. Each pair is stored in both directions, so a user's contacts
+    and the "may A message B" check are single indexed lookups on ``user``.
+    """
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="contact_pairs"
+    )
+    contact = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "contact"], name="unique_contact_pair"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} can message {self.contact.username}"
+
+    @classmethod
+    def link(cls, pairs):
+        """
+        Record that each (guest_id, host_id) pair in ``pairs`` may message
+        each other, ignoring pairs that already exist.
+        """
+        rows = {
+            (a, b)
+            for guest_id, host_id in pairs
+            if guest_id != host_id
+            for a, b in ((guest_id, host_id), (host_id, guest_id))
+        }
+        cls.objects.bulk_create(
+            [cls(user_id=a, contact_id=b) for a, b in rows],
+            ignore_conflicts=True,
+        )
+
+    @classmethod
+    def are_contacts(cls, user, other):
+        return cls.objects.filter(user=user, contact=other).exists()
+
+
+@receiver(post_save, sender="booking.Booking")
+def link_booking_contacts(sender, instance, created, **kwargs):
+    """A booking lets the guest and the host message each other."""
+    if created:
+        ContactPair.link([(instance.user_id, instance.listing.user_id)])
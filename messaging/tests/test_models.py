@@ -1,6 +1,20 @@
+from datetime import timedelta
+
+from django.contrib.contenttypes.models import ContentType
 from django.test import TestCase
+from django.utils import timezone
 from django.contrib.auth.models import User
-from messaging.models import Message
+from booking.models import Booking
+from listings.models import Listing
+from messaging.models import (
+    ArchivedMessage,
+    ContactPair,
+    Conversation,
+    ConversationMember,
+    Message,
+    archive_read_messages,
+)
+from reports.models import Report
 
 
 class MessageModelTest(TestCase):
@@ -130,3 +144,166 @@ class MessageModelTest(TestCase):
         # The second message should come first
         self.assertEqual(messages[0], message2)
         self.assertEqual(messages[1], message1)
+
+
+class ContactPairTest(TestCase):
+    def setUp(self):
+        self.host = User.objects.create_user(username="host", password="pass")
+        self.guest = User.objects.create_user(username="guest", password="pass")
+        self.listing = Listing.objects.create(
+            user=self.host,
+            title="Spot",
+            location="123 Test St",
+            rent_per_hour=10.0,
+            description="Spot",
+        )
+
+    def book(self, user):
+        return Booking.objects.create(user=user, listing=self.listing)
+
+    def test_booking_links_guest_and_host_both_ways(self):
+        self.book(self.guest)
+        self.assertTrue(ContactPair.are_contacts(self.guest, self.host))
+        self.assertTrue(ContactPair.are_contacts(self.host, self.guest))
+
+    def test_repeat_bookings_do_not_duplicate_pairs(self):
+        self.book(self.guest)
+        self.book(self.guest)
+        self.assertEqual(ContactPair.objects.count(), 2)
+
+    def test_booking_own_listing_links_nobody(self):
+        self.book(self.host)
+        self.assertFalse(ContactPair.objects.exists())
+
+    def test_unrelated_users_are_not_contacts(self):
+        stranger = User.objects.create_user(username="stranger", password="pass")
+        self.book(self.guest)
+        self.assertFalse(ContactPair.are_contacts(stranger, self.host))
+        self.assertFalse(ContactPair.are_contacts(self.guest, stranger))
+
+    def test_link_many_pairs(self):
+        other = User.objects.create_user(username="other", password="pass")
+        ContactPair.link([(self.guest.id, self.host.id), (other.id, self.host.id)])
+        self.assertEqual(
+            set(
+                ContactPair.objects.filter(user=self.host).values_list(
+                    "contact", flat=True
+                )
+            ),
+            {self.guest.id, other.id},
+        )
+
+
+class ConversationTest(TestCase):
+    def setUp(self):
+        self.alice = User.objects.create_user(username="alice", password="pass")
+        self.bob = User.objects.create_user(username="bob", password="pass")
+
+    def send(self, sender, recipient, **kwargs):
+        return Message.objects.create(
+            sender=sender, recipient=recipient, body="Hello", **kwargs
+        )
+
+    def member(self, user):
+        return ConversationMember.objects.get(user=user)
+
+    def test_replies_share_one_conversation(self):
+        first = self.send(self.alice, self.bob)
+        reply = self.send(self.bob, self.alice)
+        self.assertEqual(first.conversation_id, reply.conversation_id)
+        self.assertEqual(Conversation.objects.count(), 1)
+        self.assertEqual(self.member(self.alice).other_user, self.bob)
+        self.assertEqual(self.member(self.bob).other_user, self.alice)
+
+    def test_send_updates_summaries(self):
+        self.send(self.alice, self.bob)
+        last = self.send(self.alice, self.bob)
+        self.assertEqual(
+            last.conversation.last_message, Message.objects.get(pk=last.pk)
+        )
+        self.assertEqual(self.member(self.bob).unread_count, 2)
+        self.assertEqual(self.member(self.alice).unread_count, 0)
+        self.assertEqual(self.member(self.alice).last_message_at, last.created_at)
+
+    def test_message_to_self(self):
+        message = self.send(self.alice, self.alice)
+        self.assertEqual(message.conversation.members.count(), 1)
+        self.assertEqual(self.member(self.alice).unread_count, 1)
+
+    def test_mark_read_decrements_unread_count(self):
+        message = self.send(self.alice, self.bob)
+        message.mark_read()
+        message.mark_read()
+        message.refresh_from_db()
+        self.assertTrue(message.read)
+        self.assertEqual(self.member(self.bob).unread_count, 0)
+
+    def test_queryset_mark_read_refreshes_unread_counts(self):
+        for _ in range(3):
+            self.send(self.alice, self.bob)
+        self.send(self.bob, self.alice)
+        updated = Message.objects.filter(recipient=self.bob).mark_read()
+        self.assertEqual(updated, 3)
+        self.assertEqual(self.member(self.bob).unread_count, 0)
+        self.assertEqual(self.member(self.alice).unread_count, 1)
+
+    def test_deleting_last_message_falls_back_to_previous(self):
+        first = self.send(self.alice, self.bob)
+        last = self.send(self.bob, self.alice)
+        last.delete()
+        conversation = Conversation.objects.get()
+        self.assertEqual(conversation.last_message_id, first.pk)
+        self.assertEqual(self.member(self.alice).unread_count, 0)
+        self.assertEqual(self.member(self.bob).unread_count, 1)
+
+
+class ArchiveMessagesTest(TestCase):
+    def setUp(self):
+        self.alice = User.objects.create_user(username="alice", password="pass")
+        self.bob = User.objects.create_user(username="bob", password="pass")
+        self.old = timezone.now() - timedelta(days=400)
+        self.cutoff = timezone.now() - timedelta(days=365)
+
+    def send(self, read=True, old=True):
+        message = Message.objects.create(
+            sender=self.alice, recipient=self.bob, body="Hello", read=read
+        )
+        if old:
+            Message.objects.filter(pk=message.pk).update(created_at=self.old)
+        return message
+
+    def test_archives_old_read_messages(self):
+        archived = self.send()
+        unread = self.send(read=False)
+        recent = self.send(old=False)
+
+        self.assertEqual(archive_read_messages(self.cutoff, batch_size=1), 1)
+        self.assertEqual(
+            set(Message.objects.values_list("pk", flat=True)), {unread.pk, recent.pk}
+        )
+        copy = ArchivedMessage.objects.get()
+        self.assertEqual(copy.pk, archived.pk)
+        self.assertEqual(copy.body, "Hello")
+        self.assertEqual(copy.conversation_id, archived.conversation_id)
+
+    def test_keeps_conversation_summary_in_sync(self):
+        self.send(read=False)
+        last = self.send()
+        Conversation.objects.update(last_message=last)
+
+        archive_read_messages(self.cutoff)
+        conversation = Conversation.objects.get()
+        self.assertEqual(conversation.last_message, Message.objects.get())
+        self.assertEqual(ConversationMember.objects.get(user=self.bob).unread_count, 1)
+
+    def test_reported_messages_are_kept(self):
+        message = self.send()
+        Report.objects.create(
+            reporter=self.bob,
+            content_type=ContentType.objects.get_for_model(Message),
+            object_id=message.pk,
+            report_type="SPAM",
+            description="Spam",
+        )
+        self.assertEqual(archive_read_messages(self.cutoff), 0)
+        self.assertTrue(Message.objects.filter(pk=message.pk).exists())
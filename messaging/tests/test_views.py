@@ -1,7 +1,11 @@
+from unittest.mock import patch
+
+from django.db import connection
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth.models import User
-from messaging.models import Message
+from messaging.models import ConversationMember, Message
 from listings.models import Listing
 from booking.models import Booking
 
@@ -123,6 +127,243 @@ class MessagingViewsTest(TestCase):
         self.assertTrue(Message.objects.filter(id=self.message1.id).exists())
 
 
+class MailboxPaginationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="host", password="hostpass")
+        self.senders = [
+            User.objects.create_user(username=f"guest{i}", password="guestpass")
+            for i in range(3)
+        ]
+        self.client.login(username="host", password="hostpass")
+
+    def send(self, count, read=False):
+        for i in range(count):
+            Message.objects.create(
+                sender=self.senders[i % len(self.senders)],
+                recipient=self.user,
+                subject=f"Subject {i}",
+                body="Body",
+                read=read,
+            )
+
+    def inbox_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("inbox"))
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_inbox_query_count_does_not_grow_with_messages(self):
+        self.send(3)
+        baseline = self.inbox_queries()
+        self.send(20)
+        self.assertEqual(self.inbox_queries(), baseline)
+
+    def test_inbox_lists_unread_first(self):
+        self.send(2, read=False)
+        self.send(2, read=True)
+        response = self.client.get(reverse("inbox"))
+        self.assertEqual(
+            [msg.read for msg in response.context["messages_inbox"]],
+            [False, False, True, True],
+        )
+
+    def test_inbox_defers_message_bodies(self):
+        self.send(1)
+        response = self.client.get(reverse("inbox"))
+        msg = response.context["messages_inbox"][0]
+        self.assertIn("body", msg.get_deferred_fields())
+
+    @patch("messaging.views.MESSAGES_PER_PAGE", 4)
+    def test_inbox_cursor_walks_every_message_once(self):
+        self.send(5, read=False)
+        self.send(5, read=True)
+        seen = []
+        cursor = None
+        while True:
+            params = {"cursor": cursor} if cursor else {}
+            response = self.client.get(reverse("inbox"), params)
+            page = response.context["messages_inbox"]
+            self.assertLessEqual(len(page), 4)
+            seen.extend(msg.id for msg in page)
+            cursor = response.context["next_cursor"]
+            if not cursor:
+                break
+        expected = list(
+            Message.objects.filter(recipient=self.user)
+            .order_by("read", "-created_at", "-id")
+            .values_list("id", flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    @patch("messaging.views.MESSAGES_PER_PAGE", 2)
+    def test_sent_messages_are_paginated(self):
+        for recipient in self.senders:
+            Message.objects.create(sender=self.user, recipient=recipient, body="Hi")
+        response = self.client.get(reverse("sent_messages"))
+        first_page = response.context["messages_sent"]
+        self.assertEqual(len(first_page), 2)
+        self.assertContains(response, "Older messages")
+
+        response = self.client.get(
+            reverse("sent_messages"), {"cursor": response.context["next_cursor"]}
+        )
+        self.assertEqual(len(response.context["messages_sent"]), 1)
+        self.assertIsNone(response.context["next_cursor"])
+        self.assertNotIn(
+            response.context["messages_sent"][0].id, [msg.id for msg in first_page]
+        )
+
+    def test_invalid_cursor_shows_first_page(self):
+        self.send(2)
+        response = self.client.get(reverse("inbox"), {"cursor": "tampered"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["messages_inbox"]), 2)
+
+
+class ConversationViewsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="host", password="hostpass")
+        self.guest = User.objects.create_user(username="guest", password="guestpass")
+        self.client.login(username="host", password="hostpass")
+
+    def send(self, sender, recipient, count=1):
+        for i in range(count):
+            message = Message.objects.create(
+                sender=sender, recipient=recipient, subject=f"Subject {i}", body="Hi"
+            )
+        return message
+
+    def test_conversation_list_query_count_does_not_grow(self):
+        def list_queries():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(reverse("conversations"))
+            self.assertEqual(response.status_code, 200)
+            return len(queries)
+
+        self.send(self.guest, self.user)
+        baseline = list_queries()
+        for i in range(10):
+            other = User.objects.create_user(username=f"other{i}", password="pass")
+            self.send(other, self.user, count=2)
+        self.assertEqual(list_queries(), baseline)
+
+    def test_conversation_list_shows_unread_counts(self):
+        self.send(self.guest, self.user, count=3)
+        response = self.client.get(reverse("conversations"))
+        membership = response.context["memberships"][0]
+        self.assertEqual(membership.other_user, self.guest)
+        self.assertEqual(membership.unread_count, 3)
+
+    def test_opening_conversation_marks_it_read(self):
+        message = self.send(self.guest, self.user, count=2)
+        response = self.client.get(
+            reverse("conversation_detail", args=[message.conversation_id])
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["thread_messages"]), 2)
+        self.assertFalse(Message.objects.filter(read=False).exists())
+        self.assertEqual(ConversationMember.objects.get(user=self.user).unread_count, 0)
+
+    @patch("messaging.views.MESSAGES_PER_PAGE", 2)
+    def test_conversation_messages_are_paginated(self):
+        message = self.send(self.guest, self.user, count=3)
+        url = reverse("conversation_detail", args=[message.conversation_id])
+        response = self.client.get(url)
+        self.assertEqual(
+            [msg.subject for msg in response.context["thread_messages"]],
+            ["Subject 2", "Subject 1"],
+        )
+        response = self.client.get(url, {"cursor": response.context["next_cursor"]})
+        self.assertEqual(
+            [msg.subject for msg in response.context["thread_messages"]],
+            ["Subject 0"],
+        )
+
+    def test_non_participant_cannot_open_conversation(self):
+        stranger = User.objects.create_user(username="stranger", password="pass")
+        message = self.send(self.guest, stranger)
+        response = self.client.get(
+            reverse("conversation_detail", args=[message.conversation_id])
+        )
+        self.assertEqual(response.status_code, 404)
+
+
+class BulkMessagesTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="host", password="hostpass")
+        self.guest = User.objects.create_user(username="guest", password="guestpass")
+        self.received = [
+            Message.objects.create(sender=self.guest, recipient=self.user, body="Hi")
+            for _ in range(3)
+        ]
+        self.sent = Message.objects.create(
+            sender=self.user, recipient=self.guest, body="Reply"
+        )
+        self.client.login(username="host", password="hostpass")
+        self.url = reverse("bulk_messages")
+
+    def unread_count(self, user):
+        return ConversationMember.objects.get(user=user).unread_count
+
+    def test_mark_selected_read(self):
+        ids = [self.received[0].id, self.received[1].id, self.sent.id]
+        response = self.client.post(self.url, {"action": "read", "ids": ids})
+        self.assertRedirects(response, reverse("inbox"))
+        # Only received messages can be marked read by the recipient.
+        self.assertEqual(Message.objects.filter(read=True).count(), 2)
+        self.assertEqual(self.unread_count(self.user), 1)
+        self.assertEqual(self.unread_count(self.guest), 1)
+
+    def test_mark_all_read_up_to_newest_shown(self):
+        later = Message.objects.create(
+            sender=self.guest, recipient=self.user, body="Later"
+        )
+        self.client.post(self.url, {"action": "read", "up_to": self.received[-1].id})
+        later.refresh_from_db()
+        self.assertFalse(later.read)
+        self.assertEqual(self.unread_count(self.user), 1)
+
+    def test_delete_selected_in_one_statement(self):
+        ids = [self.received[2].id, self.sent.id]
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(self.url, {"action": "delete", "ids": ids})
+        deletes = [q for q in queries if q["sql"].startswith("DELETE")]
+        # One for the messages; the session is saved with an UPDATE.
+        self.assertEqual(len(deletes), 1)
+        self.assertFalse(Message.objects.filter(pk__in=ids).exists())
+        conversation = self.received[0].conversation
+        conversation.refresh_from_db()
+        self.assertEqual(conversation.last_message_id, self.received[1].id)
+        self.assertEqual(self.unread_count(self.user), 2)
+        self.assertEqual(self.unread_count(self.guest), 0)
+
+    def test_cannot_delete_other_peoples_messages(self):
+        stranger = User.objects.create_user(username="stranger", password="pass")
+        foreign = Message.objects.create(
+            sender=self.guest, recipient=stranger, body="Private"
+        )
+        self.client.post(self.url, {"action": "delete", "ids": [foreign.id]})
+        self.assertTrue(Message.objects.filter(pk=foreign.pk).exists())
+
+    def test_invalid_ids_are_rejected(self):
+        response = self.client.post(self.url, {"action": "delete", "ids": ["x"]})
+        self.assertRedirects(response, reverse("inbox"))
+        self.assertEqual(Message.objects.count(), 4)
+
+    def test_message_detail_marks_read_with_update_fields(self):
+        message = self.received[0]
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse("message_detail", args=[message.id]))
+        message_updates = [
+            q["sql"]
+            for q in queries
+            if q["sql"].startswith('UPDATE "messaging_message"')
+        ]
+        self.assertEqual(len(message_updates), 1)
+        self.assertNotIn('"body"', message_updates[0])
+        self.assertEqual(self.unread_count(self.user), 2)
+
+
 class ComposeMessagingTests(TestCase):
     def setUp(self):
         """Create test users, listings and relationships"""
@@ -302,6 +543,21 @@ class ComposeMessagingTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context["form"].initial["recipient"], self.admin_user)
 
+    def test_compose_query_count_does_not_grow_with_past_guests(self):
+        def compose_queries():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(reverse("compose_message"))
+            self.assertEqual(response.status_code, 200)
+            return len(queries)
+
+        Booking.objects.create(user=self.renter, listing=self.listing)
+        self.client.login(username="spotowner", password="ownerpass")
+        baseline = compose_queries()
+        for i in range(10):
+            guest = User.objects.create_user(username=f"guest{i}", password="pass")
+            Booking.objects.create(user=guest, listing=self.listing)
+        self.assertEqual(compose_queries(), baseline)
+
     def test_form_security(self):
         """Test form validation prevents messaging unauthorized users"""
         # Create a booking
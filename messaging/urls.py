@@ -5,9 +5,16 @@ urlpatterns = [
     path("inbox/", views.inbox, name="inbox"),
     path("sent/", views.sent_messages, name="sent_messages"),
     path("compose/", views.compose_message, name="compose_message"),
+    path("conversations/", views.conversations, name="conversations"),
+    path(
+        "conversations/<int:conversation_id>/",
+        views.conversation_detail,
+        name="conversation_detail",
+    ),
     path("<int:message_id>/", views.message_detail, name="message_detail"),
     path(
         "compose/<int:recipient_id>/", views.compose_message, name="compose_message_to"
     ),
     path("<int:message_id>/delete/", views.delete_message, name="delete_message"),
+    path("bulk/", views.bulk_messages, name="bulk_messages"),
 ]
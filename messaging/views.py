@@ -1,18 +1,39 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
+from django.db.models import Q
 from django.http import HttpResponseForbidden
-from .models import Message
-from .forms import MessageForm
+from django.views.decorators.http import require_POST
+from .models import ContactPair, ConversationMember, Message
+from .forms import BulkActionForm, MessageForm
 from django.contrib.auth import get_user_model
-
+from ParkEasy.pagination import keyset_page
 
 User = get_user_model()
 
+MESSAGES_PER_PAGE = 25
+
+# Unread messages first, then newest first. Backed by the
+# (recipient, read, created_at, id) index on Message.
+INBOX_ORDERING = ["read", "-created_at", "-id"]
+SENT_ORDERING = ["-created_at", "-id"]
+# Conversations by latest message, and a thread's messages newest first.
+CONVERSATION_ORDERING = ["-last_message_at", "-id"]
+THREAD_ORDERING = ["-created_at", "-id"]
+
+# Columns shown in the mailbox lists; message bodies are only loaded on the
+# detail page.
+LIST_COLUMNS = ["subject", "created_at", "read", "sender_id", "recipient_id"]
+
 
 @login_required
 def inbox(request):
-    messages_inbox = Message.objects.filter(recipient=request.user).order_by(
-        "-created_at"
+    messages_inbox, next_cursor = keyset_page(
+        Message.objects.filter(recipient=request.user)
+        .select_related("sender")
+        .only(*LIST_COLUMNS, "sender__username"),
+        INBOX_ORDERING,
+        request.GET.get("cursor"),
+        MESSAGES_PER_PAGE,
     )
 
     # Get session messages if any
@@ -21,6 +42,10 @@ def inbox(request):
 
     context = {
         "messages_inbox": messages_inbox,
+        # "Mark all as read" covers everything up to the newest message shown.
+        "newest_id": max((msg.id for msg in messages_inbox), default=None),
+        "next_cursor": next_cursor,
+        "is_first_page": not request.GET.get("cursor"),
         "success_message": success_message,
         "error_message": error_message,
     }
@@ -30,30 +55,85 @@ def inbox(request):
 @login_required
 def sent_messages(request):
     # Get all sent messages except verification requests
-    messages_sent = (
+    messages_sent, next_cursor = keyset_page(
         Message.objects.filter(sender=request.user)
         .exclude(
             subject="Verification Request"  # Hide verification requests from users
         )
-        .order_by("-created_at")
+        .select_related("recipient")
+        .only(*LIST_COLUMNS, "recipient__username"),
+        SENT_ORDERING,
+        request.GET.get("cursor"),
+        MESSAGES_PER_PAGE,
     )
 
-    context = {"messages_sent": messages_sent}
+    context = {
+        "messages_sent": messages_sent,
+        "next_cursor": next_cursor,
+        "is_first_page": not request.GET.get("cursor"),
+    }
     return render(request, "messaging/sent_messages.html", context)
 
 
 @login_required
-def compose_message(request, recipient_id=None):
-    # Get owners whose listings the user has booked
-    booked_owners = User.objects.filter(listing__booking__user=request.user).distinct()
+def conversations(request):
+    memberships, next_cursor = keyset_page(
+        ConversationMember.objects.filter(user=request.user)
+        .select_related("other_user", "conversation__last_message")
+        .only(
+            "conversation_id",
+            "unread_count",
+            "last_message_at",
+            "other_user__username",
+            "conversation__last_message__subject",
+            "conversation__last_message__sender_id",
+        ),
+        CONVERSATION_ORDERING,
+        request.GET.get("cursor"),
+        MESSAGES_PER_PAGE,
+    )
+    context = {
+        "memberships": memberships,
+        "next_cursor": next_cursor,
+        "is_first_page": not request.GET.get("cursor"),
+    }
+    return render(request, "messaging/conversations.html", context)
 
-    # Get users who have booked the user's listings
-    booking_users = User.objects.filter(booking__listing__user=request.user).distinct()
 
-    # Combine the lists and remove duplicates
-    available_recipients = (
-        (booked_owners | booking_users).exclude(id=request.user.id).distinct()
+@login_required
+def conversation_detail(request, conversation_id):
+    membership = get_object_or_404(
+        ConversationMember.objects.select_related("other_user"),
+        conversation_id=conversation_id,
+        user=request.user,
+    )
+    thread = Message.objects.filter(conversation_id=conversation_id)
+    thread_messages, next_cursor = keyset_page(
+        thread.select_related("sender"),
+        THREAD_ORDERING,
+        request.GET.get("cursor"),
+        MESSAGES_PER_PAGE,
     )
+    # Opening a thread reads everything in it.
+    if membership.unread_count:
+        thread.filter(recipient=request.user).mark_read()
+
+    context = {
+        "membership": membership,
+        "thread_messages": thread_messages,
+        "next_cursor": next_cursor,
+        "is_first_page": not request.GET.get("cursor"),
+    }
+    return render(request, "messaging/conversation_detail.html", context)
+
+
+@login_required
+def compose_message(request, recipient_id=None):
+    # Users who booked one of our listings or whose listing we booked,
+    # maintained in ContactPair when bookings are created.
+    available_recipients = User.objects.filter(
+        pk__in=ContactPair.objects.filter(user=request.user).values("contact")
+    ).order_by("username")
 
     # If no recipients available and no specific recipient_id provided, redirect
     if not available_recipients.exists() and not recipient_id:
@@ -69,7 +149,7 @@ def compose_message(request, recipient_id=None):
     if recipient_id:
         recipient = get_object_or_404(User, pk=recipient_id)
         # Check if recipient is in available_recipients or is an admin
-        if recipient in available_recipients or recipient.is_staff:
+        if recipient.is_staff or ContactPair.are_contacts(request.user, recipient):
             initial_data = {"recipient": recipient}
         else:
             request.session["error_message"] = (
@@ -85,7 +165,7 @@ def compose_message(request, recipient_id=None):
             recipient = form.cleaned_data["recipient"]
 
             # Verify recipient is in the allowed list
-            if recipient in available_recipients or recipient.is_staff:
+            if recipient.is_staff or ContactPair.are_contacts(request.user, recipient):
                 new_message = form.save(commit=False)
                 new_message.sender = request.user
                 new_message.save()
@@ -119,9 +199,8 @@ def message_detail(request, message_id):
         return HttpResponseForbidden("You are not allowed to view this message.")
 
     # If the current user is the recipient, mark as read
-    if message.recipient == request.user and not message.read:
-        message.read = True
-        message.save()
+    if message.recipient == request.user:
+        message.mark_read()
 
     return render(request, "messaging/message_detail.html", {"message": message})
 
@@ -136,3 +215,36 @@ def delete_message(request, message_id):
 
     message.delete()
     return redirect("inbox")
+
+
+@login_required
+@require_POST
+def bulk_messages(request):
+    """
+    Mark as read or delete many messages with a single statement. Selected
+    IDs may be any of the user's messages; "everything up to" applies to
+    the inbox only.
+    """
+    form = BulkActionForm(request.POST)
+    if not form.is_valid():
+        request.session["error_message"] = " ".join(form.non_field_errors()) or (
+            "Invalid selection."
+        )
+        return redirect("inbox")
+
+    action = form.cleaned_data["action"]
+    if action == "read" or not form.cleaned_data["ids"]:
+        messages = Message.objects.filter(recipient=request.user)
+    else:
+        messages = Message.objects.filter(
+            Q(sender=request.user) | Q(recipient=request.user)
+        )
+    messages = form.select(messages)
+
+    if action == "read":
+        count = messages.mark_read()
+        request.session["success_message"] = f"{count} message(s) marked as read."
+    else:
+        count = messages.bulk_delete()
+        request.session["success_message"] = f"{count} message(s) deleted."
+    return redirect("inbox")
@@ -1,5 +1,14 @@
 from django.contrib import admin
-from .models import Report
+from django.contrib.admin.views.main import ChangeList
+from django.utils.text import Truncator
+from .models import Report, resolve_reported_objects
+
+
+class ReportChangeList(ChangeList):
+    def get_results(self, request):
+        super().get_results(request)
+        # Load the reported objects of the page with one query per type.
+        self.result_list = resolve_reported_objects(self.result_list)
 
 
 class ReportAdmin(admin.ModelAdmin):
@@ -8,9 +17,11 @@ class ReportAdmin(admin.ModelAdmin):
         "report_type",
         "reporter",
         "content_type",
+        "reported_object_summary",
         "status",
         "created_at",
     ]
+    list_select_related = ["reporter", "content_type"]
     list_filter = ["report_type", "status", "content_type"]
     search_fields = ["description", "admin_notes", "reporter__username"]
     readonly_fields = [
@@ -38,6 +49,22 @@ class ReportAdmin(admin.ModelAdmin):
         ("Timestamps", {"fields": ("created_at", "updated_at")}),
     )
 
+    def get_changelist(self, request, **kwargs):
+        return ReportChangeList
+
+    @admin.display(description="Reported object")
+    def reported_object_summary(self, obj):
+        target = obj.reported_object
+        if target is None:
+            return "(deleted)"
+        summary = (
+            getattr(target, "title", None)
+            or getattr(target, "subject", None)
+            or getattr(target, "comment", None)
+            or f"#{obj.object_id}"
+        )
+        return Truncator(summary).chars(60)
+
     def save_model(self, request, obj, form, change):
         if obj.status in ["RESOLVED", "DISMISSED"] and not obj.resolved_by:
             obj.resolved_by = request.user
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from reports.models import send_report_alerts
+
+
+class Command(BaseCommand):
+    help = (
+        "Notify staff about reports submitted since the last run, with one "
+        "digest notification per staff user."
+    )
+
+    def handle(self, *args, **options):
+        alerted = send_report_alerts()
+        self.stdout.write(
+            self.style.SUCCESS(f"Sent staff alerts for {alerted} reports.")
+        )
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.19 on 2026-10-19 00:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reports", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="report",
+            index=models.Index(
+                fields=["status", "-created_at"], name="report_queue_idx"
+            ),
+        ),
+    ]
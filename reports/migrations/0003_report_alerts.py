@@ -0,0 +1,33 @@
+# Generated by Django 4.2.19 on 2026-10-19 00:19
+
+from django.db import migrations, models
+
+
+def mark_existing_reports_alerted(apps, schema_editor):
+    # Staff were already notified about these when they were submitted.
+    Report = apps.get_model("reports", "Report")
+    Report.objects.update(alerted_at=models.F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reports", "0002_report_queue_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="report",
+            name="alerted_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(mark_existing_reports_alerted, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="report",
+            index=models.Index(
+                condition=models.Q(("alerted_at__isnull", True)),
+                fields=["id"],
+                name="report_unalerted_idx",
+            ),
+        ),
+    ]
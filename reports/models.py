@@ -1,7 +1,12 @@
-from django.db import models
+from collections import Counter, defaultdict
+
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
+from django.utils import timezone
+from accounts.models import Notification
 
 User = get_user_model()
 
@@ -44,6 +49,101 @@ class Report(models.Model):
         blank=True,
         related_name="resolved_reports",
     )
+    # Set once staff have been alerted about the report by send_report_alerts.
+    alerted_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Moderation queue: reports in a status, newest first.
+            models.Index(fields=["status", "-created_at"], name="report_queue_idx"),
+            # Reports still waiting for the next staff alert digest.
+            models.Index(
+                fields=["id"],
+                name="report_unalerted_idx",
+                condition=Q(alerted_at__isnull=True),
+            ),
+        ]
 
     def __str__(self):
         return f"Report #{self.id} - {self.get_report_type_display()} - {self.status}"
+
+
+def resolve_reported_objects(reports):
+    """
+    Load the reported objects of ``reports`` with one ``in_bulk`` query per
+    content type and cache them on each report, so ``report.reported_object``
+    needs no further query. Reports whose object was deleted get None.
+    """
+    reports = list(reports)
+    object_ids = defaultdict(set)
+    for report in reports:
+        object_ids[report.content_type_id].add(report.object_id)
+    targets = {}
+    for content_type_id, ids in object_ids.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        if model is not None:
+            targets[content_type_id] = model._default_manager.in_bulk(ids)
+    field = Report._meta.get_field("reported_object")
+    for report in reports:
+        target = targets.get(report.content_type_id, {}).get(report.object_id)
+        field.set_cached_value(report, target)
+    return reports
+
+
+def report_alert_digest(reports):
+    """Subject and content of the staff notification about ``reports``."""
+    if len(reports) == 1:
+        report = reports[0]
+        subject = f"New Report: {report.get_report_type_display()}"
+        return subject, (
+            f"A new {report.get_report_type_display().lower()} report has been "
+            f"submitted for a {report.content_type.model}. Please review it."
+        )
+    by_type = Counter(report.get_report_type_display() for report in reports)
+    by_content = Counter(report.content_type.model for report in reports)
+    lines = [f"{len(reports)} new reports have been submitted. Please review them."]
+    lines += [f"- {label}: {total}" for label, total in by_type.most_common()]
+    lines.append(
+        "Reported: "
+        + ", ".join(f"{total} {model}" for model, total in by_content.most_common())
+    )
+    return f"New Reports: {len(reports)} awaiting review", "\n".join(lines)
+
+
+def send_report_alerts():
+    """
+    Send every active staff user one digest notification about the reports
+    submitted since the last run, and mark those reports as alerted.
+    Returns the number of reports covered.
+
+    Run periodically, so a burst of reports results in one notification per
+    staff user per run instead of one per report.
+    """
+    with transaction.atomic():
+        reports = list(
+            Report.objects.filter(alerted_at=None)
+            .select_related("content_type")
+            .select_for_update(skip_locked=True, of=("self",))
+            .order_by("pk")
+        )
+        if not reports:
+            return 0
+        subject, content = report_alert_digest(reports)
+        staff_ids = User.objects.filter(is_staff=True, is_active=True).values_list(
+            "pk", flat=True
+        )
+        Notification.objects.bulk_create(
+            [
+                Notification(
+                    recipient_id=staff_id,
+                    subject=subject,
+                    content=content,
+                    notification_type="REPORT",
+                )
+                for staff_id in staff_ids
+            ]
+        )
+        Report.objects.filter(pk__in=[report.pk for report in reports]).update(
+            alerted_at=timezone.now()
+        )
+    return len(reports)
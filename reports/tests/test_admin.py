@@ -1,4 +1,7 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 from django.contrib.admin.sites import AdminSite
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
@@ -42,7 +45,15 @@ class ReportAdminTest(TestCase):
         """Test that the list_display attribute is correctly set up"""
         self.assertEqual(
             list(self.admin.list_display),
-            ["id", "report_type", "reporter", "content_type", "status", "created_at"],
+            [
+                "id",
+                "report_type",
+                "reporter",
+                "content_type",
+                "reported_object_summary",
+                "status",
+                "created_at",
+            ],
         )
 
     def test_list_filter(self):
@@ -154,3 +165,25 @@ class ReportAdminTest(TestCase):
 
         # Check that resolved_by is still None
         self.assertIsNone(self.report.resolved_by)
+
+    def test_changelist_resolves_reported_objects_in_bulk(self):
+        """The changelist query count does not grow with the number of reports"""
+        self.admin_user.is_superuser = True
+        self.admin_user.save()
+        self.client.force_login(self.admin_user)
+        url = reverse("admin:reports_report_changelist")
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(url)
+        for i in range(5):
+            target = User.objects.create_user(username=f"target{i}")
+            Report.objects.create(
+                reporter=self.reporter,
+                content_type=self.content_type,
+                object_id=target.id,
+                report_type="SPAM",
+                description="Spam account",
+            )
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(large), len(small))
@@ -1,7 +1,11 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
-from reports.models import Report
+from io import StringIO
+
+from django.core.management import call_command
+from accounts.models import Notification
+from reports.models import Report, resolve_reported_objects, send_report_alerts
 
 User = get_user_model()
 
@@ -65,3 +69,118 @@ class ReportModelTest(TestCase):
             self.report.status = choice_key
             self.report.save()
             self.assertEqual(self.report.status, choice_key)
+
+
+class ResolveReportedObjectsTest(TestCase):
+    def setUp(self):
+        self.reporter = User.objects.create_user(
+            username="reporter", email="reporter@example.com", password="password123"
+        )
+        self.targets = [
+            User.objects.create_user(username=f"target{i}", password="password123")
+            for i in range(3)
+        ]
+        user_type = ContentType.objects.get_for_model(User)
+        report_type = ContentType.objects.get_for_model(Report)
+        self.reports = [
+            Report.objects.create(
+                reporter=self.reporter,
+                content_type=user_type,
+                object_id=target.pk,
+                report_type="SPAM",
+                description="Spam account",
+            )
+            for target in self.targets
+        ]
+        # A report about another report, to mix content types.
+        self.reports.append(
+            Report.objects.create(
+                reporter=self.reporter,
+                content_type=report_type,
+                object_id=self.reports[0].pk,
+                report_type="OTHER",
+                description="Bogus report",
+            )
+        )
+
+    def test_one_query_per_content_type(self):
+        reports = list(Report.objects.order_by("pk"))
+        with self.assertNumQueries(2):
+            resolve_reported_objects(reports)
+            resolved = [report.reported_object for report in reports]
+        self.assertEqual(resolved[:3], self.targets)
+        self.assertEqual(resolved[3], self.reports[0])
+
+    def test_deleted_object_resolves_to_none(self):
+        self.targets[1].delete()
+        reports = resolve_reported_objects(Report.objects.order_by("pk"))
+        with self.assertNumQueries(0):
+            self.assertIsNone(reports[1].reported_object)
+            self.assertEqual(reports[0].reported_object, self.targets[0])
+
+
+class SendReportAlertsTest(TestCase):
+    def setUp(self):
+        self.reporter = User.objects.create_user(
+            username="reporter", email="reporter@example.com", password="password123"
+        )
+        self.staff = [
+            User.objects.create_user(username=f"staff{i}", is_staff=True)
+            for i in range(2)
+        ]
+        User.objects.create_user(username="retired", is_staff=True, is_active=False)
+        self.content_type = ContentType.objects.get_for_model(User)
+
+    def report(self, report_type="SPAM"):
+        return Report.objects.create(
+            reporter=self.reporter,
+            content_type=self.content_type,
+            object_id=self.reporter.pk,
+            report_type=report_type,
+            description="Report",
+        )
+
+    def test_single_report_alert(self):
+        self.report()
+        self.assertEqual(send_report_alerts(), 1)
+        notifications = Notification.objects.filter(notification_type="REPORT")
+        self.assertEqual(
+            sorted(notifications.values_list("recipient", flat=True)),
+            [user.pk for user in self.staff],
+        )
+        self.assertEqual(notifications.first().subject, "New Report: Spam")
+
+    def test_burst_is_coalesced_into_one_digest_per_staff_user(self):
+        for report_type in ("SPAM", "SPAM", "FRAUD"):
+            self.report(report_type)
+        self.assertEqual(send_report_alerts(), 3)
+
+        notifications = Notification.objects.filter(recipient=self.staff[0])
+        self.assertEqual(notifications.count(), 1)
+        digest = notifications.get()
+        self.assertEqual(digest.subject, "New Reports: 3 awaiting review")
+        self.assertIn("- Spam: 2", digest.content)
+        self.assertIn("- Fraudulent Activity: 1", digest.content)
+        self.assertIn("3 user", digest.content)
+        self.assertFalse(Report.objects.filter(alerted_at=None).exists())
+
+    def test_reports_are_only_alerted_once(self):
+        self.report()
+        send_report_alerts()
+        self.assertEqual(send_report_alerts(), 0)
+        self.report("FRAUD")
+        self.assertEqual(send_report_alerts(), 1)
+        self.assertEqual(
+            list(
+                Notification.objects.filter(recipient=self.staff[0])
+                .order_by("pk")
+                .values_list("subject", flat=True)
+            ),
+            ["New Report: Spam", "New Report: Fraudulent Activity"],
+        )
+
+    def test_command(self):
+        self.report()
+        out = StringIO()
+        call_command("send_report_alerts", stdout=out)
+        self.assertIn("Sent staff alerts for 1 reports.", out.getvalue())
@@ -1,12 +1,15 @@
+from django.db import connection
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
-from reports.models import Report
+from reports.models import Report, send_report_alerts
 from messaging.models import Message
 from listings.models import Listing, Review
 from booking.models import Booking
 from accounts.models import Notification
+from reports.views import REPORTS_PER_PAGE
 
 
 class ReportItemViewTest(TestCase):
@@ -150,11 +153,13 @@ class ReportItemViewTest(TestCase):
         self.assertEqual(report.object_id, self.listing.id)
         self.assertEqual(report.report_type, "MISLEADING")
 
-        # Check admin notification
-        admin_notification = Notification.objects.filter(
+        # Admins are alerted by the next digest, not during the request
+        admin_notifications = Notification.objects.filter(
             recipient=self.admin_user, subject__startswith="New Report:"
-        ).first()
-        self.assertIsNotNone(admin_notification)
+        )
+        self.assertFalse(admin_notifications.exists())
+        send_report_alerts()
+        self.assertEqual(admin_notifications.count(), 1)
 
     def test_report_nonexistent_object(self):
         """Test handling of reports for objects that don't exist"""
@@ -248,11 +253,13 @@ class ReportItemViewTest(TestCase):
         self.assertEqual(report.reporter, self.parker)
         self.assertEqual(report.object_id, review.id)
 
-        # Check admin notification
-        admin_notification = Notification.objects.filter(
+        # Admins are alerted by the next digest, not during the request
+        admin_notifications = Notification.objects.filter(
             recipient=self.admin_user, subject__startswith="New Report:"
-        ).first()
-        self.assertIsNotNone(admin_notification)
+        )
+        self.assertFalse(admin_notifications.exists())
+        send_report_alerts()
+        self.assertEqual(admin_notifications.count(), 1)
 
     def test_report_form_invalid(self):
         """Test submitting an invalid report form"""
@@ -447,6 +454,48 @@ class AdminReportsViewTest(TestCase):
         self.assertEqual(response.context["status_counts"]["DISMISSED"], 1)
         self.assertEqual(response.context["status_counts"]["ALL"], 4)
 
+    def test_admin_reports_query_count_independent_of_report_count(self):
+        """Reported objects are batch-loaded instead of one query per row"""
+        self.client.login(username="admin", password="adminpass")
+        url = f"{self.admin_reports_url}?status=ALL"
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(url)
+        for i in range(10):
+            Report.objects.create(
+                reporter=self.regular_user,
+                content_type=self.listing_content_type,
+                object_id=self.listing.id,
+                report_type="SPAM",
+                description=f"Extra report {i}",
+            )
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.get(url)
+        self.assertEqual(len(large), len(small))
+        self.assertContains(response, "Test Listing")
+        self.assertContains(response, "Test Message")
+
+    def test_admin_reports_view_paginates(self):
+        """The queue is split into pages that keep the status filter"""
+        Report.objects.bulk_create(
+            Report(
+                reporter=self.regular_user,
+                content_type=self.listing_content_type,
+                object_id=self.listing.id,
+                report_type="SPAM",
+                description=f"Extra report {i}",
+            )
+            for i in range(REPORTS_PER_PAGE)
+        )
+        self.client.login(username="admin", password="adminpass")
+
+        response = self.client.get(self.admin_reports_url)
+        self.assertEqual(len(response.context["reports"]), REPORTS_PER_PAGE)
+        self.assertContains(response, "?status=PENDING&page=2")
+        self.assertEqual(response.context["status_counts"]["PENDING"], 26)
+
+        response = self.client.get(f"{self.admin_reports_url}?page=2")
+        self.assertEqual(len(response.context["reports"]), 1)
+
     def test_admin_report_detail_view_requires_admin(self):
         """Test that only admins can access the report detail page"""
         # Unauthenticated user should be redirected to login
@@ -472,6 +521,15 @@ class AdminReportsViewTest(TestCase):
         self.assertEqual(response.context["reported_object"], self.message)
         self.assertEqual(response.context["object_type"], "message")
 
+    def test_admin_report_detail_deleted_object(self):
+        """A report whose object was deleted still opens"""
+        self.message.delete()
+        self.client.login(username="admin", password="adminpass")
+        response = self.client.get(self.report_detail_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.context["reported_object"])
+        self.assertEqual(response.context["object_type"], "unknown")
+
     def test_admin_report_detail_view_update_status(self):
         """Test updating the status of a report"""
         self.client.login(username="admin", password="adminpass")
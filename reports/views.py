@@ -1,13 +1,19 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib.contenttypes.models import ContentType
+from django.core.paginator import Paginator
+from django.db.models import Count
 from django.http import HttpResponseForbidden
 from .forms import ReportForm
 from messaging.models import Message
 from listings.models import Listing, Review
-from .models import Report
+from .models import Report, resolve_reported_objects
 from accounts.models import Notification
-from django.contrib.auth.models import User
+
+REPORTS_PER_PAGE = 25
+
+# Content types the report detail page knows how to display.
+REVIEWABLE_TYPES = ("message", "listing", "review")
 
 
 @login_required
@@ -67,17 +73,7 @@ def report_item(request, content_type_str, object_id):
                 "Thank you for your report. Our team will review it shortly."
             )
 
-            # Notify admins about the new report
-            admins = User.objects.filter(is_staff=True)
-            for admin in admins:
-                Notification.objects.create(
-                    sender=request.user,
-                    recipient=admin,
-                    subject=f"New Report: {report.get_report_type_display()}",
-                    content=f"""A new {report.get_report_type_display().lower()} report has been submitted for a
-                            {content_type_str}. Please review it.""",
-                    notification_type="ADMIN_ALERT",
-                )
+            # Staff are alerted in the next send_report_alerts digest.
 
             # Redirect based on content type
             if content_type_str == "message":
@@ -112,7 +108,9 @@ def admin_reports(request):
     report_type = request.GET.get("type", None)
 
     # Base query
-    reports_query = Report.objects.all()
+    reports_query = Report.objects.select_related(
+        "reporter", "content_type", "resolved_by"
+    )
 
     # Apply filters
     if status_filter and status_filter != "ALL":
@@ -122,22 +120,25 @@ def admin_reports(request):
         reports_query = reports_query.filter(report_type=report_type)
 
     # Order by creation date (newest first)
-    reports = reports_query.order_by("-created_at")
-
-    # Count by status for filter UI
-    status_counts = {
-        "PENDING": Report.objects.filter(status="PENDING").count(),
-        "REVIEWING": Report.objects.filter(status="REVIEWING").count(),
-        "RESOLVED": Report.objects.filter(status="RESOLVED").count(),
-        "DISMISSED": Report.objects.filter(status="DISMISSED").count(),
-        "ALL": Report.objects.count(),
-    }
+    reports_query = reports_query.order_by("-created_at", "-id")
+    page_obj = Paginator(reports_query, REPORTS_PER_PAGE).get_page(
+        request.GET.get("page")
+    )
+    # Load the reported objects with one query per content type.
+    reports = resolve_reported_objects(page_obj)
+
+    # Count by status for filter UI, in a single GROUP BY query
+    status_counts = dict.fromkeys([status for status, _ in Report.STATUS_CHOICES], 0)
+    for row in Report.objects.order_by().values("status").annotate(total=Count("id")):
+        status_counts[row["status"]] = row["total"]
+    status_counts["ALL"] = sum(status_counts.values())
 
     return render(
         request,
         "reports/admin_reports.html",
         {
             "reports": reports,
+            "page_obj": page_obj,
             "current_status": status_filter,
             "current_type": report_type or "ALL",
             "status_counts": status_counts,
@@ -154,18 +155,14 @@ def admin_report_detail(request, report_id):
         return HttpResponseForbidden("You do not have permission to handle reports.")
 
     # Get the report
-    report = get_object_or_404(Report, pk=report_id)
-
-    if report.content_type.model == "message":
-        reported_object = Message.objects.get(id=report.object_id)
-        object_type = "message"
-    elif report.content_type.model == "listing":
-        reported_object = Listing.objects.get(id=report.object_id)
-        object_type = "listing"
-    elif report.content_type.model == "review":
-        reported_object = Review.objects.get(id=report.object_id)
-        object_type = "review"
-    else:
+    report = get_object_or_404(
+        Report.objects.select_related("reporter", "content_type"), pk=report_id
+    )
+
+    resolve_reported_objects([report])
+    reported_object = report.reported_object
+    object_type = report.content_type.model
+    if reported_object is None or object_type not in REVIEWABLE_TYPES:
         reported_object = None
         object_type = "unknown"
 